@@ -0,0 +1,110 @@
+import math
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable
+
+from src.Maze import MazeConfig
+
+
+class BenchmarkCase:
+    """
+    One measured operation. `prepare` builds input of operation for given maze config (it is not measured),
+    `run` performs operation with this input.
+    """
+
+    name: str
+    prepare: Callable[[MazeConfig], Any]
+    run: Callable[[Any], Any]
+
+    def __init__(self, name: str, prepare: Callable[[MazeConfig], Any], run: Callable[[Any], Any]):
+        self.name = name
+        self.prepare = prepare
+        self.run = run
+
+
+class Benchmark:
+    """
+    Measures time and peak memory of cases over a ladder of square maze sizes.
+    Time is the best of `repeat` runs. Peak memory is measured by tracemalloc in one more run,
+    because tracing allocations slows code down.
+    """
+
+    cases: list[BenchmarkCase]
+    sizes: list[int]
+    repeat: int
+
+    def __init__(self, cases: list[BenchmarkCase], sizes: list[int], repeat: int = 3):
+        self.cases = cases
+        self.sizes = sizes
+        self.repeat = repeat
+
+    def measure(self, case: BenchmarkCase, cells: int) -> dict:
+        """Measures one case on square maze with about given count of cells."""
+        side = max(1, math.isqrt(cells))
+        config = MazeConfig(side, side)
+        argument = case.prepare(config)
+
+        times = []
+        for _ in range(self.repeat):
+            started = time.perf_counter()
+            case.run(argument)
+            times.append(time.perf_counter() - started)
+
+        tracemalloc.start()
+        try:
+            case.run(argument)
+            _, peak_memory = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        seconds = min(times)
+
+        return {
+            "case": case.name,
+            "width": side,
+            "height": side,
+            "cells": side * side,
+            "seconds": seconds,
+            "cells_per_second": side * side / seconds if seconds > 0 else None,
+            "peak_memory": peak_memory
+        }
+
+    def run(self) -> list[dict]:
+        """Measures all cases on all sizes. Progress is printed into stderr."""
+        results = []
+
+        for cells in self.sizes:
+            for case in self.cases:
+                print(f"{case.name} on {cells} cells...", file=sys.stderr, flush=True)
+                results.append(self.measure(case, cells))
+
+        return results
+
+    @staticmethod
+    def compare(results: list[dict], baseline: list[dict], tolerance: float) -> list[dict]:
+        """
+        Returns measurements that are slower than the same measurement in baseline
+        by more than given fraction (for example, 0.25 means 25% slower).
+        """
+        baseline_seconds = {(result["case"], result["cells"]): result["seconds"] for result in baseline}
+        regressions = []
+
+        for result in results:
+            previous = baseline_seconds.get((result["case"], result["cells"]))
+
+            if previous is None or previous <= 0:
+                continue
+
+            ratio = result["seconds"] / previous
+
+            if ratio > 1 + tolerance:
+                regressions.append({
+                    "case": result["case"],
+                    "cells": result["cells"],
+                    "seconds": result["seconds"],
+                    "baseline_seconds": previous,
+                    "ratio": ratio
+                })
+
+        return regressions
@@ -0,0 +1,190 @@
+from typing import Callable, Iterable, Iterator, Union
+
+
+class BitArray:
+    """
+    Compact array of boolean values. Each value occupies exactly one bit of underlying buffer,
+    so it takes 8 times less memory than bytes and ~64 times less memory than list[bool].
+    Bit with index `i` is stored in byte `i // 8` at position `i % 8` (least significant bit first).
+    Unused bits of the last byte are always zero, so two arrays can be compared byte by byte.
+    """
+
+    data: Union[bytearray, memoryview]
+    length: int
+
+    def __init__(self, length: int = 0, value: bool = False):
+        self.length = length
+        self.data = bytearray(b"\xff" if value else b"\x00") * self.get_bytes_count(length)
+        self.__clear_padding()
+
+    @staticmethod
+    def get_bytes_count(length: int) -> int:
+        """Returns count of bytes required to store given count of bits."""
+        return (length + 7) >> 3
+
+    @staticmethod
+    def from_bools(values: Iterable[bool]) -> 'BitArray':
+        """Creates bit array from any iterable of booleans."""
+        result = BitArray()
+        byte = 0
+
+        for bit in values:
+            if bit:
+                byte |= 1 << (result.length & 7)
+
+            result.length += 1
+
+            if result.length & 7 == 0:
+                result.data.append(byte)
+                byte = 0
+
+        if result.length & 7 != 0:
+            result.data.append(byte)
+
+        return result
+
+    @staticmethod
+    def from_bytes(data, length: int) -> 'BitArray':
+        """
+        Creates bit array that uses given buffer as storage. Buffer is not copied,
+        so it may be a memoryview over memory-mapped file.
+        """
+        if len(data) != BitArray.get_bytes_count(length):
+            raise ValueError("Buffer size doesn't match bits count.")
+
+        result = BitArray()
+        result.length = length
+        result.data = data
+
+        if length % 8 != 0 and data[-1] >> (length % 8) != 0:
+            raise ValueError("Unused bits of the last byte must be zero.")
+
+        return result
+
+    def to_bytes(self) -> bytes:
+        """Returns packed content of this array."""
+        return bytes(self.data)
+
+    def get_bits(self, start: int, count: int) -> int:
+        """Returns `count` bits starting from `start` as integer (bit `start` is the least significant one)."""
+        if count <= 0:
+            return 0
+
+        first_byte = start >> 3
+        last_byte = (start + count + 7) >> 3
+        value = int.from_bytes(self.data[first_byte:last_byte], "little")
+
+        return (value >> (start & 7)) & ((1 << count) - 1)
+
+    def set_bits(self, start: int, count: int, value: int):
+        """Replaces `count` bits starting from `start` with bits of given integer."""
+        if count <= 0:
+            return
+
+        first_byte = start >> 3
+        last_byte = (start + count + 7) >> 3
+        bytes_count = last_byte - first_byte
+
+        shift = start & 7
+        mask = ((1 << count) - 1) << shift
+
+        current = int.from_bytes(self.data[first_byte:last_byte], "little")
+        current = (current & ~mask) | ((value << shift) & mask)
+
+        self.data[first_byte:last_byte] = current.to_bytes(bytes_count, "little")
+
+    def fill(self, value: bool):
+        """Sets all bits to given value."""
+        self.data[:] = (b"\xff" if value else b"\x00") * len(self.data)
+        self.__clear_padding()
+
+    def count(self, value: bool = True) -> int:
+        """Returns count of bits that are equal to given value."""
+        ones = int.from_bytes(self.data, "little").bit_count()
+        return ones if value else self.length - ones
+
+    def __clear_padding(self):
+        if self.length % 8 != 0:
+            self.data[-1] &= (1 << (self.length % 8)) - 1
+
+    def __normalize_index(self, index: int) -> int:
+        if index < 0:
+            index += self.length
+
+        if not 0 <= index < self.length:
+            raise IndexError("BitArray index out of range")
+
+        return index
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __getitem__(self, index: int) -> bool:
+        index = self.__normalize_index(index)
+        return (self.data[index >> 3] >> (index & 7)) & 1 == 1
+
+    def __setitem__(self, index: int, value: bool):
+        index = self.__normalize_index(index)
+
+        if value:
+            self.data[index >> 3] |= 1 << (index & 7)
+        else:
+            self.data[index >> 3] &= ~(1 << (index & 7)) & 0xFF
+
+    def __iter__(self) -> Iterator[bool]:
+        for byte_index in range(len(self.data)):
+            byte = self.data[byte_index]
+            bits_count = min(8, self.length - (byte_index << 3))
+
+            for bit in range(bits_count):
+                yield (byte >> bit) & 1 == 1
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, BitArray):
+            return self.length == other.length and self.data == other.data
+
+        if isinstance(other, list):
+            return list(self) == other
+
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"BitArray(length={self.length})"
+
+
+class BitWriter:
+    """
+    Accumulates bits written one group after another and passes complete bytes to given callback.
+    Bits are packed in the same order as in BitArray, so written bytes form valid BitArray data.
+    """
+
+    sink: Callable[[bytes], None]
+    value: int
+    count: int
+
+    def __init__(self, sink: Callable[[bytes], None]):
+        self.sink = sink
+        self.value = 0
+        self.count = 0
+
+    def write(self, value: int, count: int):
+        """Appends `count` lower bits of given integer."""
+        value = self.value | ((value & ((1 << count) - 1)) << self.count)
+        count += self.count
+
+        complete = count >> 3
+        if complete != 0:
+            self.sink(value.to_bytes(complete + 1, "little")[:complete])
+            value >>= complete << 3
+            count &= 7
+
+        self.value = value
+        self.count = count
+
+    def close(self):
+        """Passes remaining bits padded with zeros as the last byte."""
+        if self.count != 0:
+            self.sink(bytes([self.value]))
+
+        self.value = 0
+        self.count = 0
@@ -0,0 +1,46 @@
+class DisjointSet:
+    """
+    Disjoint set union (union-find) over integers from 0 to `size - 1`.
+    It uses path compression and union by size, so each operation takes almost constant time.
+    """
+
+    parent: list[int]
+    sizes: list[int]
+
+    def __init__(self, size: int):
+        self.parent = list(range(size))
+        self.sizes = [1] * size
+
+    def find(self, element: int) -> int:
+        """Returns representative of the set that contains given element."""
+        parent = self.parent
+
+        root = element
+        while parent[root] != root:
+            root = parent[root]
+
+        # path compression: every element on the path now points directly to the root
+        while parent[element] != root:
+            parent[element], element = root, parent[element]
+
+        return root
+
+    def union(self, first: int, second: int) -> bool:
+        """Merges sets that contain given elements. Returns False if they are already in the same set."""
+        first = self.find(first)
+        second = self.find(second)
+
+        if first == second:
+            return False
+
+        if self.sizes[first] < self.sizes[second]:
+            first, second = second, first
+
+        self.parent[second] = first
+        self.sizes[first] += self.sizes[second]
+
+        return True
+
+    def is_same_set(self, first: int, second: int) -> bool:
+        """Checks if given elements are in the same set."""
+        return self.find(first) == self.find(second)
@@ -0,0 +1,96 @@
+import os
+import tempfile
+from typing import Callable, Optional
+
+
+class DiskCache:
+    """
+    Stores files in a directory under string keys. Total size of stored files is bounded:
+    when it exceeds `max_size`, least recently used files are removed.
+    Usage time of file is tracked by its modification time, which is updated on each access.
+    """
+
+    directory: str
+    max_size: int
+    suffix: str
+
+    def __init__(self, directory: str, max_size: int, suffix: str = ""):
+        self.directory = directory
+        self.max_size = max_size
+        self.suffix = suffix
+
+    @staticmethod
+    def get_default_directory(name: str) -> str:
+        """Returns directory for cache with given name inside user cache directory."""
+        root = os.environ.get("XDG_CACHE_HOME", os.path.join(os.path.expanduser("~"), ".cache"))
+        return os.path.join(root, "maze-app", name)
+
+    def get_path(self, key: str) -> str:
+        """Returns path of file that is stored under given key (file may not exist)."""
+        return os.path.join(self.directory, key + self.suffix)
+
+    def get(self, key: str) -> Optional[str]:
+        """Returns path of stored file or None if there is no file for given key."""
+        path = self.get_path(key)
+
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+
+        return path
+
+    def remove(self, key: str):
+        """Removes file stored under given key if it exists."""
+        try:
+            os.remove(self.get_path(key))
+        except FileNotFoundError:
+            pass
+
+    def store(self, key: str, write: Callable[[str], None]) -> str:
+        """
+        Stores file under given key. File is created by `write` callback that receives path to write into.
+        File is written into temporary location first, so partially written files are never visible.
+        """
+        os.makedirs(self.directory, exist_ok=True)
+
+        descriptor, temporary_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        os.close(descriptor)
+
+        try:
+            write(temporary_path)
+            os.replace(temporary_path, self.get_path(key))
+        except BaseException:
+            os.remove(temporary_path)
+            raise
+
+        self.evict(keep=key)
+
+        return self.get_path(key)
+
+    def evict(self, keep: Optional[str] = None):
+        """Removes least recently used files until total size fits into limit. File with key `keep` is kept."""
+        entries = []
+
+        with os.scandir(self.directory) as iterator:
+            for entry in iterator:
+                if entry.is_file() and entry.name.endswith(self.suffix) and not entry.name.endswith(".tmp"):
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+
+        total_size = sum(size for _, size, _ in entries)
+        entries.sort()
+
+        for _, size, path in entries:
+            if total_size <= self.max_size:
+                break
+
+            if keep is not None and path == self.get_path(keep):
+                continue
+
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+            total_size -= size
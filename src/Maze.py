@@ -1,5 +1,10 @@
+import hashlib
+import struct
 from enum import Enum
 from copy import copy
+from typing import Iterable, Iterator, Optional, Union
+
+from src.BitArray import BitArray
 
 
 class MazeConfig:
@@ -101,15 +106,27 @@ class Direction(Enum):
 class Maze:
     """
     Represents a thin maze. 'Thin' means that walls located between cells.
+    Walls are stored in BitArray, so each wall takes exactly one bit of memory.
     """
 
-    # walls between cells
-    walls: list[bool]
     config: MazeConfig
 
-    def __init__(self, config: MazeConfig):
+    def __init__(self, config: MazeConfig, walls: Optional[BitArray] = None):
+        """Creates maze with given walls. If walls are not provided, maze is created with all walls present."""
         self.config = config
-        self.walls = [True] * self.get_walls_count()
+        self.__walls = walls if walls is not None else BitArray(self.get_walls_count(), True)
+
+    @property
+    def walls(self) -> BitArray:
+        """Walls between cells. Each wall is represented by one bit."""
+        return self.__walls
+
+    @walls.setter
+    def walls(self, walls: Union[BitArray, Iterable[bool]]):
+        if not isinstance(walls, BitArray):
+            walls = BitArray.from_bools(walls)
+
+        self.__walls = walls
 
     def is_correct(self) -> bool:
         """Checks if class internal structure is valid."""
@@ -158,6 +175,65 @@ class Maze:
         """Check if given MazePosition is located inside maze."""
         return 0 <= position.x < self.config.width and 0 <= position.y < self.config.height
 
+    def get_row_stride(self) -> int:
+        """
+        Returns difference between indices of the same walls in two neighboring rows.
+        Walls of row `y` start at index `y * stride`: first `width - 1` walls to the right of cells
+        and then `width` walls below cells (the last row has no walls below it).
+        """
+        return 2 * self.config.width - 1
+
+    def get_row_walls_count(self, y: int) -> int:
+        """Returns count of walls that belong to row `y` (see `get_row_stride`)."""
+        if y == self.config.height - 1:
+            return self.config.width - 1
+
+        return self.get_row_stride()
+
+    def get_row_walls(self, y: int) -> int:
+        """Returns walls of row `y` as integer: wall with index `y * stride + i` is stored in bit `i`."""
+        return self.walls.get_bits(y * self.get_row_stride(), self.get_row_walls_count(y))
+
+    def set_row_walls(self, y: int, walls: int):
+        """Replaces walls of row `y` with bits of given integer (see `get_row_walls`)."""
+        self.walls.set_bits(y * self.get_row_stride(), self.get_row_walls_count(y), walls)
+
+    def crop(self, x0: int, y0: int, x1: int, y1: int) -> 'Maze':
+        """
+        Returns new maze that consists of cells from region [x0, x1) x [y0, y1) of this maze.
+        Walls between region cells are copied, walls on the region border become outer walls.
+        """
+        if not (0 <= x0 < x1 <= self.config.width and 0 <= y0 < y1 <= self.config.height):
+            raise ValueError("Region must be non-empty and located inside maze.")
+
+        region = Maze(MazeConfig(x1 - x0, y1 - y0))
+
+        stride = self.get_row_stride()
+        region_stride = region.get_row_stride()
+
+        for y in range(y0, y1):
+            source = y * stride + x0
+            target = (y - y0) * region_stride
+
+            region.walls.set_bits(target, x1 - x0 - 1, self.walls.get_bits(source, x1 - x0 - 1))
+
+            if y != y1 - 1:
+                source += self.config.width - 1
+                target += region.config.width - 1
+                region.walls.set_bits(target, x1 - x0, self.walls.get_bits(source, x1 - x0))
+
+        return region
+
+    def get_content_hash(self) -> str:
+        """
+        Returns hash of maze dimensions and walls.
+        Equal mazes have equal hashes regardless of how they are stored (in memory or mapped from file).
+        """
+        content = hashlib.sha256(struct.pack("<QQ", self.config.width, self.config.height))
+        content.update(self.walls.data)
+
+        return content.hexdigest()
+
     def __eq__(self, other: 'Maze') -> bool:
         """Compare two mazes for equality."""
         if self.config.width != other.config.width or self.config.height != other.config.height:
@@ -178,14 +254,68 @@ class ThickMaze:
     Represents thick maze. 'Thick' means that walls are also represented by cells.
     ThickMazeCellType exists for storing type of cell. It can be empty or wall might be in it.
     Also, there is a PATH maze cell type that is only used for solution drawing in this type of maze.
+    Cells are stored row by row in bytearray, one byte with ThickMazeCellType value per cell.
     """
-    maze: list[list[ThickMazeCellType]]
+    cells: bytearray
     config: MazeConfig
 
+    # translates string of bits into bytes with values of ThickMazeCellType
+    __bits_table = bytes.maketrans(b"01", bytes([ThickMazeCellType.EMPTY.value, ThickMazeCellType.WALL.value]))
+
     def __init__(self, config: MazeConfig):
         self.config = config
 
-        self.maze = [[ThickMazeCellType.EMPTY] * config.height for _ in range(config.width)]
+        self.cells = bytearray([ThickMazeCellType.EMPTY.value]) * (config.width * config.height)
+
+    def get_cell(self, x: int, y: int) -> ThickMazeCellType:
+        """Returns type of cell (x, y)."""
+        return ThickMazeCellType(self.cells[x + y * self.config.width])
+
+    def set_cell(self, x: int, y: int, cell_type: ThickMazeCellType):
+        """Changes type of cell (x, y)."""
+        self.cells[x + y * self.config.width] = cell_type.value
+
+    def get_row(self, y: int) -> bytearray:
+        """Returns copy of cells of row `y`."""
+        return self.cells[y * self.config.width:(y + 1) * self.config.width]
+
+    @staticmethod
+    def __get_cells(walls: int, count: int) -> bytes:
+        """Converts lower `count` bits of walls into cells: bit `i` becomes byte `i`."""
+        if count == 0:
+            return b""
+
+        return format(walls, f"0{count}b")[::-1].encode().translate(ThickMaze.__bits_table)
+
+    @staticmethod
+    def generate_rows(thin_maze: Maze) -> Iterator[bytearray]:
+        """
+        Yields rows of thick maze built from thin maze. Each row is built from walls of one thin row
+        with slice assignments, so it takes linear time without per-cell Python code.
+        """
+        width = thin_maze.config.width
+        wall = ThickMazeCellType.WALL.value
+
+        # points between cells are always walls
+        border = bytearray([wall]) * (2 * width + 1)
+        yield border[:]
+
+        for y in range(thin_maze.config.height):
+            walls = ThickMaze.__get_cells(thin_maze.get_row_walls(y), thin_maze.get_row_walls_count(y))
+
+            # cells and walls to the left and to the right of them
+            row = bytearray(2 * width + 1)
+            row[0] = row[-1] = wall
+            row[2:-1:2] = walls[:width - 1]
+            yield row
+
+            if y != thin_maze.config.height - 1:
+                # walls below cells
+                row = border[:]
+                row[1::2] = walls[width - 1:]
+                yield row
+
+        yield border[:]
 
     @staticmethod
     def from_thin_maze(thin_maze: Maze):
@@ -194,19 +324,6 @@ class ThickMaze:
         height = thin_maze.config.height * 2 + 1
 
         thick_maze = ThickMaze(MazeConfig(width, height))
-
-        for x in range(width):
-            for y in range(height):
-                has_wall = False
-
-                if x % 2 == y % 2:
-                    has_wall = x % 2 == 0
-                elif x % 2 == 0:
-                    has_wall = thin_maze.has_wall(MazePosition(x // 2 - 1, y // 2), Direction.RIGHT)
-                elif y % 2 == 0:
-                    has_wall = thin_maze.has_wall(MazePosition(x // 2, y // 2 - 1), Direction.DOWN)
-
-                if has_wall:
-                    thick_maze.maze[x][y] = ThickMazeCellType.WALL
+        thick_maze.cells = bytearray(b"".join(ThickMaze.generate_rows(thin_maze)))
 
         return thick_maze
@@ -0,0 +1,117 @@
+from collections import Counter
+
+import numpy as np
+
+from src.Maze import Maze, MazePosition, Direction
+from src.MazeArrays import MazeArrays
+from src.solvers.MazeSolver import MazeSolver
+
+
+class MazeAnalyzer:
+    """
+    Computes metrics of maze in a constant count of linear passes:
+    two BFS sweeps (from the top left corner and from the cell farthest from it),
+    one walk along corridors and a few array operations.
+    """
+
+    maze: Maze
+
+    def __init__(self, maze: Maze):
+        self.maze = maze
+
+    def get_distances(self, source: MazePosition) -> np.ndarray:
+        """
+        Returns array of shape (height, width) with length of the shortest path from source to each cell.
+        Unreachable cells have distance -1.
+        """
+        maze = self.maze
+
+        if not maze.is_inside(source):
+            raise ValueError("Source must be located inside maze.")
+
+        _, distances = MazeSolver.get_shortest_path_tree(maze, source.x + source.y * maze.config.width)
+
+        return np.frombuffer(distances, dtype=distances.typecode).reshape(maze.config.height, maze.config.width)
+
+    def get_corridor_lengths(self, arrays: MazeArrays, degree: np.ndarray) -> Counter:
+        """
+        Returns histogram of corridor lengths. Corridor is a maximal chain of cells with exactly two passages,
+        its length is count of cells in it.
+        """
+        width = self.maze.config.width
+        offsets = [(1 << Direction.index_by_value(direction.value), direction.value.x + direction.value.y * width)
+                   for direction in Direction]
+
+        mask = arrays.passage_mask().tobytes()
+        is_corridor = (degree == 2).tobytes()
+        visited = bytearray(self.maze.get_cells_count())
+
+        histogram = Counter()
+
+        for cell in np.flatnonzero(degree == 2).tolist():
+            if visited[cell]:
+                continue
+
+            visited[cell] = 1
+            stack = [cell]
+            length = 0
+
+            while stack:
+                current = stack.pop()
+                length += 1
+
+                for bit, offset in offsets:
+                    neighbor = current + offset
+
+                    if mask[current] & bit and is_corridor[neighbor] and not visited[neighbor]:
+                        visited[neighbor] = 1
+                        stack.append(neighbor)
+
+            histogram[length] += 1
+
+        return histogram
+
+    def analyze(self) -> dict:
+        """
+        Returns dictionary with maze metrics. Diameter is the length of the longest shortest path in maze;
+        it is exact for perfect mazes and is a lower bound for mazes with loops or unreachable cells.
+        Branching factor is the average count of ways to continue from a junction (cell with 3 or 4 passages).
+        """
+        maze = self.maze
+        width, height = maze.config.width, maze.config.height
+
+        arrays = MazeArrays.from_maze(maze)
+        degree = arrays.degree()
+
+        from_corner = self.get_distances(MazePosition(0, 0))
+        reachable = int(np.count_nonzero(from_corner >= 0))
+
+        # the farthest cell from any cell of a tree is an end of its longest path
+        first_y, first_x = divmod(int(np.argmax(from_corner)), width)
+        from_first = self.get_distances(MazePosition(first_x, first_y))
+        second_y, second_x = divmod(int(np.argmax(from_first)), width)
+
+        junctions = degree >= 3
+        junctions_count = int(np.count_nonzero(junctions))
+
+        passages = maze.walls.count(False)
+        solution_length = int(from_corner[height - 1, width - 1])
+
+        return {
+            "width": width,
+            "height": height,
+            "cells": maze.get_cells_count(),
+            "passages": passages,
+            "reachable_cells": reachable,
+            "is_perfect": passages == maze.get_cells_count() - 1 and reachable == maze.get_cells_count(),
+            "solution_length": solution_length if solution_length != -1 else None,
+            "diameter": int(from_first[second_y, second_x]),
+            "diameter_endpoints": [[first_x, first_y], [second_x, second_y]],
+            "dead_ends": int(np.count_nonzero(degree == 1)),
+            "junctions": junctions_count,
+            "branching_factor": float(np.mean(degree[junctions]) - 1) if junctions_count else 0.0,
+            "degree_histogram": {str(value): int(np.count_nonzero(degree == value)) for value in range(5)},
+            "corridor_lengths": {
+                str(length): count for length, count in sorted(self.get_corridor_lengths(arrays, degree).items())
+            }
+        }
@@ -0,0 +1,105 @@
+import numpy as np
+
+from src.BitArray import BitArray
+from src.Maze import Maze, MazeConfig, Direction
+
+
+class MazeArrays:
+    """
+    NumPy representation of thin maze. Walls are stored in two boolean arrays of shape (height, width):
+    `right[y, x]` tells if there is a wall to the right of cell (x, y) and
+    `down[y, x]` tells if there is a wall below cell (x, y).
+    Walls on the maze border are always present in these arrays.
+    This representation allows computing properties of the whole maze in a few array operations.
+    """
+
+    config: MazeConfig
+    right: np.ndarray
+    down: np.ndarray
+
+    def __init__(self, config: MazeConfig, right: np.ndarray, down: np.ndarray):
+        self.config = config
+        self.right = right
+        self.down = down
+
+    @staticmethod
+    def from_maze(maze: Maze) -> 'MazeArrays':
+        """Builds arrays from thin maze. Values are copied, so arrays are independent of given maze."""
+        width, height = maze.config.width, maze.config.height
+        stride = 2 * width - 1
+
+        bits = np.unpackbits(
+            np.frombuffer(maze.walls.data, dtype=np.uint8),
+            count=maze.get_walls_count(),
+            bitorder="little"
+        ).astype(bool)
+
+        # last row doesn't have walls below it, so we pad it to get rectangular grid
+        grid = np.ones(height * stride, dtype=bool)
+        grid[:len(bits)] = bits
+        grid = grid.reshape(height, stride)
+
+        right = np.ones((height, width), dtype=bool)
+        right[:, :width - 1] = grid[:, :width - 1]
+
+        down = np.ones((height, width), dtype=bool)
+        down[:height - 1, :] = grid[:height - 1, width - 1:]
+
+        return MazeArrays(maze.config, right, down)
+
+    def to_maze(self) -> Maze:
+        """Converts arrays back into thin maze. Walls on the maze border are ignored."""
+        width, height = self.config.width, self.config.height
+        stride = 2 * width - 1
+
+        grid = np.empty((height, stride), dtype=bool)
+        grid[:, :width - 1] = self.right[:, :width - 1]
+        grid[:, width - 1:] = self.down
+
+        maze = Maze(self.config)
+        walls_count = maze.get_walls_count()
+        packed = np.packbits(grid.reshape(-1)[:walls_count], bitorder="little")
+        maze.walls = BitArray.from_bytes(bytearray(packed.tobytes()), walls_count)
+
+        return maze
+
+    def passages(self, direction: Direction) -> np.ndarray:
+        """Returns boolean array that tells for each cell if it is possible to go in given direction."""
+        result = np.zeros((self.config.height, self.config.width), dtype=bool)
+
+        if direction == Direction.UP:
+            result[1:, :] = ~self.down[:-1, :]
+        elif direction == Direction.RIGHT:
+            result[:, :] = ~self.right
+        elif direction == Direction.DOWN:
+            result[:, :] = ~self.down
+        else:
+            result[:, 1:] = ~self.right[:, :-1]
+
+        return result
+
+    def passage_mask(self) -> np.ndarray:
+        """
+        Returns array of open-neighbor bitmasks. Bit with index `Direction.index_by_value(direction.value)`
+        is set if it is possible to go from cell in this direction.
+        """
+        mask = np.zeros((self.config.height, self.config.width), dtype=np.uint8)
+
+        for direction in Direction:
+            bit = Direction.index_by_value(direction.value)
+            mask |= self.passages(direction).astype(np.uint8) << bit
+
+        return mask
+
+    def degree(self) -> np.ndarray:
+        """Returns array with count of open passages for each cell."""
+        degree = np.zeros((self.config.height, self.config.width), dtype=np.uint8)
+
+        for direction in Direction:
+            degree += self.passages(direction)
+
+        return degree
+
+    def dead_ends(self) -> np.ndarray:
+        """Returns boolean array that marks cells with exactly one open passage."""
+        return self.degree() == 1
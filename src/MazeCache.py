@@ -0,0 +1,84 @@
+import hashlib
+from collections import OrderedDict
+from typing import Optional
+
+from src.DiskCache import DiskCache
+from src.Maze import Maze, MazeConfig
+from src.MazeFileManager import MazeFileManager
+from src.formats.MazeFormat import MazeMetadata
+from src.generators.MazeGenerator import MazeGenerator
+
+
+class MazeCache:
+    """
+    Cache of generated mazes. Maze generated with a fixed seed is fully determined by
+    generator name, maze dimensions and seed, so such mazes are stored on disk in binary format
+    and reused instead of regenerating them. Recently used mazes are also kept in memory.
+    """
+
+    # increase when generators change, so old cached mazes are not used anymore
+    version = 1
+
+    disk: DiskCache
+    memory: OrderedDict[str, Maze]
+    memory_size: int
+
+    def __init__(self, directory: Optional[str] = None, max_size: int = 1 << 30, memory_size: int = 16):
+        if directory is None:
+            directory = DiskCache.get_default_directory("mazes")
+
+        self.disk = DiskCache(directory, max_size, ".mazeb")
+        self.memory = OrderedDict()
+        self.memory_size = memory_size
+
+    @staticmethod
+    def get_key(generator_name: str, config: MazeConfig, seed: int) -> str:
+        """Returns key that identifies maze generated with given parameters."""
+        description = f"{MazeCache.version}:{generator_name}:{config.width}x{config.height}:{seed}"
+        return hashlib.sha256(description.encode()).hexdigest()
+
+    def __remember(self, key: str, maze: Maze):
+        self.memory[key] = maze
+        self.memory.move_to_end(key)
+
+        while len(self.memory) > self.memory_size:
+            self.memory.popitem(last=False)
+
+    def get(self, generator_name: str, config: MazeConfig, seed: int) -> Optional[Maze]:
+        """Returns cached maze or None if maze with given parameters wasn't generated yet."""
+        key = MazeCache.get_key(generator_name, config, seed)
+
+        if key in self.memory:
+            self.memory.move_to_end(key)
+            return self.memory[key]
+
+        path = self.disk.get(key)
+        if path is None:
+            return None
+
+        maze = MazeFileManager.read_from_file(path, "binary", lazy=True)
+        self.__remember(key, maze)
+
+        return maze
+
+    def get_or_generate(self, generator_name: str, generator: MazeGenerator, config: MazeConfig, seed: int) -> Maze:
+        """
+        Returns cached maze or generates it and stores into cache.
+        Maze is written into cache row by row, so generators that produce rows use little memory.
+        Returned maze is read-only, because it is backed by cache file.
+        """
+        maze = self.get(generator_name, config, seed)
+        if maze is not None:
+            return maze
+
+        key = MazeCache.get_key(generator_name, config, seed)
+        metadata = MazeMetadata(generator_name, seed)
+
+        path = self.disk.store(key, lambda filename: MazeFileManager.write_rows(
+            filename, config, generator.generate_rows(config, seed), "binary", metadata
+        ))
+
+        maze = MazeFileManager.read_from_file(path, "binary", lazy=True)
+        self.__remember(key, maze)
+
+        return maze
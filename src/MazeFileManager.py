@@ -1,55 +1,118 @@
-import json
+import os
+from typing import Iterable, Optional
 
 from src.Maze import Maze, MazeConfig
-from typing import Optional
-
-
-class MazeFileInvalidException(Exception):
-    """Exception raised when you try to read maze from invalid maze file"""
-
-    def __init__(self):
-        super().__init__("Provided maze file is invalid.")
+from src.formats.BinaryMazeFormat import BinaryMazeFormat
+from src.formats.JsonMazeFormat import JsonMazeFormat
+from src.formats.MazeFormat import MazeFormat, MazeMetadata, MazeFileInvalidException
+from src.formats.TiledMazeFormat import TiledMazeFormat
 
 
 class MazeFileManager:
     """
     Read and save maze into file.
+    Dictionary `formats` represents available file formats. Format of file is chosen
+    by its extension when writing and by its content when reading.
     """
 
+    formats: dict[str, MazeFormat] = {
+        "json": JsonMazeFormat(),
+        "binary": BinaryMazeFormat(),
+        "tiled": TiledMazeFormat("zlib"),
+        "tiled-lzma": TiledMazeFormat("lzma")
+    }
+
+    default_format = "json"
+
+    @staticmethod
+    def get_format_for_writing(filename: str, file_format: Optional[str] = None) -> MazeFormat:
+        """Returns format with given name or format associated with file extension."""
+        if file_format is not None:
+            return MazeFileManager.formats[file_format]
+
+        extension = os.path.splitext(filename)[1]
+
+        for maze_format in MazeFileManager.formats.values():
+            if extension in maze_format.extensions:
+                return maze_format
+
+        return MazeFileManager.formats[MazeFileManager.default_format]
+
     @staticmethod
-    def read_from_file(filename: str) -> Optional[Maze]:
-        """Read maze from file. Exception is thrown if file content is invalid."""
+    def get_format_for_reading(filename: str, file_format: Optional[str] = None) -> MazeFormat:
+        """Returns format with given name or detects format using first bytes of the file."""
+        if file_format is not None:
+            return MazeFileManager.formats[file_format]
+
+        with open(filename, "rb") as file:
+            prefix = file.read(16)
 
-        with open(filename) as file:
-            content = json.loads(file.readline())
+        for maze_format in MazeFileManager.formats.values():
+            if maze_format.is_format_of(prefix):
+                return maze_format
 
-            width = content["width"]
-            height = content["height"]
-            maze_walls = content["walls"]
+        raise MazeFileInvalidException()
 
-        maze = Maze(MazeConfig(width, height))
-        maze.walls = maze_walls
+    @staticmethod
+    def read_from_file(filename: str, file_format: Optional[str] = None, lazy: bool = False) -> Optional[Maze]:
+        """
+        Read maze from file. Exception is thrown if file content is invalid.
+        If `lazy` is set, walls are read directly from memory-mapped file when format allows it,
+        so mazes larger than memory can be printed and solved. Lazily loaded maze is read-only.
+        """
+        maze_format = MazeFileManager.get_format_for_reading(filename, file_format)
+
+        if lazy:
+            return maze_format.read_lazy(filename)
+
+        return maze_format.read(filename)
+
+    @staticmethod
+    def read_region(filename: str, x0: int, y0: int, x1: int, y1: int, file_format: Optional[str] = None) -> Maze:
+        """
+        Read only cells from region [x0, x1) x [y0, y1) of stored maze.
+        Tiled files decompress only tiles that cover the region.
+        """
+        maze_format = MazeFileManager.get_format_for_reading(filename, file_format)
+
+        return maze_format.read_region(filename, x0, y0, x1, y1)
+
+    @staticmethod
+    def read_config(filename: str, file_format: Optional[str] = None) -> MazeConfig:
+        """Read dimensions of stored maze without reading its walls."""
+        return MazeFileManager.get_format_for_reading(filename, file_format).read_config(filename)
+
+    @staticmethod
+    def read_metadata(filename: str, file_format: Optional[str] = None) -> MazeMetadata:
+        """Read metadata (generator name and seed) stored alongside maze."""
+        return MazeFileManager.get_format_for_reading(filename, file_format).read_metadata(filename)
+
+    @staticmethod
+    def write_into_file(filename: str, maze: Maze, file_format: Optional[str] = None,
+                        metadata: Optional[MazeMetadata] = None):
+        """
+        Write maze into file. By default, format is chosen by file extension.
+        Any error that occurs during writing is propagated to the caller.
+        """
 
-        if not maze.is_correct():
-            raise MazeFileInvalidException()
+        if metadata is None:
+            metadata = MazeMetadata()
 
-        return maze
+        MazeFileManager.get_format_for_writing(filename, file_format).write(filename, maze, metadata)
 
     @staticmethod
-    def write_into_file(filename: str, maze: Maze) -> bool:
-        """Write maze into file using json format."""
+    def write_rows(filename: str, config: MazeConfig, rows: Iterable[int], file_format: Optional[str] = None,
+                   metadata: Optional[MazeMetadata] = None):
+        """
+        Write maze that is given row by row (see `Maze.get_row_walls`) into file.
+        Each row is written as soon as it is produced, so the whole maze is never kept in memory.
+        """
 
-        try:
-            content = json.dumps({
-                "width": maze.config.width,
-                "height": maze.config.height,
-                "walls": maze.walls
-            })
+        if metadata is None:
+            metadata = MazeMetadata()
 
-            with open(filename, "w") as file:
-                file.write(content)
+        maze_format = MazeFileManager.get_format_for_writing(filename, file_format)
 
-            return True
-        except Exception as e:
-            print(e)
-            return False
+        with maze_format.open_writer(filename, config, metadata) as writer:
+            for row in rows:
+                writer.write_row(row)
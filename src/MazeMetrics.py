@@ -0,0 +1,25 @@
+class MazeMetrics:
+    """
+    Receives counters from generators and solvers, for example cells visited, walls removed,
+    peak size of stack or frontier and BFS layers. Names are prefixed by kind of algorithm (`generate.`, `solve.`).
+    Algorithms report counters only if metrics object is passed, most counters are computed from
+    the result after algorithm finishes, so algorithms without metrics work as fast as before.
+    Counters of repeated runs are summed, peaks keep the maximum value.
+    """
+
+    counters: dict[str, int]
+
+    def __init__(self):
+        self.counters = dict()
+
+    def add(self, name: str, value: int):
+        """Adds value to counter."""
+        self.counters[name] = self.counters.get(name, 0) + value
+
+    def update_peak(self, name: str, value: int):
+        """Stores value if it is greater than stored one."""
+        self.counters[name] = max(self.counters.get(name, value), value)
+
+    def to_dict(self) -> dict[str, int]:
+        """Returns counters sorted by name, ready to be stored in JSON."""
+        return dict(sorted(self.counters.items()))
@@ -0,0 +1,96 @@
+import cProfile
+import time
+import tracemalloc
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+
+class Profiler:
+    """
+    Measures time of action phases (load, generate, solve, render, write).
+    Phases with the same name are summed. While profiler is disabled phases cost almost nothing,
+    so actions mark them unconditionally. Optionally collects cProfile statistics
+    and peak memory traced by tracemalloc (tracing makes code noticeably slower).
+    """
+
+    enabled: bool
+    phases: dict[str, float]
+    peak_memory: Optional[int]
+
+    __started: float
+    __profile: Optional[cProfile.Profile]
+    __profile_output: Optional[str]
+    __trace_memory: bool
+
+    def __init__(self):
+        self.enabled = False
+        self.phases = dict()
+        self.peak_memory = None
+        self.__started = 0
+        self.__profile = None
+        self.__profile_output = None
+        self.__trace_memory = False
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Adds time spent inside `with` block to phase with given name."""
+        if not self.enabled:
+            yield
+            return
+
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = self.phases.get(name, 0) + time.perf_counter() - started
+
+    def start(self, profile_output: Optional[str] = None, trace_memory: bool = False):
+        """Enables profiler. cProfile statistics are written to `profile_output` file if it is given."""
+        self.enabled = True
+        self.phases = dict()
+        self.peak_memory = None
+        self.__profile_output = profile_output
+        self.__trace_memory = trace_memory
+
+        if trace_memory:
+            tracemalloc.start()
+
+        if profile_output is not None:
+            self.__profile = cProfile.Profile()
+            self.__profile.enable()
+
+        self.__started = time.perf_counter()
+
+    def stop(self):
+        """Disables profiler and stores collected statistics."""
+        self.phases["total"] = time.perf_counter() - self.__started
+        self.enabled = False
+
+        if self.__profile is not None:
+            self.__profile.disable()
+            self.__profile.dump_stats(self.__profile_output)
+            self.__profile = None
+
+        if self.__trace_memory:
+            _, self.peak_memory = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+    def get_summary(self) -> list[str]:
+        """Returns lines of report about collected statistics."""
+        total = self.phases.get("total", 0)
+        lines = ["Profile:"]
+
+        for name, seconds in self.phases.items():
+            share = f"{seconds / total:7.1%}" if total > 0 else ""
+            lines.append(f"  {name:<12}{seconds:10.3f} s{share}")
+
+        if self.peak_memory is not None:
+            lines.append(f"  {'peak memory':<12}{self.peak_memory / (1 << 20):10.1f} MiB")
+
+        if self.__profile_output is not None:
+            lines.append(f"  cProfile statistics are written to {self.__profile_output}")
+
+        return lines
+
+
+profiler = Profiler()
@@ -0,0 +1,82 @@
+import hashlib
+from array import array
+from typing import Callable, Optional
+
+from src.DiskCache import DiskCache
+from src.Maze import Maze, MazePosition
+
+
+class SolutionCache:
+    """
+    Cache of maze solutions. Solution is fully determined by maze content, solving method and path endpoints,
+    so solutions are stored on disk under hash of these values and reused while maze doesn't change.
+    Solution is stored as an array of flat cell indices `x + y * width`.
+    Entries that can't be decoded into a path between requested cells are removed and treated as missing.
+    """
+
+    # increase when solvers or storage layout change, so old cached solutions are not used anymore
+    version = 1
+
+    disk: DiskCache
+
+    def __init__(self, directory: Optional[str] = None, max_size: int = 1 << 28):
+        if directory is None:
+            directory = DiskCache.get_default_directory("solutions")
+
+        self.disk = DiskCache(directory, max_size, ".path")
+
+    @staticmethod
+    def get_key(maze: Maze, solver_name: str, begin: MazePosition, end: MazePosition) -> str:
+        """Returns key that identifies solution of given maze."""
+        description = f"{SolutionCache.version}:{maze.get_content_hash()}:{solver_name}:" \
+                      f"{begin.x},{begin.y}:{end.x},{end.y}"
+        return hashlib.sha256(description.encode()).hexdigest()
+
+    def get(self, maze: Maze, solver_name: str, begin: MazePosition,
+            end: MazePosition) -> Optional[list[MazePosition]]:
+        """Returns cached solution or None if given maze wasn't solved yet."""
+        return self.__get(SolutionCache.get_key(maze, solver_name, begin, end), maze, begin, end)
+
+    def __get(self, key: str, maze: Maze, begin: MazePosition, end: MazePosition) -> Optional[list[MazePosition]]:
+        path = self.disk.get(key)
+        if path is None:
+            return None
+
+        width = maze.config.width
+        cells = array("q")
+
+        try:
+            with open(path, "rb") as file:
+                cells.frombytes(file.read())
+        except (OSError, ValueError):
+            # file is truncated or can't be read
+            cells = array("q")
+
+        # path goes from end to begin
+        if not cells or min(cells) < 0 or max(cells) >= maze.get_cells_count() \
+                or cells[0] != end.x + end.y * width or cells[-1] != begin.x + begin.y * width:
+            self.disk.remove(key)
+            return None
+
+        return [MazePosition(cell % width, cell // width) for cell in cells]
+
+    def get_or_solve(self, maze: Maze, solver_name: str, begin: MazePosition, end: MazePosition,
+                     solve: Callable[[], list[MazePosition]]) -> list[MazePosition]:
+        """Returns cached solution or calls `solve` and stores its result into cache."""
+        width = maze.config.width
+        key = SolutionCache.get_key(maze, solver_name, begin, end)
+
+        solution = self.__get(key, maze, begin, end)
+        if solution is not None:
+            return solution
+
+        solution = solve()
+        cells = array("q", (cell.x + cell.y * width for cell in solution))
+
+        def write(filename: str):
+            with open(filename, "wb") as file:
+                cells.tofile(file)
+
+        self.disk.store(key, write)
+
+        return solution
@@ -1,5 +1,43 @@
 from abc import ABC, abstractmethod
-from argparse import Namespace
+from argparse import ArgumentTypeError, Namespace
+
+from src.Maze import MazePosition
+
+
+def position(value: str) -> MazePosition:
+    """Parses cell position given in command line as `x,y`."""
+    x, y = value.split(",")
+    return MazePosition(int(x), int(y))
+
+
+def region(value: str) -> tuple[int, int, int, int]:
+    """Parses region of cells [x0, x1) x [y0, y1) given in command line as `x0,y0,x1,y1`."""
+    x0, y0, x1, y1 = map(int, value.split(","))
+
+    if not (0 <= x0 < x1 and 0 <= y0 < y1):
+        raise ArgumentTypeError("region must be non-empty and have non-negative coordinates")
+
+    return x0, y0, x1, y1
+
+
+def positive_int(value: str) -> int:
+    """Parses integer that must be greater than zero."""
+    result = int(value)
+
+    if result < 1:
+        raise ArgumentTypeError("value must be positive")
+
+    return result
+
+
+def seed(value: str) -> int:
+    """Parses seed of random generator. Seed is stored in maze files as signed 64-bit integer."""
+    result = int(value)
+
+    if not -2 ** 63 <= result < 2 ** 63:
+        raise ArgumentTypeError("seed must fit into signed 64-bit integer")
+
+    return result
 
 
 class Action(ABC):
@@ -0,0 +1,56 @@
+import json
+from argparse import Namespace
+
+import numpy as np
+
+from src.Maze import MazePosition
+from src.MazeAnalyzer import MazeAnalyzer
+from src.MazeFileManager import MazeFileManager
+from src.Profiler import profiler
+from src.actions.Action import Action, position
+
+
+class AnalyzeAction(Action):
+    """
+    Read maze from given file and print its metrics into console in JSON format.
+    Map of distances from given cell can be stored into `.npy` file.
+    """
+
+    name = "analyze"
+    help = "Compute maze metrics and print them in JSON format."
+
+    @staticmethod
+    def add_subparser(parser):
+        subparser = parser.add_parser(AnalyzeAction.name, help=AnalyzeAction.help)
+        subparser.add_argument('-f', dest="path", type=str, help='File to read maze from.', required=True)
+        subparser.add_argument('--distances', dest="distances", type=str, required=False,
+                               help='File to store map of distances to (NumPy .npy format).')
+        subparser.add_argument('--from', dest="source", type=position, required=False, default=MazePosition(0, 0),
+                               help='Cell from which distances are measured, given as x,y.')
+
+    @staticmethod
+    def handle(args: Namespace):
+        with profiler.phase("load"):
+            maze = MazeFileManager.read_from_file(args.path, lazy=True)
+
+        if not maze:
+            print("Error occurred while reading file.")
+            return
+
+        if not maze.is_inside(args.source):
+            print("Source cell must be located inside maze.")
+            return
+
+        analyzer = MazeAnalyzer(maze)
+
+        with profiler.phase("analyze"):
+            analysis = analyzer.analyze()
+
+        print(json.dumps(analysis, indent=4))
+
+        if args.distances is not None:
+            with profiler.phase("analyze"):
+                distances = analyzer.get_distances(args.source)
+
+            with profiler.phase("write"):
+                np.save(args.distances, distances)
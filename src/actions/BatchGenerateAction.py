@@ -0,0 +1,156 @@
+import os
+import random
+import sys
+import tempfile
+import time
+import zipfile
+from argparse import Namespace
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Optional
+
+from src.Maze import MazeConfig
+from src.MazeFileManager import MazeFileManager
+from src.actions.Action import Action, positive_int
+from src.actions.GenerateAction import GenerateAction
+from src.formats.MazeFormat import MazeMetadata
+
+
+def _generate_batch_item(generator_name: str, width: int, height: int, seed: int, file_format: str,
+                         path: Optional[str]) -> Optional[bytes]:
+    """
+    Generates one maze in worker process. If path is given, maze is written directly into it,
+    otherwise content of maze file is returned.
+    """
+    config = MazeConfig(width, height)
+    rows = GenerateAction.generators[generator_name].generate_rows(config, seed)
+    metadata = MazeMetadata(generator_name, seed)
+
+    if path is not None:
+        MazeFileManager.write_rows(path, config, rows, file_format, metadata)
+        return None
+
+    descriptor, temporary_path = tempfile.mkstemp()
+    os.close(descriptor)
+
+    try:
+        MazeFileManager.write_rows(temporary_path, config, rows, file_format, metadata)
+
+        with open(temporary_path, "rb") as file:
+            return file.read()
+    finally:
+        os.remove(temporary_path)
+
+
+class BatchGenerateAction(Action):
+    """
+    Generates many mazes with random sizes and generators using pool of processes.
+    Mazes are written into directory or into zip archive (if output path ends with `.zip`).
+    Count of tasks that are submitted but not finished yet is bounded, so memory usage doesn't depend on count of mazes.
+    """
+
+    name = "batch-generate"
+    help = "Generate many mazes in parallel and store them into directory or zip archive."
+
+    @staticmethod
+    def add_subparser(parser):
+        subparser = parser.add_parser(BatchGenerateAction.name, help=BatchGenerateAction.help)
+        subparser.add_argument("-n", "--count", dest="count", type=positive_int, required=True, help='Count of mazes.')
+        subparser.add_argument("-o", dest="output", type=str, required=True,
+                               help='Output directory or zip archive.')
+
+        subparser.add_argument("--min-size", dest="min_size", type=positive_int, required=False, default=5,
+                               help='Minimal width and height of maze.')
+        subparser.add_argument("--max-size", dest="max_size", type=positive_int, required=False, default=50,
+                               help='Maximal width and height of maze.')
+
+        generators = list(GenerateAction.generators.keys())
+        subparser.add_argument("-g", dest="generators", choices=generators, nargs="+", required=False,
+                               default=generators, help='Methods for maze generation, chosen randomly for each maze.')
+
+        subparser.add_argument("--format", dest="format", choices=list(MazeFileManager.formats.keys()),
+                               required=False, default="binary", help='Maze file format.')
+        subparser.add_argument("--seed", dest="seed", type=int, required=False,
+                               help='Seed that determines sizes, generators and seeds of all mazes.')
+
+        subparser.add_argument("--workers", dest="workers", type=positive_int, required=False,
+                               default=os.cpu_count() or 1, help='Count of processes.')
+        subparser.add_argument("--max-in-flight", dest="max_in_flight", type=positive_int, required=False,
+                               help='Maximal count of unfinished tasks. By default, four tasks per process.')
+
+    @staticmethod
+    def __report(done: int, count: int, cells: int, started: float, is_final: bool = False):
+        """Prints progress and throughput into stderr."""
+        elapsed = max(time.perf_counter() - started, 1e-9)
+
+        print(
+            f"\r{done}/{count} mazes, {done / elapsed:.1f} mazes/s, {cells / elapsed:.0f} cells/s",
+            end="\n" if is_final else "",
+            file=sys.stderr,
+            flush=True
+        )
+
+    @staticmethod
+    def handle(args: Namespace):
+        if args.min_size > args.max_size:
+            print("Minimal maze size must not be greater than maximal one.")
+            return
+
+        random_generator = random.Random(args.seed)
+        extension = MazeFileManager.formats[args.format].extensions[0]
+
+        is_archive = args.output.endswith(".zip")
+        archive = zipfile.ZipFile(args.output, "w", zipfile.ZIP_DEFLATED) if is_archive else None
+
+        if not is_archive:
+            os.makedirs(args.output, exist_ok=True)
+
+        max_in_flight = args.max_in_flight or args.workers * 4
+        started = time.perf_counter()
+        last_report = started
+
+        done = 0
+        cells = 0
+        submitted = 0
+        in_flight = dict()
+
+        try:
+            with ProcessPoolExecutor(max_workers=args.workers) as executor:
+                while done < args.count:
+                    while submitted < args.count and len(in_flight) < max_in_flight:
+                        filename = f"maze_{submitted:06d}{extension}"
+                        width = random_generator.randint(args.min_size, args.max_size)
+                        height = random_generator.randint(args.min_size, args.max_size)
+
+                        future = executor.submit(
+                            _generate_batch_item,
+                            random_generator.choice(args.generators),
+                            width,
+                            height,
+                            random_generator.getrandbits(63),
+                            args.format,
+                            None if is_archive else os.path.join(args.output, filename)
+                        )
+
+                        in_flight[future] = (filename, width * height)
+                        submitted += 1
+
+                    finished, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+
+                    for future in finished:
+                        filename, maze_cells = in_flight.pop(future)
+                        content = future.result()
+
+                        if archive is not None:
+                            archive.writestr(filename, content)
+
+                        done += 1
+                        cells += maze_cells
+
+                    if time.perf_counter() - last_report > 1:
+                        last_report = time.perf_counter()
+                        BatchGenerateAction.__report(done, args.count, cells, started)
+        finally:
+            if archive is not None:
+                archive.close()
+
+        BatchGenerateAction.__report(done, args.count, cells, started, is_final=True)
@@ -0,0 +1,134 @@
+import json
+import os
+import platform
+import sys
+import tempfile
+from argparse import Namespace
+
+from src.Benchmark import Benchmark, BenchmarkCase
+from src.Maze import Maze, MazeConfig
+from src.MazeFileManager import MazeFileManager
+from src.actions.Action import Action
+from src.actions.GenerateAction import GenerateAction
+from src.actions.SolveAction import SolveAction
+from src.drawers.TextMazeDrawer import TextMazeDrawer, TextThickMazeDrawer
+from src.generators.DFSGenerator import DFSGenerator
+from src.solvers.BFSMazeSolver import BFSMazeSolver
+
+
+class BenchAction(Action):
+    """
+    Measures performance of generators, solvers, drawers and file formats on mazes of different sizes.
+    Results are printed or stored in JSON format and can be compared with results saved earlier:
+    cases that became slower than baseline are reported as regressions and program exits with code 1.
+    """
+
+    name = "bench"
+    help = "Measure performance of maze operations."
+
+    @staticmethod
+    def add_subparser(parser):
+        subparser = parser.add_parser(BenchAction.name, help=BenchAction.help)
+        subparser.add_argument("--sizes", dest="sizes", type=int, nargs="+", required=False,
+                               default=[100, 10_000, 1_000_000], help='Counts of maze cells.')
+        subparser.add_argument("--repeat", dest="repeat", type=int, required=False, default=3,
+                               help='Count of runs of each case, the best time is reported.')
+        subparser.add_argument("--cases", dest="cases", type=str, nargs="+", required=False,
+                               help='Run only cases whose names start with given prefixes.')
+        subparser.add_argument("-o", dest="output", type=str, required=False,
+                               help='File to store results to. By default results are printed.')
+        subparser.add_argument("--baseline", dest="baseline", type=str, required=False,
+                               help='File with results to compare with.')
+        subparser.add_argument("--tolerance", dest="tolerance", type=float, required=False, default=0.25,
+                               help='Allowed slowdown relative to baseline (0.25 means 25%%).')
+
+    @staticmethod
+    def get_cases(directory: str) -> list[BenchmarkCase]:
+        """Returns all benchmark cases. Temporary files of cases are created in given directory."""
+        mazes: dict[tuple[int, int], Maze] = dict()
+
+        def get_maze(config: MazeConfig) -> Maze:
+            # the same maze is used by all cases of one size
+            key = (config.width, config.height)
+            if key not in mazes:
+                mazes[key] = DFSGenerator().generate(config, 1)
+
+            return mazes[key]
+
+        def get_file(config: MazeConfig, file_format: str) -> str:
+            filename = os.path.join(directory, f"maze_{config.width}x{config.height}_{file_format}")
+            if not os.path.exists(filename):
+                MazeFileManager.write_into_file(filename, get_maze(config), file_format)
+
+            return filename
+
+        cases = []
+
+        for name, generator in GenerateAction.generators.items():
+            cases.append(BenchmarkCase(
+                f"generate/{name}", lambda config: config,
+                lambda config, generator=generator: generator.generate(config, 1)
+            ))
+
+        for name, solver in SolveAction.solvers.items():
+            cases.append(BenchmarkCase(f"solve/{name}", get_maze, lambda maze, solver=solver: solver.solve(maze)))
+
+        cases.append(BenchmarkCase("draw/text", get_maze, lambda maze: TextMazeDrawer().draw(maze)))
+        cases.append(BenchmarkCase(
+            "draw/text-solution", lambda config: (get_maze(config), BFSMazeSolver.solve(get_maze(config))),
+            lambda arguments: TextMazeDrawer().draw(*arguments)
+        ))
+        cases.append(BenchmarkCase("draw/thick", get_maze, lambda maze: TextThickMazeDrawer.draw(maze)))
+
+        for file_format in MazeFileManager.formats:
+            cases.append(BenchmarkCase(
+                f"write/{file_format}",
+                lambda config, file_format=file_format: (os.path.join(directory, "written"), get_maze(config),
+                                                         file_format),
+                lambda arguments: MazeFileManager.write_into_file(*arguments)
+            ))
+            cases.append(BenchmarkCase(
+                f"read/{file_format}",
+                lambda config, file_format=file_format: get_file(config, file_format),
+                lambda filename, file_format=file_format: MazeFileManager.read_from_file(filename, file_format)
+            ))
+
+        return cases
+
+    @staticmethod
+    def handle(args: Namespace):
+        with tempfile.TemporaryDirectory() as directory:
+            cases = BenchAction.get_cases(directory)
+
+            if args.cases is not None:
+                cases = [case for case in cases if any(case.name.startswith(prefix) for prefix in args.cases)]
+
+            results = Benchmark(cases, args.sizes, args.repeat).run()
+
+        report = {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "results": results
+        }
+
+        if args.baseline is not None:
+            with open(args.baseline) as file:
+                baseline = json.load(file)["results"]
+
+            report["regressions"] = Benchmark.compare(results, baseline, args.tolerance)
+
+        if args.output is not None:
+            with open(args.output, "w") as file:
+                json.dump(report, file, indent=4)
+        else:
+            print(json.dumps(report, indent=4))
+
+        if report.get("regressions"):
+            for regression in report["regressions"]:
+                print(
+                    f"Regression: {regression['case']} on {regression['cells']} cells is "
+                    f"{regression['ratio']:.2f} times slower than baseline.",
+                    file=sys.stderr
+                )
+
+            sys.exit(1)
@@ -0,0 +1,64 @@
+import os
+from argparse import Namespace
+
+from src.MazeFileManager import MazeFileManager
+from src.Profiler import profiler
+from src.actions.Action import Action, positive_int
+from src.drawers.RasterMazeDrawer import RasterMazeDrawer
+from src.images.ImageFormat import ImageFormat
+from src.images.PbmImageFormat import PbmImageFormat
+from src.images.PngImageFormat import PngImageFormat
+from src.solvers.BFSMazeSolver import BFSMazeSolver
+
+
+class ExportAction(Action):
+    """
+    Read maze from given file and store it as an image.
+    Dictionary `formats` represents available image formats. Image is written row by row.
+    """
+
+    name = "export"
+    help = "Export maze (and optionally its solution) into image."
+
+    formats: dict[str, ImageFormat] = {
+        "png": PngImageFormat(),
+        "pbm": PbmImageFormat()
+    }
+
+    @staticmethod
+    def add_subparser(parser):
+        subparser = parser.add_parser(ExportAction.name, help=ExportAction.help)
+        subparser.add_argument('-f', dest="path", type=str, help='File to read maze from.', required=True)
+        subparser.add_argument('-o', dest="output", type=str, help='Image file.', required=True)
+        subparser.add_argument('--format', dest="format", choices=list(ExportAction.formats.keys()), required=False,
+                               help='Image format. By default it is chosen by file extension.')
+        subparser.add_argument('--scale', dest="scale", type=positive_int, required=False, default=1,
+                               help='Size of cells and walls in pixels.')
+        subparser.add_argument('-s', '--solution', dest="solution", action="store_true", required=False,
+                               help='Draw solution of maze (PBM images are black and white, so path is not visible).')
+
+    @staticmethod
+    def handle(args: Namespace):
+        with profiler.phase("load"):
+            maze = MazeFileManager.read_from_file(args.path, lazy=True)
+
+        if not maze:
+            print("Error occurred while reading file.")
+            return
+
+        image_format = ExportAction.formats.get(args.format)
+        if image_format is None:
+            extension = os.path.splitext(args.output)[1].lower()
+            image_format = next((image_format for image_format in ExportAction.formats.values()
+                                 if extension in image_format.extensions), ExportAction.formats["png"])
+
+        with profiler.phase("solve"):
+            solution = BFSMazeSolver.solve(maze) if args.solution else None
+
+        drawer = RasterMazeDrawer(args.scale)
+        width, height = drawer.get_size(maze)
+
+        # rows are drawn while image is written, so both take one phase
+        with profiler.phase("render"):
+            image_format.write(args.output, width, height, drawer.draw_rows(maze, solution),
+                               drawer.get_palette(solution is not None))
@@ -1,11 +1,19 @@
+import json
 from argparse import Namespace
 
 from src.Maze import MazeConfig
+from src.MazeCache import MazeCache
 from src.MazeFileManager import MazeFileManager
-from src.actions.Action import Action
+from src.MazeMetrics import MazeMetrics
+from src.Profiler import profiler
+from src.formats.MazeFormat import MazeMetadata
+from src.actions.Action import Action, positive_int, seed
 from src.drawers.TextMazeDrawer import TextMazeDrawer
 from src.generators.DFSGenerator import DFSGenerator
+from src.generators.EllerGenerator import EllerGenerator
+from src.generators.KruskalGenerator import KruskalGenerator
 from src.generators.MazeGenerator import MazeGenerator
+from src.generators.ParallelGenerator import ParallelGenerator
 from src.generators.SpanningTreeGenerator import SpanningTreeGenerator
 
 
@@ -21,13 +29,17 @@ class GenerateAction(Action):
 
     generators: dict[str, MazeGenerator] = {
         "dfs": DFSGenerator(),
-        "tree": SpanningTreeGenerator()
+        "tree": SpanningTreeGenerator(),
+        "kruskal": KruskalGenerator(),
+        "eller": EllerGenerator()
     }
 
     @staticmethod
     def add_subparser(parser):
         subparser = parser.add_parser(GenerateAction.name, help=GenerateAction.help)
         subparser.add_argument("-f", dest="path", type=str, help='File path to store maze to.', required=False)
+        subparser.add_argument("--format", dest="format", choices=list(MazeFileManager.formats.keys()),
+                               help='Maze file format. By default it is chosen by file extension.', required=False)
         subparser.add_argument("-p", dest="print", action="store_true", help='Should maze be printed.', required=False)
 
         subparser.add_argument("-W", "--width", dest="width", type=int, help='Maze width.', required=False, default=5)
@@ -38,15 +50,61 @@ class GenerateAction(Action):
         subparser.add_argument("-g", dest="generator", choices=generators, help='Method for maze generation.',
                                required=False, default=generators[0])
 
+        subparser.add_argument("--workers", dest="workers", type=positive_int, required=False, default=1,
+                               help='Count of processes. If greater than 1, maze is split into tiles '
+                                    'that are generated in parallel.')
+        subparser.add_argument("--tile-size", dest="tile_size", type=positive_int, required=False, default=512,
+                               help='Size of tiles for parallel generation.')
+
+        subparser.add_argument("--seed", dest="seed", type=seed, required=False,
+                               help='Seed for random generator. Mazes generated with the same seed are equal.')
+        subparser.add_argument("--cache-dir", dest="cache_dir", type=str, required=False,
+                               help='Directory for cache of mazes generated with seed.')
+        subparser.add_argument("--no-cache", dest="no_cache", action="store_true", required=False,
+                               help='Do not use cache of mazes generated with seed.')
+        subparser.add_argument("--metrics", dest="metrics", type=str, required=False,
+                               help='JSON file to store counters of generation to. Maze is generated without cache.')
+
     @staticmethod
     def handle(args: Namespace):
         maze_config = MazeConfig(args.width, args.height)
 
         chosen_generator = GenerateAction.generators[args.generator]
-        maze = chosen_generator.generate(maze_config)
+        cache_name = args.generator
+
+        if args.workers > 1:
+            chosen_generator = ParallelGenerator(chosen_generator, args.workers, args.tile_size)
+            # tiled mazes differ from mazes generated as a whole
+            cache_name += f"/tiles-{args.tile_size}"
+
+        metadata = MazeMetadata(args.generator, args.seed)
+        metrics = MazeMetrics() if args.metrics is not None else None
+
+        if metrics is not None:
+            # counters are reported only by generation itself, so cache is not used
+            with profiler.phase("generate"):
+                maze = chosen_generator.generate(maze_config, args.seed, metrics)
+
+            with open(args.metrics, "w") as file:
+                json.dump(metrics.to_dict(), file, indent=4)
+        elif args.seed is not None and not args.no_cache:
+            with profiler.phase("generate"):
+                maze = MazeCache(args.cache_dir).get_or_generate(cache_name, chosen_generator, maze_config, args.seed)
+        elif not args.print and args.path is not None:
+            # maze is not needed as a whole, so it goes to file row by row and both take one phase
+            with profiler.phase("generate"):
+                rows = chosen_generator.generate_rows(maze_config, args.seed)
+                MazeFileManager.write_rows(args.path, maze_config, rows, args.format, metadata)
+            return
+        else:
+            with profiler.phase("generate"):
+                maze = chosen_generator.generate(maze_config, args.seed)
 
         if args.print:
-            print(*TextMazeDrawer().draw(maze), sep="\n")
+            with profiler.phase("render"):
+                for row in TextMazeDrawer().draw_rows(maze):
+                    print(row)
 
         if args.path is not None:
-            MazeFileManager.write_into_file(args.path, maze)
+            with profiler.phase("write"):
+                MazeFileManager.write_into_file(args.path, maze, args.format, metadata)
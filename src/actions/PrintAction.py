@@ -1,13 +1,15 @@
 from argparse import Namespace
 
 from src.MazeFileManager import MazeFileManager
-from src.actions.Action import Action
+from src.Profiler import profiler
+from src.actions.Action import Action, region
 from src.drawers.TextMazeDrawer import TextMazeDrawer
 
 
 class PrintAction(Action):
     """
     Read maze from given file and then print it into the console.
+    Rows are printed as soon as they are drawn. If region is given, only this part of maze is read and drawn.
     """
 
     name = "print"
@@ -17,13 +19,34 @@ class PrintAction(Action):
     def add_subparser(parser):
         subparser = parser.add_parser(PrintAction.name, help=PrintAction.help)
         subparser.add_argument('-f', dest="path", type=str, help='File to read maze from.', required=True)
+        subparser.add_argument('--region', dest="region", type=region, required=False,
+                               help='Print only cells [x0, x1) x [y0, y1) of maze, given as x0,y0,x1,y1.')
 
     @staticmethod
     def handle(args: Namespace):
-        maze = MazeFileManager.read_from_file(args.path)
+        with profiler.phase("load"):
+            if args.region is None:
+                maze = MazeFileManager.read_from_file(args.path, lazy=True)
+                drawn_region = None
+            else:
+                config = MazeFileManager.read_config(args.path)
+                x0, y0, x1, y1 = args.region
+
+                if x1 > config.width or y1 > config.height:
+                    print("Region must be located inside maze.")
+                    return
+
+                # cells around region are read too, so walls on the region border look like in the whole maze
+                left, top = max(x0 - 1, 0), max(y0 - 1, 0)
+                maze = MazeFileManager.read_region(
+                    args.path, left, top, min(x1 + 1, config.width), min(y1 + 1, config.height)
+                )
+                drawn_region = (x0 - left, y0 - top, x1 - left, y1 - top)
 
         if not maze:
             print("Error occurred while reading file.")
             return
 
-        print(*TextMazeDrawer().draw(maze), sep="\n")
+        with profiler.phase("render"):
+            for row in TextMazeDrawer().draw_rows(maze, region=drawn_region):
+                print(row)
@@ -1,32 +1,120 @@
+import json
 from argparse import Namespace
 
+from src.Maze import Maze, MazePosition
 from src.MazeFileManager import MazeFileManager
-from src.actions.Action import Action
-from src.drawers.TextMazeDrawer import TextMazeDrawer, TextThickMazeDrawer
+from src.MazeMetrics import MazeMetrics
+from src.Profiler import profiler
+from src.SolutionCache import SolutionCache
+from src.actions.Action import Action, position, region
+from src.drawers.TextMazeDrawer import TextMazeDrawer
+from src.solvers.AStarMazeSolver import AStarMazeSolver
 from src.solvers.BFSMazeSolver import BFSMazeSolver
+from src.solvers.BidirectionalBFSMazeSolver import BidirectionalBFSMazeSolver
+from src.solvers.DeadEndFillingMazeSolver import DeadEndFillingMazeSolver
+from src.solvers.MazePathIndex import MazePathIndex, NotPerfectMazeException
+from src.solvers.MazeSolver import MazeSolver
 
 
 class SolveAction(Action):
     """
     Read maze from given file and then solve it.
     Solution is then printed into console.
+    Path between any two cells can be found with options `--from` and `--to`,
+    by default path goes from the top left to the bottom right corner.
+    Dictionary `solvers` represents available solving methods, BFS is used by default.
+    Method `index` builds path index of the whole maze, it is useful only when the same maze
+    is queried many times, so it is used only when chosen explicitly. For mazes with loops it falls back to BFS.
+    Solutions are cached by maze content, so solving unchanged maze again doesn't search the path.
+    Option `--region` limits drawing to a part of maze. Option `--metrics` stores counters of BFS search.
     """
 
     name = "solve"
     help = "Solve maze and print solution into console."
 
+    solvers: dict[str, MazeSolver] = {
+        "bfs": BFSMazeSolver(),
+        "astar": AStarMazeSolver(),
+        "bidirectional": BidirectionalBFSMazeSolver(),
+        "dead-end": DeadEndFillingMazeSolver()
+    }
+
+    index_solver_name = "index"
+
     @staticmethod
     def add_subparser(parser):
         subparser = parser.add_parser(SolveAction.name, help=SolveAction.help)
         subparser.add_argument('-f', dest="path", required=True, type=str, help='File to read maze from.')
+        subparser.add_argument('--from', dest="begin", type=position, required=False,
+                               help='Cell where path begins, given as x,y.')
+        subparser.add_argument('--to', dest="end", type=position, required=False,
+                               help='Cell where path ends, given as x,y.')
+        subparser.add_argument('--region', dest="region", type=region, required=False,
+                               help='Draw only cells [x0, x1) x [y0, y1) of maze, given as x0,y0,x1,y1.')
+        subparser.add_argument('-s', dest="solver", choices=list(SolveAction.solvers) + [SolveAction.index_solver_name],
+                               required=False, default="bfs", help='Method for maze solving.')
+        subparser.add_argument("--cache-dir", dest="cache_dir", type=str, required=False,
+                               help='Directory for cache of solutions.')
+        subparser.add_argument("--no-cache", dest="no_cache", action="store_true", required=False,
+                               help='Do not use cache of solutions.')
+        subparser.add_argument("--metrics", dest="metrics", type=str, required=False,
+                               help='JSON file to store counters of search to. '
+                                    'Maze is solved by bfs solver without cache.')
+
+    @staticmethod
+    def find_path(maze: Maze, solver_name: str, begin: MazePosition, end: MazePosition) -> list[MazePosition]:
+        """Finds path with chosen solver or with path index."""
+        if solver_name != SolveAction.index_solver_name:
+            return SolveAction.solvers[solver_name].solve(maze, begin, end)
+
+        try:
+            return MazePathIndex(maze).get_path(begin, end)
+        except NotPerfectMazeException:
+            # path in maze with loops is not unique, so we search for the shortest one
+            return BFSMazeSolver.solve(maze, begin, end)
 
     @staticmethod
     def handle(args: Namespace):
-        maze = MazeFileManager.read_from_file(args.path)
+        with profiler.phase("load"):
+            maze = MazeFileManager.read_from_file(args.path, lazy=True)
 
         if not maze:
             print("Error occurred while reading file.")
             return
 
-        solution = BFSMazeSolver.solve(maze)
-        print(*TextMazeDrawer().draw(maze, solution), sep="\n")
+        begin = args.begin if args.begin is not None else MazePosition(0, 0)
+        end = args.end if args.end is not None else MazePosition(maze.config.width - 1, maze.config.height - 1)
+
+        if not maze.is_inside(begin) or not maze.is_inside(end):
+            print("Path endpoints must be located inside maze.")
+            return
+
+        if args.region is not None and (args.region[2] > maze.config.width or args.region[3] > maze.config.height):
+            print("Region must be located inside maze.")
+            return
+
+        if args.metrics is not None and args.solver != "bfs":
+            print("Counters of search are reported only by bfs solver.")
+            return
+
+        metrics = MazeMetrics() if args.metrics is not None else None
+
+        with profiler.phase("solve"):
+            if metrics is not None:
+                # counters are reported only by search itself, so cache is not used
+                solution = BFSMazeSolver.solve(maze, begin, end, metrics)
+            elif args.no_cache:
+                solution = SolveAction.find_path(maze, args.solver, begin, end)
+            else:
+                solution = SolutionCache(args.cache_dir).get_or_solve(
+                    maze, args.solver, begin, end,
+                    lambda: SolveAction.find_path(maze, args.solver, begin, end)
+                )
+
+        if metrics is not None:
+            with open(args.metrics, "w") as file:
+                json.dump(metrics.to_dict(), file, indent=4)
+
+        with profiler.phase("render"):
+            for row in TextMazeDrawer().draw_rows(maze, solution, args.region):
+                print(row)
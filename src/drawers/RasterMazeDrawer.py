@@ -0,0 +1,68 @@
+from typing import Iterator, Optional
+
+import numpy as np
+
+from src.Maze import Maze, MazePosition, ThickMaze, ThickMazeCellType
+
+
+class RasterMazeDrawer:
+    """
+    Draws thin maze as raster image: thick maze (walls take the same place as cells) scaled by integer factor.
+    Pixels are values of ThickMazeCellType: empty, wall or path.
+    Image is produced row by row, so memory usage is proportional to image width.
+    """
+
+    palette: list[tuple[int, int, int]] = [
+        (255, 255, 255),  # EMPTY
+        (0, 0, 0),  # WALL
+        (0, 170, 255),  # PATH
+    ]
+
+    scale: int
+
+    def __init__(self, scale: int = 1):
+        self.scale = scale
+
+    def get_palette(self, has_solution: bool) -> list[tuple[int, int, int]]:
+        """Returns colors of pixel values. Without solution only two colors are used, so image takes less bits."""
+        return self.palette if has_solution else self.palette[:ThickMazeCellType.PATH.value]
+
+    def get_size(self, maze: Maze) -> tuple[int, int]:
+        """Returns width and height of image in pixels."""
+        return (2 * maze.config.width + 1) * self.scale, (2 * maze.config.height + 1) * self.scale
+
+    @staticmethod
+    def __get_solution_path(solution: list[MazePosition]) -> dict[int, list[int]]:
+        """Returns columns of path pixels of thick maze for each row of thick maze."""
+        result = dict()
+
+        for index, cell in enumerate(solution):
+            result.setdefault(2 * cell.y + 1, []).append(2 * cell.x + 1)
+
+            if index != len(solution) - 1:
+                intermediate_position = solution[index + 1] + cell + MazePosition(1, 1)
+                result.setdefault(intermediate_position.y, []).append(intermediate_position.x)
+
+        return result
+
+    def __get_thick_rows(self, maze: Maze, solution: Optional[list[MazePosition]]) -> Iterator[np.ndarray]:
+        """Yields rows of thick maze without scaling."""
+        solution_path = self.__get_solution_path(solution) if solution is not None else dict()
+
+        for y, row in enumerate(ThickMaze.generate_rows(maze)):
+            row = np.frombuffer(row, dtype=np.uint8)
+
+            if y in solution_path:
+                row = row.copy()
+                row[solution_path[y]] = ThickMazeCellType.PATH.value
+
+            yield row
+
+    def draw_rows(self, maze: Maze, solution: Optional[list[MazePosition]] = None) -> Iterator[np.ndarray]:
+        """Yields rows of image pixels. Each row of thick maze is repeated `scale` times."""
+        for row in self.__get_thick_rows(maze, solution):
+            if self.scale != 1:
+                row = np.repeat(row, self.scale)
+
+            for _ in range(self.scale):
+                yield row
@@ -1,4 +1,6 @@
-from typing import Optional
+from typing import Iterator, Optional
+
+import numpy as np
 from colorama import Fore, Style
 
 from src.Maze import Maze, MazePosition, Direction, ThickMaze, ThickMazeCellType
@@ -30,38 +32,79 @@ class TextMazeDrawer:
         "┼",  # 1111
     ]
 
+    # codes of path symbols are shifted by `path_code`, flag that marks path endpoints has code `flag_code`
+    __path_code = 16
+    __flag_code = 32
+
+    __table: dict[int, str] = {
+        **{code: symbol for code, symbol in enumerate(__symbols)},
+        **{code: Fore.CYAN + symbol + Style.RESET_ALL for code, symbol in enumerate(__symbols, __path_code)},
+        __flag_code: Fore.CYAN + "⚑" + Style.RESET_ALL
+    }
+
+    # count of rows of points between cells that are rendered at once
+    band_height = 64
+
     @staticmethod
-    def __get_mask_for_cell(maze: Maze, position: MazePosition) -> int:
+    def __get_bits(maze: Maze, start: int, count: int) -> np.ndarray:
+        """Returns walls with indices [start, start + count) as array of zeros and ones."""
+        value = maze.walls.get_bits(start, count)
+        data = np.frombuffer(value.to_bytes((count + 7) // 8, "little"), dtype=np.uint8)
+
+        return np.unpackbits(data, count=count, bitorder="little")
+
+    @staticmethod
+    def get_vertex_masks(maze: Maze, x0: int, y0: int, x1: int, y1: int) -> np.ndarray:
         """
         Special symbols are used for walls. Each special symbol has some connection:
-        top, right, bottom or left. This method calculates connections required for wall
-        in given point (according to its neighbors) and return symbol index for this wall.
+        top, right, bottom or left. This method calculates connections required for walls
+        in points [x0, x1) x [y0, y1) between cells (point (x, y) is the top left corner of cell (x, y))
+        and returns array of symbol indices with shape (y1 - y0, x1 - x0).
         """
-        mask = 0
+        width, height = maze.config.width, maze.config.height
+        stride = maze.get_row_stride()
 
-        offsets_and_directions = [
-            (MazePosition(-1, -1), Direction.RIGHT),
-            (MazePosition(0, -1), Direction.DOWN),
-            (MazePosition(0, 0), Direction.LEFT),
-            (MazePosition(-1, 0), Direction.UP)
-        ]
+        # vertical[i, j] is wall to the left of cell (x0 + j, y0 - 1 + i)
+        vertical = np.zeros((y1 - y0 + 1, x1 - x0), dtype=np.uint8)
+
+        # horizontal[i, j] is wall above cell (x0 - 1 + j, y0 + i)
+        horizontal = np.zeros((y1 - y0, x1 - x0 + 1), dtype=np.uint8)
 
-        for index, (offset, direction) in enumerate(offsets_and_directions):
-            if not maze.has_wall(position + offset, direction):
+        # walls on the maze border are always present, there are no walls outside maze
+        left, right = max(x0, 1), min(x1, width)
+        for index, y in enumerate(range(max(y0 - 1, 0), min(y1, height)), max(y0 - 1, 0) - (y0 - 1)):
+            if right > left:
+                vertical[index, left - x0:right - x0] = TextMazeDrawer.__get_bits(maze, y * stride + left - 1,
+                                                                                  right - left)
+
+            vertical[index, 0] |= x0 == 0
+            vertical[index, -1] |= x1 == width + 1
+
+        left, right = max(x0 - 1, 0), min(x1, width)
+        for index, y in enumerate(range(y0, y1)):
+            if right <= left:
                 continue
 
-            mask += 1 << index
+            if y == 0 or y == height:
+                horizontal[index, left - x0 + 1:right - x0 + 1] = 1
+            else:
+                horizontal[index, left - x0 + 1:right - x0 + 1] = TextMazeDrawer.__get_bits(
+                    maze, (y - 1) * stride + width - 1 + left, right - left
+                )
 
-        return mask
+        return vertical[:-1] | horizontal[:, 1:] << 1 | vertical[1:] << 2 | horizontal[:, :-1] << 3
 
-    def __get_solution_path(self, solution: Optional[list[MazePosition]]) -> dict[MazePosition, str]:
+    def __get_solution_path(self, solution: list[MazePosition]) -> dict[int, list[tuple[int, int]]]:
         """
         Special symbols are used for solution path drawing.
-        This method take solution and return dict that contain appropriate
-        special symbol for each cell on the solution path.
+        This method take solution and return dict that contain list of characters on the solution path
+        for each row: column of character and code of appropriate special symbol.
         """
         result = dict()
 
+        def put(position: MazePosition, code: int):
+            result.setdefault(position.y, []).append((position.x, code))
+
         for index in range(len(solution)):
             position = solution[index] * 2 + MazePosition(1, 1)
 
@@ -73,60 +116,71 @@ class TextMazeDrawer:
                     symbol_code = 1 << 0 | 1 << 2
                 else:
                     symbol_code = 1 << 1 | 1 << 3
-                result[intermediate_position] = Fore.CYAN + self.__symbols[symbol_code] + Style.RESET_ALL
+                put(intermediate_position, self.__path_code + symbol_code)
 
             if index == 0 or index == len(solution) - 1:
-                result[position] = Fore.CYAN + "⚑" + Style.RESET_ALL
+                put(position, self.__flag_code)
                 continue
 
             prev_offset = 1 << Direction.index_by_value(solution[index - 1] - solution[index])
             next_offset = 1 << Direction.index_by_value(solution[index + 1] - solution[index])
-            offset = prev_offset | next_offset
 
-            result[position] = Fore.CYAN + self.__symbols[offset] + Style.RESET_ALL
+            put(position, self.__path_code + (prev_offset | next_offset))
 
         return result
 
-    def draw(self, maze: Maze, solution: Optional[list[MazePosition]] = None) -> list[str]:
-        """Return text representation of given maze and (optionally) its solution."""
+    def draw_rows(self, maze: Maze, solution: Optional[list[MazePosition]] = None,
+                  region: Optional[tuple[int, int, int, int]] = None) -> Iterator[str]:
+        """
+        Yield rows of text representation of given maze and (optionally) its solution one by one.
+        If region (x0, y0, x1, y1) is given, only cells [x0, x1) x [y0, y1) are drawn:
+        result is the same as the corresponding part of the whole maze drawing.
+        Rows are rendered in bands of `band_height` rows, so memory usage doesn't depend on maze height.
+        Symbol codes of each band are computed with array operations, then each row is converted to text
+        with one `str.translate` call.
+        """
+        x0, y0, x1, y1 = region if region is not None else (0, 0, maze.config.width, maze.config.height)
 
-        if solution is None:
-            solution = []
+        if not (0 <= x0 < x1 <= maze.config.width and 0 <= y0 < y1 <= maze.config.height):
+            raise ValueError("Region must be non-empty and located inside maze.")
 
-        spacing = 2 if len(solution) != 0 else 1
+        if solution is None or len(solution) == 0:
+            for band_start in range(y0, y1 + 1, self.band_height):
+                masks = self.get_vertex_masks(maze, x0, band_start, x1 + 1, min(band_start + self.band_height, y1 + 1))
 
-        result_width = maze.config.width * spacing
-        result_height = maze.config.height * spacing
+                for row in masks:
+                    yield row.tobytes().decode("latin-1").translate(self.__table)
 
-        result = [""] * (result_height + 1)
+            return
 
         solution_path = self.__get_solution_path(solution)
 
-        for y in range(result_height + 1):
-            for x in range(result_width + 1):
-                position = MazePosition(x // spacing, y // spacing)
-
-                if x % spacing == 0 and y % spacing == 0:
-                    mask = self.__get_mask_for_cell(maze, position)
-                    result[y] += self.__symbols[mask]
-                    continue
-
-                if MazePosition(x, y) in solution_path:
-                    result[y] += solution_path[MazePosition(x, y)]
-                    continue
-
-                if x % spacing == 0:
-                    top_mask = self.__get_mask_for_cell(maze, position) & (1 << 2)
-                    bottom_mask = self.__get_mask_for_cell(maze, position.bottom()) & 1
-                    result[y] += self.__symbols[top_mask + bottom_mask]
-                elif y % spacing == 0:
-                    left_mask = self.__get_mask_for_cell(maze, position) & (1 << 1)
-                    right_mask = self.__get_mask_for_cell(maze, position.right()) & (1 << 3)
-                    result[y] += self.__symbols[left_mask + right_mask]
-                else:
-                    result[y] += " "
+        # with solution each cell and each wall takes separate character
+        for band_start in range(y0, y1 + 1, self.band_height):
+            band_end = min(band_start + self.band_height, y1 + 1)
 
-        return result
+            # masks of the next row of points are needed for walls between rows
+            masks = self.get_vertex_masks(maze, x0, band_start, x1 + 1, min(band_end + 1, y1 + 1))
+
+            rows_count = 2 * (band_end - band_start) - (1 if band_end == y1 + 1 else 0)
+            codes = np.zeros((rows_count, 2 * (x1 - x0) + 1), dtype=np.uint8)
+            codes[::2, ::2] = masks[:band_end - band_start]
+
+            # walls between points: symbol "─" for horizontal walls and symbol "│" for vertical walls
+            codes[::2, 1::2] = (masks[:band_end - band_start, :-1] & (1 << 1)) * 5
+            codes[1::2, ::2] = (masks[1:rows_count // 2 + 1] & 1) * 5
+
+            for index in range(rows_count):
+                for x, code in solution_path.get(2 * band_start + index, []):
+                    if 2 * x0 <= x <= 2 * x1:
+                        codes[index, x - 2 * x0] = code
+
+            for row in codes:
+                yield row.tobytes().decode("latin-1").translate(self.__table)
+
+    def draw(self, maze: Maze, solution: Optional[list[MazePosition]] = None) -> list[str]:
+        """Return text representation of given maze and (optionally) its solution."""
+        return list(self.draw_rows(maze, solution))
 
 
 class TextThickMazeDrawer:
@@ -134,8 +188,14 @@ class TextThickMazeDrawer:
     Print thick maze into console. Walls and empty cells have equal size in this type of maze.
     """
 
+    __table: dict[int, str] = {
+        ThickMazeCellType.EMPTY.value: " ",
+        ThickMazeCellType.WALL.value: "█",
+        ThickMazeCellType.PATH.value: "x"
+    }
+
     @staticmethod
-    def draw(maze: Maze, solution: list[MazePosition]):
+    def draw(maze: Maze, solution: Optional[list[MazePosition]] = None) -> list[str]:
         thick_maze = ThickMaze.from_thin_maze(maze)
 
         if solution is None:
@@ -143,25 +203,15 @@ class TextThickMazeDrawer:
 
         for index in range(len(solution)):
             current_position = solution[index] * 2 + MazePosition(1, 1)
-            thick_maze.maze[current_position.x][current_position.y] = ThickMazeCellType.PATH
+            thick_maze.set_cell(current_position.x, current_position.y, ThickMazeCellType.PATH)
 
             if index == len(solution) - 1:
                 continue
 
             intermediate_position = solution[index + 1] + solution[index] + MazePosition(1, 1)
-            thick_maze.maze[intermediate_position.x][intermediate_position.y] = ThickMazeCellType.PATH
-
-        result = [""] * thick_maze.config.height
-
-        for y in range(thick_maze.config.height):
-            for x in range(thick_maze.config.width):
-                character = " "
+            thick_maze.set_cell(intermediate_position.x, intermediate_position.y, ThickMazeCellType.PATH)
 
-                if thick_maze.maze[x][y] == ThickMazeCellType.WALL:
-                    character = "█"
-                elif thick_maze.maze[x][y] == ThickMazeCellType.PATH:
-                    character = "x"
-
-                result[y] += character
-
-        return result
+        return [
+            thick_maze.get_row(y).decode("latin-1").translate(TextThickMazeDrawer.__table)
+            for y in range(thick_maze.config.height)
+        ]
@@ -0,0 +1,195 @@
+import mmap
+import struct
+
+from src.BitArray import BitArray, BitWriter
+from src.Maze import Maze, MazeConfig
+from src.formats.MazeFormat import MazeFormat, MazeMetadata, MazeWriter, MazeFileInvalidException
+
+
+class BinaryMazeHeader:
+    """
+    Header of binary maze file. It has fixed size part:
+    magic, version, flags, generator name length, width, height and seed,
+    followed by utf-8 encoded generator name. Packed walls are stored right after the header.
+    """
+
+    magic = b"MAZE"
+    version = 1
+
+    # flags
+    has_seed = 1 << 0
+    has_generator = 1 << 1
+
+    layout = struct.Struct("<4sBBHIIq")
+
+    config: MazeConfig
+    metadata: MazeMetadata
+    walls_offset: int
+
+    def __init__(self, config: MazeConfig, metadata: MazeMetadata, walls_offset: int = 0):
+        self.config = config
+        self.metadata = metadata
+        self.walls_offset = walls_offset
+
+    def pack(self) -> bytes:
+        """Returns binary representation of this header."""
+        flags = 0
+
+        if self.metadata.seed is not None:
+            flags |= BinaryMazeHeader.has_seed
+
+        generator = b""
+        if self.metadata.generator is not None:
+            flags |= BinaryMazeHeader.has_generator
+            generator = self.metadata.generator.encode()
+
+        return BinaryMazeHeader.layout.pack(
+            BinaryMazeHeader.magic,
+            BinaryMazeHeader.version,
+            flags,
+            len(generator),
+            self.config.width,
+            self.config.height,
+            self.metadata.seed or 0
+        ) + generator
+
+    @staticmethod
+    def unpack(buffer) -> 'BinaryMazeHeader':
+        """Parses header from the beginning of given buffer. Exception is thrown if header is invalid."""
+        layout = BinaryMazeHeader.layout
+
+        if len(buffer) < layout.size:
+            raise MazeFileInvalidException()
+
+        magic, version, flags, generator_length, width, height, seed = layout.unpack_from(buffer)
+
+        if magic != BinaryMazeHeader.magic or version != BinaryMazeHeader.version:
+            raise MazeFileInvalidException()
+
+        walls_offset = layout.size + generator_length
+
+        if len(buffer) < walls_offset:
+            raise MazeFileInvalidException()
+
+        generator = None
+        if flags & BinaryMazeHeader.has_generator:
+            try:
+                generator = bytes(buffer[layout.size:walls_offset]).decode()
+            except UnicodeDecodeError:
+                raise MazeFileInvalidException()
+
+        metadata = MazeMetadata(generator, seed if flags & BinaryMazeHeader.has_seed else None)
+
+        return BinaryMazeHeader(MazeConfig(width, height), metadata, walls_offset)
+
+
+class BinaryMazeWriter(MazeWriter):
+    """Writes header and then packs walls of each row into bits right after previous row."""
+
+    def __init__(self, filename: str, config: MazeConfig, metadata: MazeMetadata):
+        super().__init__(config)
+
+        self.file = open(filename, "wb")
+        self.file.write(BinaryMazeHeader(config, metadata).pack())
+        self.bits = BitWriter(self.file.write)
+
+    def write_walls(self, walls: int, count: int):
+        self.bits.write(walls, count)
+
+    def finish(self):
+        self.bits.close()
+        self.file.close()
+
+
+class BinaryMazeFormat(MazeFormat):
+    """
+    Stores maze in compact binary form: small header and then walls packed into bits.
+    File is read through mmap, so loading does not involve any parsing.
+    """
+
+    name = "binary"
+    extensions = [".mazeb"]
+
+    def is_format_of(self, prefix: bytes) -> bool:
+        return prefix.startswith(BinaryMazeHeader.magic)
+
+    @staticmethod
+    def _open(filename: str) -> tuple[mmap.mmap, BinaryMazeHeader]:
+        """Maps file into memory and parses its header."""
+        with open(filename, "rb") as file:
+            try:
+                mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # empty files can't be mapped
+                raise MazeFileInvalidException()
+
+        try:
+            header = BinaryMazeHeader.unpack(mapped)
+            walls_count = Maze(header.config, BitArray()).get_walls_count()
+
+            if len(mapped) != header.walls_offset + BitArray.get_bytes_count(walls_count):
+                raise MazeFileInvalidException()
+        except MazeFileInvalidException:
+            mapped.close()
+            raise
+
+        return mapped, header
+
+    def read(self, filename: str) -> Maze:
+        mapped, header = self._open(filename)
+
+        with mapped:
+            maze = Maze(header.config, BitArray())
+
+            try:
+                maze.walls = BitArray.from_bytes(bytearray(mapped[header.walls_offset:]), maze.get_walls_count())
+            except ValueError:
+                raise MazeFileInvalidException()
+
+        return maze
+
+    def read_lazy(self, filename: str) -> Maze:
+        """
+        Returns maze whose walls are backed directly by memory-mapped file.
+        Only pages that are actually accessed are loaded into memory.
+        Such maze is read-only: any attempt to change its walls raises TypeError.
+        """
+        mapped, header = self._open(filename)
+        maze = Maze(header.config, BitArray())
+
+        # memoryview keeps reference to mapped file, so it stays open while maze exists
+        walls = memoryview(mapped)[header.walls_offset:]
+
+        try:
+            maze.walls = BitArray.from_bytes(walls, maze.get_walls_count())
+            return maze
+        except ValueError:
+            pass
+
+        # file can be closed only after view is released, and view is referenced by exception until it is handled
+        walls.release()
+        mapped.close()
+        raise MazeFileInvalidException()
+
+    def read_metadata(self, filename: str) -> MazeMetadata:
+        mapped, header = self._open(filename)
+        mapped.close()
+
+        return header.metadata
+
+    def read_config(self, filename: str) -> MazeConfig:
+        mapped, header = self._open(filename)
+        mapped.close()
+
+        return header.config
+
+    def open_writer(self, filename: str, config: MazeConfig, metadata: MazeMetadata) -> MazeWriter:
+        return BinaryMazeWriter(filename, config, metadata)
+
+    def write(self, filename: str, maze: Maze, metadata: MazeMetadata):
+        # walls are already packed in the same way, so they are written all at once
+        header = BinaryMazeHeader(maze.config, metadata)
+
+        with open(filename, "wb") as file:
+            file.write(header.pack())
+            file.write(maze.walls.data)
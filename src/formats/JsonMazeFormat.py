@@ -0,0 +1,302 @@
+import json
+import re
+from typing import Optional, TextIO
+
+from src.BitArray import BitArray, BitWriter
+from src.Maze import Maze, MazeConfig
+from src.formats.MazeFormat import MazeFormat, MazeMetadata, MazeWriter, MazeFileInvalidException
+
+
+class JsonMazeReader:
+    """
+    Incremental parser for json maze files. File is read by chunks of fixed size,
+    and `walls` array is packed into bits as soon as it is read,
+    so memory usage doesn't depend on the length of json text.
+    """
+
+    chunk_size = 1 << 16
+
+    __whitespace = re.compile(r"[ \t\r\n]*")
+    __whitespace_characters = str.maketrans("", "", " \t\r\n")
+    __decoder = json.JSONDecoder()
+
+    file: TextIO
+    buffer: str
+    position: int
+    is_finished: bool
+
+    def __init__(self, file: TextIO):
+        self.file = file
+        self.buffer = ""
+        self.position = 0
+        self.is_finished = False
+
+    def read(self, store_walls: bool = True) -> tuple[dict, Optional[BitArray]]:
+        """
+        Parses json object and returns its fields and walls. Only whitespaces may follow the object.
+        If `store_walls` is False, walls are validated but not stored.
+        """
+        fields = dict()
+        walls = None
+
+        self.__expect("{")
+
+        if self.__peek() == "}":
+            self.position += 1
+            self.__expect_end()
+            return fields, walls
+
+        while True:
+            key = self.__read_value()
+            if not isinstance(key, str):
+                raise MazeFileInvalidException()
+
+            self.__expect(":")
+
+            if key == "walls":
+                walls = self.__read_walls(store_walls)
+            else:
+                fields[key] = self.__read_value()
+
+            separator = self.__peek()
+            self.position += 1
+
+            if separator == "}":
+                self.__expect_end()
+                return fields, walls
+
+            if separator != ",":
+                raise MazeFileInvalidException()
+
+    def __fill(self) -> bool:
+        """Reads next chunk from file. Returns False if the end of file is reached."""
+        if self.is_finished:
+            return False
+
+        chunk = self.file.read(JsonMazeReader.chunk_size)
+        self.buffer = self.buffer[self.position:] + chunk
+        self.position = 0
+
+        if len(chunk) == 0:
+            self.is_finished = True
+
+        return not self.is_finished
+
+    def __peek(self) -> str:
+        """Skips whitespaces and returns next character without consuming it."""
+        while True:
+            self.position = JsonMazeReader.__whitespace.match(self.buffer, self.position).end()
+
+            if self.position < len(self.buffer):
+                return self.buffer[self.position]
+
+            if not self.__fill():
+                raise MazeFileInvalidException()
+
+    def __expect_end(self):
+        """Checks that only whitespaces are left in file."""
+        while True:
+            self.position = JsonMazeReader.__whitespace.match(self.buffer, self.position).end()
+
+            if self.position < len(self.buffer):
+                raise MazeFileInvalidException()
+
+            if not self.__fill():
+                return
+
+    def __expect(self, character: str):
+        if self.__peek() != character:
+            raise MazeFileInvalidException()
+
+        self.position += 1
+
+    def __read_value(self):
+        """Reads any json value. Buffer is extended until value can be decoded completely."""
+        self.__peek()
+
+        while True:
+            try:
+                value, end = JsonMazeReader.__decoder.raw_decode(self.buffer, self.position)
+
+                # number at the end of buffer may continue in the next chunk
+                if end < len(self.buffer) or self.is_finished:
+                    self.position = end
+                    return value
+            except json.JSONDecodeError:
+                pass
+
+            if not self.__fill():
+                raise MazeFileInvalidException()
+
+    def __read_walls(self, store_walls: bool) -> BitArray:
+        """Reads array of booleans chunk by chunk and packs it into bits."""
+        self.__expect("[")
+
+        data = bytearray()
+        length = 0
+
+        # bits that don't form a complete byte yet, in order of appearance
+        pending = ""
+        # array can't end right after comma
+        expects_value = False
+
+        while True:
+            end = self.buffer.find("]", self.position)
+            is_last = end != -1
+
+            if not is_last:
+                # only complete values (followed by comma) can be processed
+                end = max(self.buffer.rfind(",", self.position) + 1, self.position)
+
+            segment = self.buffer[self.position:end]
+
+            # values are replaced before whitespaces are removed, so only exact `true` and `false` become bits,
+            # and then values and commas must alternate
+            compact = segment.replace("true", "1").replace("false", "0").translate(
+                JsonMazeReader.__whitespace_characters
+            )
+            bits = compact[::2]
+
+            if is_last:
+                # `b,b,...,b` or nothing if array is empty
+                is_complete = len(compact) % 2 == 1 if compact else not expects_value
+            else:
+                # `b,b,...,b,`
+                is_complete = len(compact) % 2 == 0
+                expects_value = expects_value or bool(compact)
+
+            if not is_complete or bits.strip("01") or compact[1::2].strip(",") or "0" in segment or "1" in segment:
+                raise MazeFileInvalidException()
+
+            length += len(bits)
+
+            if store_walls:
+                pending += bits
+                complete = len(pending) - len(pending) % 8
+
+                if complete > 0:
+                    data += int(pending[complete - 1::-1], 2).to_bytes(complete // 8, "little")
+                    pending = pending[complete:]
+
+            self.position = end
+
+            if is_last:
+                self.position += 1
+                break
+
+            if not self.__fill():
+                raise MazeFileInvalidException()
+
+        if not store_walls:
+            return BitArray()
+
+        if pending:
+            data.append(int(pending[::-1], 2))
+
+        return BitArray.from_bytes(data, length)
+
+
+class JsonMazeWriter(MazeWriter):
+    """
+    Writes maze as json object. Walls of each row are packed into bytes,
+    and complete bytes are converted to text using precomputed table.
+    """
+
+    __byte_texts = [
+        ", ".join("true" if (byte >> bit) & 1 else "false" for bit in range(8))
+        for byte in range(256)
+    ]
+
+    file: TextIO
+    metadata: MazeMetadata
+    is_empty: bool
+
+    def __init__(self, filename: str, config: MazeConfig, metadata: MazeMetadata):
+        super().__init__(config)
+
+        self.metadata = metadata
+        self.is_empty = True
+        self.bits = BitWriter(self.__write_bytes)
+
+        self.file = open(filename, "w")
+        self.file.write(f'{{"width": {config.width}, "height": {config.height}, "walls": [')
+
+    def __write_text(self, text: str):
+        if not self.is_empty:
+            self.file.write(", ")
+
+        self.file.write(text)
+        self.is_empty = False
+
+    def __write_bytes(self, data: bytes):
+        self.__write_text(", ".join([JsonMazeWriter.__byte_texts[byte] for byte in data]))
+
+    def write_walls(self, walls: int, count: int):
+        self.bits.write(walls, count)
+
+    def finish(self):
+        # the last incomplete byte is written bit by bit
+        if self.bits.count != 0:
+            value = self.bits.value
+            self.__write_text(", ".join("true" if (value >> bit) & 1 else "false" for bit in range(self.bits.count)))
+
+        self.file.write("]")
+
+        if self.metadata.generator is not None:
+            self.file.write(f', "generator": {json.dumps(self.metadata.generator)}')
+
+        if self.metadata.seed is not None:
+            self.file.write(f', "seed": {self.metadata.seed}')
+
+        self.file.write("}")
+        self.file.close()
+
+
+class JsonMazeFormat(MazeFormat):
+    """
+    Stores maze as json object with fields `width`, `height` and `walls`.
+    This is the original maze file format, it is human-readable but takes several bytes per wall.
+    Both reading and writing are done by chunks, so memory overhead doesn't depend on maze size.
+    """
+
+    name = "json"
+    extensions = [".maze", ".json"]
+
+    def is_format_of(self, prefix: bytes) -> bool:
+        return prefix.lstrip().startswith(b"{")
+
+    @staticmethod
+    def __read_content(filename: str, store_walls: bool) -> tuple[dict, Optional[BitArray]]:
+        try:
+            with open(filename) as file:
+                fields, walls = JsonMazeReader(file).read(store_walls)
+        except UnicodeDecodeError:
+            raise MazeFileInvalidException()
+
+        if walls is None or not isinstance(fields.get("width"), int) or not isinstance(fields.get("height"), int):
+            raise MazeFileInvalidException()
+
+        return fields, walls
+
+    def read(self, filename: str) -> Maze:
+        fields, walls = self.__read_content(filename, True)
+
+        maze = Maze(MazeConfig(fields["width"], fields["height"]), walls)
+
+        if not maze.is_correct():
+            raise MazeFileInvalidException()
+
+        return maze
+
+    def read_metadata(self, filename: str) -> MazeMetadata:
+        fields, _ = self.__read_content(filename, False)
+
+        return MazeMetadata(fields.get("generator"), fields.get("seed"))
+
+    def read_config(self, filename: str) -> MazeConfig:
+        fields, _ = self.__read_content(filename, False)
+
+        return MazeConfig(fields["width"], fields["height"])
+
+    def open_writer(self, filename: str, config: MazeConfig, metadata: MazeMetadata) -> MazeWriter:
+        return JsonMazeWriter(filename, config, metadata)
@@ -0,0 +1,132 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from src.BitArray import BitArray
+from src.Maze import Maze, MazeConfig
+
+
+class MazeFileInvalidException(Exception):
+    """Exception raised when you try to read maze from invalid maze file"""
+
+    def __init__(self):
+        super().__init__("Provided maze file is invalid.")
+
+
+class MazeMetadata:
+    """
+    This class stores additional information about maze that may be saved alongside it:
+    name of generator that created maze and seed that was used for generation.
+    """
+    generator: Optional[str]
+    seed: Optional[int]
+
+    def __init__(self, generator: Optional[str] = None, seed: Optional[int] = None):
+        self.generator = generator
+        self.seed = seed
+
+
+class MazeWriter(ABC):
+    """
+    This abstract class writes maze into file row by row, so the whole maze doesn't have to be in memory.
+    Rows must be written from top to bottom, each row is an integer with walls of this row
+    (see `Maze.get_row_walls`). Writer must be closed after all rows are written.
+    """
+
+    config: MazeConfig
+    rows_count: int
+
+    def __init__(self, config: MazeConfig):
+        self.config = config
+        self.rows_count = 0
+
+        # maze without walls is only used to calculate walls layout
+        self.__layout = Maze(config, BitArray())
+
+    def write_row(self, walls: int):
+        """Write walls of the next row."""
+        if self.rows_count == self.config.height:
+            raise ValueError("All rows of maze are already written.")
+
+        self.write_walls(walls, self.__layout.get_row_walls_count(self.rows_count))
+        self.rows_count += 1
+
+    def close(self):
+        """Finish writing. Exception is thrown if not all rows were written."""
+        self.finish()
+
+        if self.rows_count != self.config.height:
+            raise ValueError("Not all rows of maze were written.")
+
+    @abstractmethod
+    def write_walls(self, walls: int, count: int):
+        """Write `count` walls of the next row."""
+        pass
+
+    @abstractmethod
+    def finish(self):
+        """Write remaining data and close file."""
+        pass
+
+    def __enter__(self) -> 'MazeWriter':
+        return self
+
+    def __exit__(self, exception_type, exception, traceback):
+        if exception is None:
+            self.close()
+        else:
+            self.finish()
+
+
+class MazeFormat(ABC):
+    """
+    This abstract class represents a way to store maze in file.
+    Field `extensions` lists file extensions that are associated with this format.
+    """
+
+    name: str
+    extensions: list[str]
+
+    @abstractmethod
+    def is_format_of(self, prefix: bytes) -> bool:
+        """Checks if file that starts with given bytes is stored in this format."""
+        pass
+
+    @abstractmethod
+    def read(self, filename: str) -> Maze:
+        """Read maze from file. MazeFileInvalidException is thrown if file content is invalid."""
+        pass
+
+    def read_lazy(self, filename: str) -> Maze:
+        """
+        Read maze from file without loading all walls into memory.
+        Formats that don't support random access to walls just read the whole maze.
+        """
+        return self.read(filename)
+
+    def read_region(self, filename: str, x0: int, y0: int, x1: int, y1: int) -> Maze:
+        """
+        Read only cells from region [x0, x1) x [y0, y1) of stored maze.
+        By default, maze is read lazily and then cropped.
+        """
+        return self.read_lazy(filename).crop(x0, y0, x1, y1)
+
+    @abstractmethod
+    def read_metadata(self, filename: str) -> MazeMetadata:
+        """Read metadata that was stored alongside maze."""
+        pass
+
+    @abstractmethod
+    def read_config(self, filename: str) -> MazeConfig:
+        """Read maze dimensions without reading its walls."""
+        pass
+
+    @abstractmethod
+    def open_writer(self, filename: str, config: MazeConfig, metadata: MazeMetadata) -> MazeWriter:
+        """Open file for writing maze with given config row by row."""
+        pass
+
+    def write(self, filename: str, maze: Maze, metadata: MazeMetadata):
+        """Write maze and its metadata into file."""
+        with self.open_writer(filename, maze.config, metadata) as writer:
+            for y in range(maze.config.height):
+                writer.write_row(maze.get_row_walls(y))
@@ -0,0 +1,307 @@
+import lzma
+import struct
+import zlib
+
+from src.BitArray import BitArray
+from src.Maze import Maze, MazeConfig
+from src.formats.MazeFormat import MazeFormat, MazeMetadata, MazeWriter, MazeFileInvalidException
+
+
+class MazeTile:
+    """
+    Rectangular part of maze: cells from region [x0, x1) x [y0, y1).
+    Tile stores walls of its cells that are located to the right of and below each cell.
+    Walls of each row are stored one after another: first walls to the right of cells, then walls below cells.
+    Walls on the maze border are not stored.
+    """
+
+    x0: int
+    y0: int
+    x1: int
+    y1: int
+
+    def __init__(self, x0: int, y0: int, x1: int, y1: int):
+        self.x0 = x0
+        self.y0 = y0
+        self.x1 = x1
+        self.y1 = y1
+
+    def get_right_walls_count(self, config: MazeConfig) -> int:
+        """Returns count of walls to the right of cells stored for each row of tile."""
+        return min(self.x1, config.width - 1) - self.x0
+
+    def get_row_offset(self, config: MazeConfig, y: int) -> int:
+        """Returns index of the first wall of maze row `y` in tile bits."""
+        return (y - self.y0) * (self.get_right_walls_count(config) + self.x1 - self.x0)
+
+    def get_walls_count(self, config: MazeConfig) -> int:
+        """Returns total count of walls stored in this tile."""
+        count = self.get_row_offset(config, self.y1)
+
+        if self.y1 == config.height:
+            # the last row of maze doesn't have walls below it
+            count -= self.x1 - self.x0
+
+        return count
+
+
+class TiledMazeHeader:
+    """
+    Header of tiled maze file: magic, version, flags, codec, generator name length,
+    width, height, tile size and seed, followed by utf-8 encoded generator name.
+    Header is followed by tiles index: offset and size of each compressed tile.
+    """
+
+    magic = b"MAZT"
+    version = 1
+
+    # flags
+    has_seed = 1 << 0
+    has_generator = 1 << 1
+
+    layout = struct.Struct("<4sBBBxIIIHxxq")
+    index_entry = struct.Struct("<QI")
+
+
+class TiledMazeWriter(MazeWriter):
+    """
+    Writes tiled maze file. Rows are collected until one row of tiles is complete,
+    then tiles are compressed and written, so only `tile_size` rows are kept in memory.
+    Tiles index is written after all tiles.
+    """
+
+    def __init__(self, filename: str, config: MazeConfig, metadata: MazeMetadata, codec: str, tile_size: int):
+        super().__init__(config)
+
+        codec_id, self.compress, _ = TiledMazeFormat.codecs[codec]
+        self.tile_size = tile_size
+        self.stride = 2 * config.width - 1
+
+        self.tiles = TiledMazeFormat.get_tiles(config, tile_size)
+        self.index = []
+
+        # rows of current row of tiles
+        self.band = BitArray(tile_size * self.stride)
+        self.band_start = 0
+
+        flags = 0
+        if metadata.seed is not None:
+            flags |= TiledMazeHeader.has_seed
+
+        generator = b""
+        if metadata.generator is not None:
+            flags |= TiledMazeHeader.has_generator
+            generator = metadata.generator.encode()
+
+        self.file = open(filename, "wb")
+        self.file.write(TiledMazeHeader.layout.pack(
+            TiledMazeHeader.magic,
+            TiledMazeHeader.version,
+            flags,
+            codec_id,
+            config.width,
+            config.height,
+            tile_size,
+            len(generator),
+            metadata.seed or 0
+        ) + generator)
+
+        # index is filled after all tiles are written
+        self.index_offset = self.file.tell()
+        self.file.write(bytes(len(self.tiles) * TiledMazeHeader.index_entry.size))
+
+    def __write_band(self):
+        """Compresses and writes tiles that cover rows collected in band."""
+        for tile in self.tiles[len(self.index):]:
+            if tile.y0 != self.band_start:
+                break
+
+            data = self.compress(TiledMazeFormat.pack_tile(self.band, self.band_start, self.config, tile))
+            self.index.append(TiledMazeHeader.index_entry.pack(self.file.tell(), len(data)))
+            self.file.write(data)
+
+        self.band_start = self.rows_count + 1
+
+    def write_walls(self, walls: int, count: int):
+        self.band.set_bits((self.rows_count - self.band_start) * self.stride, count, walls)
+
+        if self.rows_count + 1 - self.band_start == self.tile_size or self.rows_count + 1 == self.config.height:
+            self.__write_band()
+
+    def finish(self):
+        if len(self.index) == len(self.tiles):
+            self.file.seek(self.index_offset)
+            self.file.write(b"".join(self.index))
+
+        self.file.close()
+
+
+class TiledMazeFormat(MazeFormat):
+    """
+    Stores maze split into square tiles. Walls of each tile are packed into bits and compressed independently,
+    offsets of compressed tiles are stored in the index after header.
+    It allows reading any region of maze by decompressing only tiles that cover it.
+    """
+
+    name = "tiled"
+    extensions = [".mazet"]
+
+    codecs = {
+        "zlib": (0, lambda data: zlib.compress(data, 9), zlib.decompress),
+        "lzma": (1, lzma.compress, lzma.decompress),
+    }
+
+    codec: str
+    tile_size: int
+
+    def __init__(self, codec: str = "zlib", tile_size: int = 256):
+        self.codec = codec
+        self.tile_size = tile_size
+
+    def is_format_of(self, prefix: bytes) -> bool:
+        return prefix.startswith(TiledMazeHeader.magic)
+
+    @staticmethod
+    def get_tiles(config: MazeConfig, tile_size: int) -> list[MazeTile]:
+        """Returns tiles that cover maze in the order they are stored in file."""
+        return [
+            MazeTile(x, y, min(x + tile_size, config.width), min(y + tile_size, config.height))
+            for y in range(0, config.height, tile_size)
+            for x in range(0, config.width, tile_size)
+        ]
+
+    @staticmethod
+    def pack_tile(walls: BitArray, first_row: int, config: MazeConfig, tile: MazeTile) -> bytes:
+        """
+        Collects walls of tile into packed bits. Given walls contain rows of maze with given config
+        starting from `first_row` laid out like in `Maze.walls`.
+        """
+        stride = 2 * config.width - 1
+
+        right_count = tile.get_right_walls_count(config)
+        down_count = tile.x1 - tile.x0
+
+        bits = BitArray(tile.get_walls_count(config))
+
+        for y in range(tile.y0, tile.y1):
+            offset = tile.get_row_offset(config, y)
+            source = (y - first_row) * stride + tile.x0
+
+            bits.set_bits(offset, right_count, walls.get_bits(source, right_count))
+
+            if y != config.height - 1:
+                source += config.width - 1
+                bits.set_bits(offset + right_count, down_count, walls.get_bits(source, down_count))
+
+        return bits.to_bytes()
+
+    @staticmethod
+    def __unpack_tile(region: Maze, x0: int, y0: int, config: MazeConfig, tile: MazeTile, bits: BitArray):
+        """
+        Copies walls of tile into region of maze with given config. Region maze contains
+        cells from [x0, x0 + region width) x [y0, y0 + region height) of the whole maze.
+        """
+        x1 = x0 + region.config.width
+        y1 = y0 + region.config.height
+
+        right_count = tile.get_right_walls_count(config)
+        region_stride = region.get_row_stride()
+
+        # columns of tile that are located inside region
+        begin = max(tile.x0, x0)
+        right_end = min(tile.x1, x1 - 1)
+        down_end = min(tile.x1, x1)
+
+        for y in range(max(tile.y0, y0), min(tile.y1, y1)):
+            offset = tile.get_row_offset(config, y)
+            target = (y - y0) * region_stride + begin - x0
+
+            region.walls.set_bits(target, right_end - begin, bits.get_bits(offset + begin - tile.x0, right_end - begin))
+
+            if y != y1 - 1:
+                offset += right_count
+                target += region.config.width - 1
+                region.walls.set_bits(target, down_end - begin, bits.get_bits(offset + begin - tile.x0, down_end - begin))
+
+    def __read_header(self, file) -> tuple[MazeConfig, MazeMetadata, int, str, list[tuple[int, int]]]:
+        """Reads header and tiles index. Returns config, metadata, tile size, codec name and tiles index."""
+        layout = TiledMazeHeader.layout
+        header = file.read(layout.size)
+
+        if len(header) != layout.size:
+            raise MazeFileInvalidException()
+
+        magic, version, flags, codec_id, width, height, tile_size, generator_length, seed = layout.unpack(header)
+
+        if magic != TiledMazeHeader.magic or version != TiledMazeHeader.version or tile_size == 0:
+            raise MazeFileInvalidException()
+
+        codecs = [name for name, (identifier, _, _) in TiledMazeFormat.codecs.items() if identifier == codec_id]
+        if len(codecs) == 0:
+            raise MazeFileInvalidException()
+
+        generator = file.read(generator_length)
+        if len(generator) != generator_length:
+            raise MazeFileInvalidException()
+
+        try:
+            generator = generator.decode() if flags & TiledMazeHeader.has_generator else None
+        except UnicodeDecodeError:
+            raise MazeFileInvalidException()
+
+        config = MazeConfig(width, height)
+        metadata = MazeMetadata(generator, seed if flags & TiledMazeHeader.has_seed else None)
+
+        tiles_count = len(TiledMazeFormat.get_tiles(config, tile_size))
+        index_entry = TiledMazeHeader.index_entry
+        index_data = file.read(tiles_count * index_entry.size)
+
+        if len(index_data) != tiles_count * index_entry.size:
+            raise MazeFileInvalidException()
+
+        index = list(index_entry.iter_unpack(index_data))
+
+        return config, metadata, tile_size, codecs[0], index
+
+    def read_region(self, filename: str, x0: int, y0: int, x1: int, y1: int) -> Maze:
+        with open(filename, "rb") as file:
+            config, _, tile_size, codec, index = self.__read_header(file)
+
+            if not (0 <= x0 < x1 <= config.width and 0 <= y0 < y1 <= config.height):
+                raise ValueError("Region must be non-empty and located inside maze.")
+
+            region = Maze(MazeConfig(x1 - x0, y1 - y0))
+            decompress = TiledMazeFormat.codecs[codec][2]
+
+            for tile, (offset, size) in zip(TiledMazeFormat.get_tiles(config, tile_size), index):
+                if tile.x1 <= x0 or tile.x0 >= x1 or tile.y1 <= y0 or tile.y0 >= y1:
+                    continue
+
+                file.seek(offset)
+
+                try:
+                    data = bytearray(decompress(file.read(size)))
+                    bits = BitArray.from_bytes(data, tile.get_walls_count(config))
+                except (zlib.error, lzma.LZMAError, ValueError):
+                    raise MazeFileInvalidException()
+
+                self.__unpack_tile(region, x0, y0, config, tile, bits)
+
+        return region
+
+    def read(self, filename: str) -> Maze:
+        with open(filename, "rb") as file:
+            config = self.__read_header(file)[0]
+
+        return self.read_region(filename, 0, 0, config.width, config.height)
+
+    def read_metadata(self, filename: str) -> MazeMetadata:
+        with open(filename, "rb") as file:
+            return self.__read_header(file)[1]
+
+    def read_config(self, filename: str) -> MazeConfig:
+        with open(filename, "rb") as file:
+            return self.__read_header(file)[0]
+
+    def open_writer(self, filename: str, config: MazeConfig, metadata: MazeMetadata) -> MazeWriter:
+        return TiledMazeWriter(filename, config, metadata, self.codec, self.tile_size)
@@ -1,5 +1,8 @@
+import random
+from typing import Optional
+
 from src.Maze import *
-from random import shuffle
+from src.MazeMetrics import MazeMetrics
 
 from src.generators.MazeGenerator import MazeGenerator
 
@@ -9,30 +12,65 @@ class DFSGenerator(MazeGenerator):
     Maze Generator that uses DFS algorithm to generate maze.
     DFS - depth-first search - means that algorithm goes in random direction as far as it can
     and only when no directions are available goes back.
+    Cells are identified by flat index `x + y * width`, so no MazePosition objects are created during generation.
     """
 
-    def generate(self, config: MazeConfig) -> Maze:
+    # masks that clear one bit of byte
+    __clear_masks = [0xFF ^ (1 << bit) for bit in range(8)]
+
+    def generate(self, config: MazeConfig, seed: Optional[int] = None,
+                 metrics: Optional[MazeMetrics] = None) -> Maze:
         maze = Maze(config)
-        used = [[False] * config.height for _ in range(config.width)]
-        history = [MazePosition(0, 0)]
+        width, height = config.width, config.height
+
+        walls = maze.walls.data
+        clear_masks = self.__clear_masks
+
+        # for each direction in order of Direction enum: offset of neighbor cell
+        # and offset of wall between cells relative to `cell + y * (width - 1)`
+        cell_offsets = [-width, 1, width, -1]
+        wall_offsets = [-width, 0, width - 1, -1]
+
+        used = bytearray(width * height)
+        history = [0]
+        push, pop = history.append, history.pop
+        shuffle = random.Random(seed).shuffle
 
-        while len(history) != 0:
-            current = history[-1]
+        # directions are shuffled exactly like list(Direction), so result is the same for the same random state
+        all_directions = list(range(len(Direction)))
+        directions = all_directions[:]
 
-            used[current.x][current.y] = True
+        peak_stack = len(history)
+        track_stack = metrics is not None
 
-            directions = list(Direction)
+        while history:
+            cell = history[-1]
+            used[cell] = 1
+
+            y, x = divmod(cell, width)
+            is_available = (y > 0, x < width - 1, y < height - 1, x > 0)
+
+            directions[:] = all_directions
             shuffle(directions)
 
             for direction in directions:
-                next_cell = current + direction.value
-                if not maze.is_inside(next_cell) or used[next_cell.x][next_cell.y]:
+                next_cell = cell + cell_offsets[direction]
+                if not is_available[direction] or used[next_cell]:
                     continue
 
-                history.append(next_cell)
-                maze.walls[maze.get_wall_index(current, direction)] = False
+                push(next_cell)
+                if track_stack and len(history) > peak_stack:
+                    peak_stack = len(history)
+
+                wall = cell + y * (width - 1) + wall_offsets[direction]
+                walls[wall >> 3] &= clear_masks[wall & 7]
                 break
             else:
-                history.pop()
+                pop()
+
+        if metrics is not None:
+            self.report_maze(maze, metrics)
+            metrics.add("generate.cells_visited", used.count(1))
+            metrics.update_peak("generate.peak_stack", peak_stack)
 
         return maze
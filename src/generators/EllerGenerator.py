@@ -0,0 +1,86 @@
+import random
+from typing import Iterator, Optional
+
+from src.DisjointSet import DisjointSet
+from src.Maze import *
+from src.MazeMetrics import MazeMetrics
+from src.generators.MazeGenerator import MazeGenerator
+
+
+class EllerGenerator(MazeGenerator):
+    """
+    Maze Generator that uses Eller's algorithm. Maze is generated row by row:
+    for each row only sets of cells connected through previous rows are stored.
+    Random walls between cells of different sets are removed, and then each set
+    goes down through at least one cell. In the last row all sets are merged.
+    It uses O(width) memory, so mazes of any height can be written directly to file.
+    """
+
+    def generate(self, config: MazeConfig, seed: Optional[int] = None,
+                 metrics: Optional[MazeMetrics] = None) -> Maze:
+        maze = Maze(config)
+
+        for y, row in enumerate(self.generate_rows(config, seed)):
+            maze.set_row_walls(y, row)
+
+        if metrics is not None:
+            self.report_maze(maze, metrics)
+
+        return maze
+
+    def generate_rows(self, config: MazeConfig, seed: Optional[int] = None) -> Iterator[int]:
+        width, height = config.width, config.height
+        random_generator = random.Random(seed)
+
+        # set label of each cell in current row, labels are less than 2 * width
+        labels = list(range(width))
+
+        for y in range(height):
+            is_last = y == height - 1
+
+            # cells of current row that have the same label are connected through previous rows
+            sets = DisjointSet(width)
+            first_cell = dict()
+
+            for x in range(width):
+                sets.union(first_cell.setdefault(labels[x], x), x)
+
+            walls = (1 << (2 * width - 1)) - 1
+            merge_bits = random_generator.getrandbits(width)
+
+            for x in range(width - 1):
+                if not is_last and not (merge_bits >> x) & 1:
+                    continue
+
+                if sets.union(x, x + 1):
+                    walls &= ~(1 << x)
+
+            if is_last:
+                yield walls & ((1 << (width - 1)) - 1)
+                break
+
+            # choose cells that go down, at least one for each set
+            down_bits = random_generator.getrandbits(width)
+            has_down = dict()
+            cells_of_set = dict()
+
+            for x in range(width):
+                root = sets.find(x)
+                cells_of_set.setdefault(root, []).append(x)
+
+                if (down_bits >> x) & 1:
+                    has_down[root] = True
+
+            for root, cells in cells_of_set.items():
+                if root not in has_down:
+                    down_bits |= 1 << random_generator.choice(cells)
+
+            for x in range(width):
+                if (down_bits >> x) & 1:
+                    walls &= ~(1 << (width - 1 + x))
+                    labels[x] = sets.find(x)
+                else:
+                    # cell without passage from above starts new set
+                    labels[x] = width + x
+
+            yield walls
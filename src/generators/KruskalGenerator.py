@@ -0,0 +1,51 @@
+import random
+from typing import Optional
+
+from src.DisjointSet import DisjointSet
+from src.Maze import *
+from src.MazeMetrics import MazeMetrics
+from src.generators.MazeGenerator import MazeGenerator
+
+
+class KruskalGenerator(MazeGenerator):
+    """
+    Maze Generator that uses randomized Kruskal's algorithm.
+    Walls are visited in random order, and wall is removed if cells on its sides are not connected yet.
+    Connectivity of cells is tracked by disjoint set union.
+    """
+
+    def generate(self, config: MazeConfig, seed: Optional[int] = None,
+                 metrics: Optional[MazeMetrics] = None) -> Maze:
+        maze = Maze(config)
+        width = config.width
+        stride = maze.get_row_stride()
+
+        cells = DisjointSet(maze.get_cells_count())
+        walls_order = list(range(maze.get_walls_count()))
+        random.Random(seed).shuffle(walls_order)
+
+        removed = 0
+        checked = 0
+        for checked, wall in enumerate(walls_order, 1):
+            y, offset = divmod(wall, stride)
+
+            if offset < width - 1:
+                first = y * width + offset
+                second = first + 1
+            else:
+                first = y * width + offset - (width - 1)
+                second = first + width
+
+            if cells.union(first, second):
+                maze.walls[wall] = False
+                removed += 1
+
+                if removed == maze.get_cells_count() - 1:
+                    break
+
+        if metrics is not None:
+            self.report_maze(maze, metrics)
+            # generation stops at the wall that completes spanning tree
+            metrics.add("generate.walls_checked", checked)
+
+        return maze
@@ -1,11 +1,37 @@
 from abc import ABC, abstractmethod
+from typing import Iterator, Optional
+
 from src.Maze import MazeConfig, Maze
+from src.MazeMetrics import MazeMetrics
 
 
 class MazeGenerator(ABC):
-    """This abstract class represents maze generation algorithms."""
+    """
+    This abstract class represents maze generation algorithms.
+    Each generation uses its own random.Random instance, so mazes generated with the same seed are equal.
+    If seed is None, random seed is used.
+    If metrics object is given, generator reports its counters into it.
+    """
 
     @abstractmethod
-    def generate(self, config: MazeConfig) -> Maze:
+    def generate(self, config: MazeConfig, seed: Optional[int] = None,
+                 metrics: Optional[MazeMetrics] = None) -> Maze:
         """Generate maze according to given config."""
         pass
+
+    @staticmethod
+    def report_maze(maze: Maze, metrics: MazeMetrics):
+        """Reports counters that are computed from generated maze: count of cells and count of removed walls."""
+        metrics.add("generate.cells", maze.get_cells_count())
+        metrics.add("generate.walls_removed", maze.get_walls_count() - maze.walls.count(True))
+
+    def generate_rows(self, config: MazeConfig, seed: Optional[int] = None) -> Iterator[int]:
+        """
+        Generate maze row by row. Each row is an integer with walls of this row (see `Maze.get_row_walls`).
+        By default, the whole maze is generated and then split into rows.
+        Generators that can produce maze row by row override this method to use less memory.
+        """
+        maze = self.generate(config, seed)
+
+        for y in range(config.height):
+            yield maze.get_row_walls(y)
@@ -0,0 +1,130 @@
+import random
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+
+from src.BitArray import BitArray
+from src.DisjointSet import DisjointSet
+from src.Maze import *
+from src.MazeMetrics import MazeMetrics
+from src.generators.MazeGenerator import MazeGenerator
+
+
+def _generate_tile(generator: MazeGenerator, width: int, height: int, seed: int) -> bytes:
+    """Generates maze for one tile in worker process and returns its packed walls."""
+    return generator.generate(MazeConfig(width, height), seed).walls.to_bytes()
+
+
+class ParallelGenerator(MazeGenerator):
+    """
+    Maze Generator that splits maze into square tiles and generates each tile with given generator
+    in separate process. Tiles are perfect mazes, so they are connected into one perfect maze by
+    random spanning tree of tiles: exactly one passage is opened between tiles connected by tree edge.
+    """
+
+    generator: MazeGenerator
+    workers: int
+    tile_size: int
+
+    def __init__(self, generator: MazeGenerator, workers: int, tile_size: int = 512):
+        if workers < 1:
+            raise ValueError("Count of workers must be positive.")
+
+        if tile_size < 1:
+            raise ValueError("Tile size must be positive.")
+
+        self.generator = generator
+        self.workers = workers
+        self.tile_size = tile_size
+
+    def generate(self, config: MazeConfig, seed: Optional[int] = None,
+                 metrics: Optional[MazeMetrics] = None) -> Maze:
+        maze = Maze(config)
+        tile_size = self.tile_size
+        random_generator = random.Random(seed)
+
+        columns = (config.width + tile_size - 1) // tile_size
+        rows = (config.height + tile_size - 1) // tile_size
+
+        tiles = [
+            (x, y, min(tile_size, config.width - x), min(tile_size, config.height - y))
+            for y in range(0, config.height, tile_size)
+            for x in range(0, config.width, tile_size)
+        ]
+
+        # each tile gets its own seed derived from the maze seed
+        seeds = [random_generator.getrandbits(64) for _ in tiles]
+
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            results = executor.map(
+                _generate_tile,
+                [self.generator] * len(tiles),
+                [width for _, _, width, _ in tiles],
+                [height for _, _, _, height in tiles],
+                seeds,
+                chunksize=max(1, len(tiles) // (self.workers * 4))
+            )
+
+            for (x0, y0, width, height), data in zip(tiles, results):
+                tile = Maze(MazeConfig(width, height), BitArray())
+                tile.walls = BitArray.from_bytes(bytearray(data), tile.get_walls_count())
+                self.__place_tile(maze, x0, y0, tile)
+
+        self.__connect_tiles(maze, columns, rows, random_generator)
+
+        if metrics is not None:
+            # tiles are generated in other processes, so only counters of the whole maze are reported
+            self.report_maze(maze, metrics)
+            metrics.add("generate.tiles", len(tiles))
+
+        return maze
+
+    @staticmethod
+    def __place_tile(maze: Maze, x0: int, y0: int, tile: Maze):
+        """Copies walls of tile into maze. Walls between tiles are left untouched."""
+        stride = maze.get_row_stride()
+        tile_stride = tile.get_row_stride()
+        width = tile.config.width
+
+        for y in range(tile.config.height):
+            source = y * tile_stride
+            target = (y0 + y) * stride + x0
+
+            maze.walls.set_bits(target, width - 1, tile.walls.get_bits(source, width - 1))
+
+            if y != tile.config.height - 1:
+                source += width - 1
+                target += maze.config.width - 1
+                maze.walls.set_bits(target, width, tile.walls.get_bits(source, width))
+
+    def __connect_tiles(self, maze: Maze, columns: int, rows: int, random_generator: random.Random):
+        """Opens one random passage for each edge of random spanning tree of tiles."""
+        tile_size = self.tile_size
+        config = maze.config
+
+        # edges between neighboring tiles: (tile index, is horizontal neighbor)
+        edges = [(index, True) for index in range(columns * rows) if index % columns != columns - 1]
+        edges += [(index, False) for index in range(columns * (rows - 1))]
+        random_generator.shuffle(edges)
+
+        tiles = DisjointSet(columns * rows)
+
+        for index, is_horizontal in edges:
+            neighbor = index + 1 if is_horizontal else index + columns
+
+            if not tiles.union(index, neighbor):
+                continue
+
+            y0, x0 = divmod(index, columns)
+            x0 *= tile_size
+            y0 *= tile_size
+
+            if is_horizontal:
+                y = random_generator.randrange(y0, min(y0 + tile_size, config.height))
+                cell = MazePosition(x0 + tile_size - 1, y)
+                direction = Direction.RIGHT
+            else:
+                x = random_generator.randrange(x0, min(x0 + tile_size, config.width))
+                cell = MazePosition(x, y0 + tile_size - 1)
+                direction = Direction.DOWN
+
+            maze.walls[maze.get_wall_index(cell, direction)] = False
@@ -1,6 +1,8 @@
 import random
+from typing import Optional
 
 from src.Maze import *
+from src.MazeMetrics import MazeMetrics
 from src.generators.MazeGenerator import MazeGenerator
 
 
@@ -8,42 +10,69 @@ class SpanningTreeGenerator(MazeGenerator):
     """
     Maze Generator that uses something like Spanning Tree search algorithm to generate maze.
     This algorithm in each step visits one cell that is adjacent to already visited ones.
+    Frontier of visited cells is stored in unordered list, so random element is removed from it
+    in constant time by replacing it with the last one.
     """
 
-    def generate(self, config: MazeConfig) -> Maze:
+    # masks that clear one bit of byte
+    __clear_masks = [0xFF ^ (1 << bit) for bit in range(8)]
+
+    def generate(self, config: MazeConfig, seed: Optional[int] = None,
+                 metrics: Optional[MazeMetrics] = None) -> Maze:
         maze = Maze(config)
+        width, height = config.width, config.height
+
+        walls = maze.walls.data
+        clear_masks = self.__clear_masks
+
+        # for each direction in order of Direction enum: offset of neighbor cell
+        # and offset of wall between cells relative to `cell + y * (width - 1)`
+        cell_offsets = [-width, 1, width, -1]
+        wall_offsets = [-width, 0, width - 1, -1]
 
-        directions = list(Direction)
-        used = [[False] * config.height for _ in range(config.width)]
+        used = bytearray(width * height)
+        randrange = random.Random(seed).randrange
 
-        random_point = MazePosition(
-            x=random.randrange(0, config.width),
-            y=random.randrange(0, config.height)
-        )
+        random_cell = randrange(0, width * height)
+        used[random_cell] = 1
 
-        adjacent = [
-            (random_point, Direction.UP),
-        ]
+        # frontier: cells adjacent to visited ones and walls that separate them from visited cells
+        adjacent_cells = [random_cell]
+        adjacent_walls = [-1]
+        peak_frontier = 1
 
-        used[random_point.x][random_point.y] = True
+        while adjacent_cells:
+            random_index = randrange(0, len(adjacent_cells))
 
-        while len(adjacent) != 0:
-            random_index = random.randrange(0, len(adjacent))
-            adj_cell, adj_direction = adjacent[random_index]
+            cell = adjacent_cells[random_index]
+            wall = adjacent_walls[random_index]
 
-            adjacent.remove((adj_cell, adj_direction))
+            adjacent_cells[random_index] = adjacent_cells[-1]
+            adjacent_walls[random_index] = adjacent_walls[-1]
+            adjacent_cells.pop()
+            adjacent_walls.pop()
 
-            wall_index = maze.get_wall_index(adj_cell, adj_direction)
+            if wall >= 0:
+                walls[wall >> 3] &= clear_masks[wall & 7]
 
-            if wall_index >= 0:
-                maze.walls[wall_index] = False
+            y, x = divmod(cell, width)
+            is_available = (y > 0, x < width - 1, y < height - 1, x > 0)
 
-            for direction in directions:
-                next_cell = adj_cell - direction.value
-                if not maze.is_inside(next_cell) or used[next_cell.x][next_cell.y]:
+            for direction in range(4):
+                next_cell = cell + cell_offsets[direction]
+                if not is_available[direction] or used[next_cell]:
                     continue
 
-                used[next_cell.x][next_cell.y] = True
-                adjacent.append((next_cell, direction))
+                used[next_cell] = 1
+                adjacent_cells.append(next_cell)
+                adjacent_walls.append(cell + y * (width - 1) + wall_offsets[direction])
+
+            if len(adjacent_cells) > peak_frontier:
+                peak_frontier = len(adjacent_cells)
+
+        if metrics is not None:
+            self.report_maze(maze, metrics)
+            metrics.add("generate.cells_visited", used.count(1))
+            metrics.update_peak("generate.peak_frontier", peak_frontier)
 
         return maze
@@ -0,0 +1,20 @@
+from abc import ABC, abstractmethod
+from typing import Iterable
+
+import numpy as np
+
+
+class ImageFormat(ABC):
+    """
+    This abstract class represents image file format. Images are written row by row,
+    so only one row of pixels is kept in memory. Pixels are indices of colors in palette.
+    """
+
+    name: str
+    extensions: list[str]
+
+    @abstractmethod
+    def write(self, filename: str, width: int, height: int, rows: Iterable[np.ndarray],
+              palette: list[tuple[int, int, int]]):
+        """Write image with given size. Each row is array of `width` palette indices with dtype uint8."""
+        pass
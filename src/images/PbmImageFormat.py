@@ -0,0 +1,25 @@
+from typing import Iterable
+
+import numpy as np
+
+from src.images.ImageFormat import ImageFormat
+
+
+class PbmImageFormat(ImageFormat):
+    """
+    Writes binary PBM images (P4): one bit per pixel, 1 is black.
+    PBM has no colors, so pixels with dark palette colors are black and all other pixels are white.
+    """
+
+    name = "pbm"
+    extensions = [".pbm"]
+
+    def write(self, filename: str, width: int, height: int, rows: Iterable[np.ndarray],
+              palette: list[tuple[int, int, int]]):
+        is_black = np.array([sum(color) < 3 * 128 for color in palette], dtype=bool)
+
+        with open(filename, "wb") as file:
+            file.write(f"P4\n{width} {height}\n".encode())
+
+            for row in rows:
+                file.write(np.packbits(is_black[row]).tobytes())
@@ -0,0 +1,74 @@
+import struct
+import zlib
+from typing import Iterable
+
+import numpy as np
+
+from src.images.ImageFormat import ImageFormat
+
+
+class PngImageFormat(ImageFormat):
+    """
+    Writes PNG images with palette. Pixels are packed into the smallest bit depth that fits palette,
+    rows are compressed by zlib as they come and compressed data is written in chunks of `chunk_size` bytes.
+    Maze images are compressed well even with the fastest compression level, so it is used by default.
+    """
+
+    name = "png"
+    extensions = [".png"]
+
+    signature = b"\x89PNG\r\n\x1a\n"
+    chunk_size = 1 << 16
+
+    compression_level: int
+
+    def __init__(self, compression_level: int = 1):
+        self.compression_level = compression_level
+
+    @staticmethod
+    def __write_chunk(file, chunk_type: bytes, data: bytes):
+        file.write(struct.pack(">I", len(data)) + chunk_type + data)
+        file.write(struct.pack(">I", zlib.crc32(chunk_type + data)))
+
+    @staticmethod
+    def __pack_row(row: np.ndarray, bit_depth: int) -> bytes:
+        """Packs palette indices of row into bytes with given count of bits per pixel."""
+        if bit_depth == 8:
+            return row.tobytes()
+
+        per_byte = 8 // bit_depth
+        padded = np.zeros((len(row) + per_byte - 1) // per_byte * per_byte, dtype=np.uint8)
+        padded[:len(row)] = row
+        padded = padded.reshape(-1, per_byte)
+
+        # the first pixel goes into the most significant bits
+        packed = np.zeros(len(padded), dtype=np.uint8)
+        for index in range(per_byte):
+            packed |= padded[:, index] << (8 - bit_depth * (index + 1))
+
+        return packed.tobytes()
+
+    def write(self, filename: str, width: int, height: int, rows: Iterable[np.ndarray],
+              palette: list[tuple[int, int, int]]):
+        bit_depth = next(depth for depth in [1, 2, 4, 8] if len(palette) <= 1 << depth)
+        compressor = zlib.compressobj(self.compression_level)
+        buffer = bytearray()
+
+        with open(filename, "wb") as file:
+            file.write(self.signature)
+
+            # header: size, bit depth, color type 3 (palette), default compression, filter and interlace methods
+            self.__write_chunk(file, b"IHDR", struct.pack(">IIBBBBB", width, height, bit_depth, 3, 0, 0, 0))
+            self.__write_chunk(file, b"PLTE", b"".join(bytes(color) for color in palette))
+
+            for row in rows:
+                # each row starts with filter type, 0 means no filter
+                buffer += compressor.compress(b"\x00" + self.__pack_row(row, bit_depth))
+
+                if len(buffer) >= self.chunk_size:
+                    self.__write_chunk(file, b"IDAT", bytes(buffer))
+                    buffer.clear()
+
+            buffer += compressor.flush()
+            self.__write_chunk(file, b"IDAT", bytes(buffer))
+            self.__write_chunk(file, b"IEND", b"")
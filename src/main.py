@@ -1,4 +1,11 @@
 import argparse
+import sys
+
+from src.Profiler import profiler
+from src.actions.AnalyzeAction import AnalyzeAction
+from src.actions.BatchGenerateAction import BatchGenerateAction
+from src.actions.BenchAction import BenchAction
+from src.actions.ExportAction import ExportAction
 from src.actions.GenerateAction import GenerateAction
 from src.actions.PrintAction import PrintAction
 from src.actions.SolveAction import SolveAction
@@ -9,17 +16,33 @@ if __name__ == "__main__":
         description='This program generates and manages mazes.'
     )
 
+    parser.add_argument('--profile', dest="profile", action="store_true",
+                        help='Print time of action phases into stderr.')
+    parser.add_argument('--profile-output', dest="profile_output", type=str, required=False,
+                        help='File to store cProfile statistics to. Implies --profile.')
+    parser.add_argument('--profile-memory', dest="profile_memory", action="store_true",
+                        help='Also measure peak memory with tracemalloc (slows program down). Implies --profile.')
+
     subparsers = parser.add_subparsers(dest='action')
     subparsers.required = True
 
-    actions = [GenerateAction, PrintAction, SolveAction]
+    actions = [GenerateAction, BatchGenerateAction, PrintAction, SolveAction, AnalyzeAction, ExportAction, BenchAction]
 
     for action in actions:
         action.add_subparser(subparsers)
 
     args = parser.parse_args()
 
-    for action in actions:
-        if action.name == args.action:
-            action.handle(args)
-            break
+    if args.profile or args.profile_output is not None or args.profile_memory:
+        profiler.start(args.profile_output, args.profile_memory)
+
+    try:
+        for action in actions:
+            if action.name == args.action:
+                action.handle(args)
+                break
+    finally:
+        if profiler.enabled:
+            profiler.stop()
+            # summary goes to stderr, so output of action stays unchanged
+            print("\n".join(profiler.get_summary()), file=sys.stderr)
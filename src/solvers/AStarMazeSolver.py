@@ -0,0 +1,56 @@
+from array import array
+from heapq import heappop, heappush
+from typing import Optional
+
+from src.Maze import Maze, MazePosition
+from src.solvers.MazeSolver import MazeSolver, UnsolvableMazeException
+
+
+class AStarMazeSolver(MazeSolver):
+    """
+    Use A* algorithm to find solution for any maze.
+    Cells are visited in order of path length from begin plus Manhattan distance to end,
+    so search goes towards the end and visits fewer cells than BFS in mazes with loops and open regions.
+    Manhattan distance never overestimates path length, so found path is the shortest one.
+    """
+
+    @staticmethod
+    def solve(maze: Maze, begin: Optional[MazePosition] = None,
+              end: Optional[MazePosition] = None) -> list[MazePosition]:
+        begin, end = MazeSolver.get_endpoints(maze, begin, end)
+        width = maze.config.width
+        end_y, end_x = divmod(end, width)
+
+        typecode = "i" if maze.get_cells_count() < 2 ** 31 else "q"
+        prev = array(typecode, [-1]) * maze.get_cells_count()
+        distances = array(typecode, [-1]) * maze.get_cells_count()
+
+        prev[begin] = begin
+        distances[begin] = 0
+
+        # among cells with equal estimate, cells that are further from begin are visited first
+        begin_y, begin_x = divmod(begin, width)
+        heap = [(abs(begin_x - end_x) + abs(begin_y - end_y), 0, begin)]
+
+        while heap:
+            _, distance, cell = heappop(heap)
+            distance = -distance
+
+            if cell == end:
+                return MazeSolver.build_path(width, prev, begin, end)
+
+            if distance != distances[cell]:
+                # cell was already reached by shorter path
+                continue
+
+            distance += 1
+
+            for neighbor in MazeSolver.get_neighbors(maze, cell):
+                if distances[neighbor] == -1 or distance < distances[neighbor]:
+                    distances[neighbor] = distance
+                    prev[neighbor] = cell
+
+                    y, x = divmod(neighbor, width)
+                    heappush(heap, (distance + abs(x - end_x) + abs(y - end_y), -distance, neighbor))
+
+        raise UnsolvableMazeException()
@@ -1,85 +1,118 @@
+from array import array
+from collections import deque
 from typing import Optional
 
-from src.Maze import Maze, MazePosition, Direction
+from src.Maze import Maze, MazePosition
+from src.MazeMetrics import MazeMetrics
+from src.solvers.MazeSolver import MazeSolver, UnsolvableMazeException
 
 
-class UnsolvableMazeException(Exception):
-    """Exception raised when you try to solve a maze that has no solution."""
-
-    def __init__(self):
-        super().__init__("Maze has no solution.")
-
-
-class BFSMazeSolver:
+class BFSMazeSolver(MazeSolver):
     """
     Use BFS algorithm to find solution for any maze.
     BFS - breadth-first search - visit each neighbor and only then go deeper.
+    Cells are identified by flat index `x + y * width` and walls are read directly from packed wall bits,
+    so no MazePosition objects are created during search.
+    Cells are taken from queue layer by layer, so layers are counted without checks for each cell.
     """
 
     @staticmethod
-    def calculate_prev_cells(maze: Maze, begin: MazePosition, end: MazePosition) -> Optional[list[MazePosition]]:
+    def calculate_prev_cells(maze: Maze, begin: int, end: int,
+                             metrics: Optional[MazeMetrics] = None) -> Optional[array]:
         """
         This method go through all cells in maze using BFS
-        and for each cell store position from which it gets to this cell.
+        and for each cell store index of cell from which it gets to this cell (-1 for unvisited cells).
+        Search stops as soon as `end` is reached. None is returned if `end` is unreachable.
+        If metrics object is given, count of visited cells, peak size of queue and count of layers are reported.
+        Peak size of queue is checked after each cell only if metrics are requested.
         """
-
-        stack = [begin]
-        prev = [MazePosition.none()] * maze.get_cells_count()
-        prev[0] = begin
-
-        used_count = 1
-
-        while used_count < maze.get_cells_count():
-            new_stack = []
-
-            for cell in stack:
-                for direction in Direction:
-                    new_cell = cell + direction.value
-                    index = new_cell.x + new_cell.y * maze.config.width
-
-                    if index < 0 or index >= maze.get_cells_count():
-                        continue
-
-                    is_used = prev[index] != MazePosition.none()
-                    if maze.has_wall(cell, direction) or is_used:
-                        continue
-
-                    prev[index] = cell
-                    if new_cell == end:
-                        return prev
-
-                    new_stack.append(new_cell)
-                    used_count += 1
-
-            stack = new_stack
-
-            if len(stack) == 0:
-                break
-
-        return None
+        width, height = maze.config.width, maze.config.height
+        walls = maze.walls.data
+        gap = width - 1
+
+        prev = array("i" if maze.get_cells_count() < 2 ** 31 else "q", [-1]) * maze.get_cells_count()
+        prev[begin] = begin
+
+        queue = deque([begin] if begin != end else [])
+        push, pop = queue.append, queue.popleft
+
+        layers = 0
+        peak_frontier = len(queue)
+        track_frontier = metrics is not None
+
+        while queue:
+            layers += 1
+
+            for _ in range(len(queue)):
+                cell = pop()
+                y, x = divmod(cell, width)
+
+                # index of the wall to the right of cell, other walls are located at fixed offsets from it
+                right_wall = cell + y * gap
+
+                # neighbors are visited in order of Direction enum: up, right, down, left
+                if y > 0:
+                    wall = right_wall - width
+                    if not (walls[wall >> 3] >> (wall & 7)) & 1 and prev[cell - width] == -1:
+                        prev[cell - width] = cell
+                        if cell - width == end:
+                            break
+                        push(cell - width)
+
+                if x < gap:
+                    wall = right_wall
+                    if not (walls[wall >> 3] >> (wall & 7)) & 1 and prev[cell + 1] == -1:
+                        prev[cell + 1] = cell
+                        if cell + 1 == end:
+                            break
+                        push(cell + 1)
+
+                if y < height - 1:
+                    wall = right_wall + gap
+                    if not (walls[wall >> 3] >> (wall & 7)) & 1 and prev[cell + width] == -1:
+                        prev[cell + width] = cell
+                        if cell + width == end:
+                            break
+                        push(cell + width)
+
+                if x > 0:
+                    wall = right_wall - 1
+                    if not (walls[wall >> 3] >> (wall & 7)) & 1 and prev[cell - 1] == -1:
+                        prev[cell - 1] = cell
+                        if cell - 1 == end:
+                            break
+                        push(cell - 1)
+
+                # queue holds the rest of current layer and the part of the next one
+                if track_frontier and len(queue) > peak_frontier:
+                    peak_frontier = len(queue)
+            else:
+                continue
+
+            # end is reached
+            break
+
+        if metrics is not None:
+            metrics.add("solve.cells_visited", len(prev) - prev.count(-1))
+            # search could stop right after cells were pushed
+            metrics.update_peak("solve.peak_frontier", max(peak_frontier, len(queue)))
+            metrics.add("solve.layers", layers)
+
+        return prev if prev[end] != -1 else None
 
     @staticmethod
-    def solve(maze: Maze) -> Optional[list[MazePosition]]:
+    def solve(maze: Maze, begin: Optional[MazePosition] = None, end: Optional[MazePosition] = None,
+              metrics: Optional[MazeMetrics] = None) -> list[MazePosition]:
         """
         This method solves maze.
         It uses `calculate_prev_cells` method that calculates BFS path in maze,
-        and then using this information build a path from start to end.
+        and then using this information build a path from end to start.
         By default, start is (0, 0), end is (width - 1, height - 1)
         """
-
-        path_begin = MazePosition(0, 0)
-        path_end = MazePosition(maze.config.width - 1, maze.config.height - 1)
-        prev = BFSMazeSolver.calculate_prev_cells(maze, path_begin, path_end)
+        begin_index, end_index = MazeSolver.get_endpoints(maze, begin, end)
+        prev = BFSMazeSolver.calculate_prev_cells(maze, begin_index, end_index, metrics)
 
         if prev is None:
             raise UnsolvableMazeException()
 
-        result = []
-        current = path_end
-        while current != path_begin:
-            result.append(current)
-            current = prev[current.x + current.y * maze.config.width]
-
-        result.append(path_begin)
-
-        return result
+        return MazeSolver.build_path(maze.config.width, prev, begin_index, end_index)
@@ -0,0 +1,113 @@
+from array import array
+from collections import deque
+from typing import Optional
+
+import numpy as np
+
+from src.Maze import Maze, MazePosition, Direction
+from src.MazeArrays import MazeArrays
+from src.solvers.MazeSolver import MazeSolver, UnsolvableMazeException
+
+
+class DeadEndFillingMazeSolver(MazeSolver):
+    """
+    Use dead-end filling to find solution for any maze.
+    Cells with at most one open passage (except path endpoints) are filled until there are no such cells,
+    so only cells of paths between endpoints remain. Each step fills all dead ends of the maze at once
+    with NumPy array operations. When only a few dead ends are filled per step, the rest is filled
+    with a queue: each cell is filled in O(1), but with Python code per cell.
+    Path is then found by BFS over remaining cells, which is just a walk along the path for perfect mazes.
+    """
+
+    # vectorized steps are used while each of them fills at least `1 / queue_threshold` of all cells
+    queue_threshold = 128
+
+    @staticmethod
+    def __fill_vectorized(passages: list[np.ndarray], alive: np.ndarray, degree: np.ndarray,
+                          keep: np.ndarray, min_filled: int) -> np.ndarray:
+        """Fills dead ends step by step and returns dead ends of the last step that is too small."""
+        while True:
+            leaves = alive & (degree <= 1) & ~keep
+
+            if np.count_nonzero(leaves) < min_filled:
+                return leaves
+
+            alive &= ~leaves
+
+            # neighbors of filled cells lose one passage
+            up, right, down, left = (leaves & passage for passage in passages)
+            degree[:-1, :] -= up[1:, :]
+            degree[:, 1:] -= right[:, :-1]
+            degree[1:, :] -= down[:-1, :]
+            degree[:, :-1] -= left[:, 1:]
+
+    @staticmethod
+    def __fill_queue(maze: Maze, mask: bytes, alive: bytearray, degree: array, keep: tuple[int, int],
+                     leaves: np.ndarray):
+        """Fills dead ends one by one, starting from given dead ends."""
+        width = maze.config.width
+        offsets = [(1 << Direction.index_by_value(direction.value), direction.value.x + direction.value.y * width)
+                   for direction in Direction]
+
+        queue = deque(np.flatnonzero(leaves).tolist())
+        push, pop = queue.append, queue.popleft
+
+        while queue:
+            cell = pop()
+
+            if not alive[cell]:
+                continue
+
+            alive[cell] = 0
+            passages = mask[cell]
+
+            for bit, offset in offsets:
+                neighbor = cell + offset
+
+                if passages & bit and alive[neighbor]:
+                    degree[neighbor] -= 1
+
+                    if degree[neighbor] <= 1 and neighbor not in keep:
+                        push(neighbor)
+
+    @staticmethod
+    def solve(maze: Maze, begin: Optional[MazePosition] = None,
+              end: Optional[MazePosition] = None) -> list[MazePosition]:
+        begin, end = MazeSolver.get_endpoints(maze, begin, end)
+        width, height = maze.config.width, maze.config.height
+
+        arrays = MazeArrays.from_maze(maze)
+        passages = [arrays.passages(direction) for direction in Direction]
+
+        degree = np.zeros((height, width), dtype=np.int32)
+        for passage in passages:
+            degree += passage
+
+        alive = np.ones((height, width), dtype=bool)
+        keep = np.zeros((height, width), dtype=bool)
+        keep.flat[[begin, end]] = True
+
+        min_filled = max(1, maze.get_cells_count() // DeadEndFillingMazeSolver.queue_threshold)
+        leaves = DeadEndFillingMazeSolver.__fill_vectorized(passages, alive, degree, keep, min_filled)
+
+        alive = bytearray(alive.tobytes())
+        degree = array("i", degree.tobytes())
+        DeadEndFillingMazeSolver.__fill_queue(maze, arrays.passage_mask().tobytes(), alive, degree, (begin, end),
+                                              leaves)
+
+        # BFS over cells that are left after filling
+        prev = {begin: begin}
+        queue = deque([begin])
+
+        while queue and end not in prev:
+            cell = queue.popleft()
+
+            for neighbor in MazeSolver.get_neighbors(maze, cell):
+                if alive[neighbor] and neighbor not in prev:
+                    prev[neighbor] = cell
+                    queue.append(neighbor)
+
+        if end not in prev:
+            raise UnsolvableMazeException()
+
+        return MazeSolver.build_path(width, prev, begin, end)
@@ -0,0 +1,160 @@
+import numpy as np
+
+from src.Maze import Maze, MazePosition
+from src.solvers.MazeSolver import MazeSolver
+
+
+class NotPerfectMazeException(Exception):
+    """Exception raised when you try to build path index for a maze that is not a tree."""
+
+    def __init__(self):
+        super().__init__("Maze is not perfect: it has loops or unreachable cells.")
+
+
+class MazePathIndex:
+    """
+    Index that answers path queries in perfect maze. Perfect maze is a tree, so path between two cells is unique
+    and goes through their lowest common ancestor (LCA) in the tree rooted at cell (0, 0).
+    Index stores depth of every cell and its 2^k-th ancestors (binary lifting), so distance between
+    any two cells is found in O(log n) and path in O(log n + path length).
+    Cells are identified by flat index `x + y * width`. Cells outside maze raise ValueError.
+    """
+
+    width: int
+    height: int
+    depths: np.ndarray
+    ancestors: list[np.ndarray]
+
+    def __init__(self, maze: Maze):
+        if maze.walls.count(False) != maze.get_cells_count() - 1:
+            raise NotPerfectMazeException()
+
+        self.width = maze.config.width
+        self.height = maze.config.height
+
+        parents, depths = MazeSolver.get_shortest_path_tree(maze, 0)
+
+        # maze has exactly `cells - 1` passages, so it is a tree if and only if it is connected
+        if -1 in depths:
+            raise NotPerfectMazeException()
+
+        parents = np.frombuffer(parents, dtype=parents.typecode)
+        self.depths = np.frombuffer(depths, dtype=depths.typecode)
+
+        # ancestors[k][cell] is ancestor of cell 2^k levels above it, root is ancestor of itself
+        self.ancestors = [parents]
+        for _ in range(1, max(1, int(self.depths.max()).bit_length())):
+            self.ancestors.append(self.ancestors[-1][self.ancestors[-1]])
+
+    def __get_cell(self, position: MazePosition) -> int:
+        """Returns flat index of cell at given position."""
+        if not (0 <= position.x < self.width and 0 <= position.y < self.height):
+            raise ValueError("Path endpoints must be located inside maze.")
+
+        return position.x + position.y * self.width
+
+    def __check_cells(self, *cells: np.ndarray):
+        """Checks that all flat indices are indices of maze cells."""
+        for values in cells:
+            if values.size and (values.min() < 0 or values.max() >= self.width * self.height):
+                raise ValueError("Path endpoints must be located inside maze.")
+
+    def __lift(self, cell: int, levels: int) -> int:
+        """Returns ancestor of cell that is given count of levels above it."""
+        level = 0
+
+        while levels:
+            if levels & 1:
+                cell = int(self.ancestors[level][cell])
+
+            levels >>= 1
+            level += 1
+
+        return cell
+
+    def get_lca(self, first: int, second: int) -> int:
+        """Returns lowest common ancestor of two cells given by flat indices."""
+        self.__check_cells(np.array([first, second]))
+
+        if self.depths[first] < self.depths[second]:
+            first, second = second, first
+
+        first = self.__lift(first, int(self.depths[first] - self.depths[second]))
+
+        if first == second:
+            return first
+
+        for ancestors in reversed(self.ancestors):
+            if ancestors[first] != ancestors[second]:
+                first, second = int(ancestors[first]), int(ancestors[second])
+
+        return int(self.ancestors[0][first])
+
+    def get_distance(self, begin: MazePosition, end: MazePosition) -> int:
+        """Returns count of moves in path between two cells."""
+        first = self.__get_cell(begin)
+        second = self.__get_cell(end)
+
+        return int(self.depths[first] + self.depths[second] - 2 * self.depths[self.get_lca(first, second)])
+
+    def get_path(self, begin: MazePosition, end: MazePosition) -> list[MazePosition]:
+        """Returns path between two cells in the same order as `BFSMazeSolver.solve`: from end to begin."""
+        width = self.width
+        parents = self.ancestors[0]
+
+        first = self.__get_cell(begin)
+        second = self.__get_cell(end)
+        lca = self.get_lca(first, second)
+
+        result = []
+        current = second
+        while current != lca:
+            result.append(MazePosition(current % width, current // width))
+            current = int(parents[current])
+
+        tail = []
+        current = first
+        while current != lca:
+            tail.append(MazePosition(current % width, current // width))
+            current = int(parents[current])
+
+        result.append(MazePosition(lca % width, lca // width))
+        result.extend(reversed(tail))
+
+        return result
+
+    def get_lcas(self, first: np.ndarray, second: np.ndarray) -> np.ndarray:
+        """Returns lowest common ancestors for arrays of cell pairs. All pairs are processed at once."""
+        depths = self.depths
+        first = np.asarray(first)
+        second = np.asarray(second)
+        self.__check_cells(first, second)
+
+        swap = depths[first] < depths[second]
+        first, second = np.where(swap, second, first), np.where(swap, first, second)
+
+        difference = depths[first] - depths[second]
+        for level, ancestors in enumerate(self.ancestors):
+            first = np.where((difference >> level) & 1 == 1, ancestors[first], first)
+
+        for ancestors in reversed(self.ancestors):
+            first_ancestors, second_ancestors = ancestors[first], ancestors[second]
+            differs = first_ancestors != second_ancestors
+            first = np.where(differs, first_ancestors, first)
+            second = np.where(differs, second_ancestors, second)
+
+        return np.where(first == second, first, self.ancestors[0][first])
+
+    def get_distances(self, begins: np.ndarray, ends: np.ndarray) -> np.ndarray:
+        """
+        Returns path lengths for arrays of cell pairs given by flat indices.
+        It is much faster than calling `get_distance` for each pair.
+        """
+        begins = np.asarray(begins)
+        ends = np.asarray(ends)
+        depths = self.depths
+
+        # cells are checked by `get_lcas`
+        lcas = self.get_lcas(begins, ends)
+
+        return depths[begins] + depths[ends] - 2 * depths[lcas]
@@ -0,0 +1,122 @@
+from abc import ABC, abstractmethod
+from array import array
+from collections import deque
+from typing import Optional, Sequence
+
+from src.Maze import Maze, MazePosition
+
+
+class UnsolvableMazeException(Exception):
+    """Exception raised when you try to solve a maze that has no solution."""
+
+    def __init__(self):
+        super().__init__("Maze has no solution.")
+
+
+class MazeSolver(ABC):
+    """
+    This abstract class represents maze solving algorithms.
+    Solvers find path between two cells, by default from the top left to the bottom right corner.
+    Cells are identified by flat index `x + y * width` during search.
+    """
+
+    @staticmethod
+    @abstractmethod
+    def solve(maze: Maze, begin: Optional[MazePosition] = None,
+              end: Optional[MazePosition] = None) -> list[MazePosition]:
+        """
+        Finds shortest path between given cells and returns it from end to begin.
+        Raises UnsolvableMazeException if there is no path.
+        """
+        pass
+
+    @staticmethod
+    def get_endpoints(maze: Maze, begin: Optional[MazePosition], end: Optional[MazePosition]) -> tuple[int, int]:
+        """Returns flat indices of path endpoints, missing endpoints are replaced with the maze corners."""
+        width = maze.config.width
+
+        begin = begin if begin is not None else MazePosition(0, 0)
+        end = end if end is not None else MazePosition(width - 1, maze.config.height - 1)
+
+        if not maze.is_inside(begin) or not maze.is_inside(end):
+            raise ValueError("Path endpoints must be located inside maze.")
+
+        return begin.x + begin.y * width, end.x + end.y * width
+
+    @staticmethod
+    def get_neighbors(maze: Maze, cell: int) -> list[int]:
+        """Returns cells that are reachable from given cell in one move, in order of Direction enum."""
+        width = maze.config.width
+        walls = maze.walls.data
+
+        y, x = divmod(cell, width)
+        right_wall = cell + y * (width - 1)
+        up, down, left = right_wall - width, right_wall + width - 1, right_wall - 1
+
+        neighbors = []
+
+        if y > 0 and not (walls[up >> 3] >> (up & 7)) & 1:
+            neighbors.append(cell - width)
+
+        if x < width - 1 and not (walls[right_wall >> 3] >> (right_wall & 7)) & 1:
+            neighbors.append(cell + 1)
+
+        if y < maze.config.height - 1 and not (walls[down >> 3] >> (down & 7)) & 1:
+            neighbors.append(cell + width)
+
+        if x > 0 and not (walls[left >> 3] >> (left & 7)) & 1:
+            neighbors.append(cell - 1)
+
+        return neighbors
+
+    @staticmethod
+    def get_shortest_path_tree(maze: Maze, begin: int) -> tuple[array, array]:
+        """
+        Runs BFS over the whole maze from given cell. Returns previous cell on the shortest path from begin
+        and length of this path for each cell. Begin is previous cell of itself, unreachable cells have -1 in both.
+        """
+        width, height = maze.config.width, maze.config.height
+        walls = maze.walls.data
+        gap = width - 1
+
+        typecode = "i" if maze.get_cells_count() < 2 ** 31 else "q"
+        prev = array(typecode, [-1]) * maze.get_cells_count()
+        distances = array(typecode, [-1]) * maze.get_cells_count()
+        prev[begin] = begin
+        distances[begin] = 0
+
+        queue = deque([begin])
+        push, pop = queue.append, queue.popleft
+
+        while queue:
+            cell = pop()
+            y, x = divmod(cell, width)
+            right_wall = cell + y * gap
+            distance = distances[cell] + 1
+
+            for neighbor, wall, is_inside in (
+                (cell - width, right_wall - width, y > 0),
+                (cell + 1, right_wall, x < gap),
+                (cell + width, right_wall + gap, y < height - 1),
+                (cell - 1, right_wall - 1, x > 0)
+            ):
+                if is_inside and not (walls[wall >> 3] >> (wall & 7)) & 1 and distances[neighbor] == -1:
+                    prev[neighbor] = cell
+                    distances[neighbor] = distance
+                    push(neighbor)
+
+        return prev, distances
+
+    @staticmethod
+    def build_path(width: int, prev: Sequence[int], begin: int, end: int) -> list[MazePosition]:
+        """Builds path from end to begin using index of previous cell for each cell of path."""
+        result = []
+
+        current = end
+        while current != begin:
+            result.append(MazePosition(current % width, current // width))
+            current = prev[current]
+
+        result.append(MazePosition(begin % width, begin // width))
+
+        return result
@@ -1,26 +1,58 @@
 import unittest
 
+from unit.actions.ActionTests import ActionTests
+from unit.actions.BatchGenerateActionTests import BatchGenerateActionTests
+from unit.benchmark.BenchmarkTests import BenchmarkTests
+from unit.benchmark.ProfilerTests import ProfilerTests
+from unit.drawers.RasterMazeDrawerTests import RasterMazeDrawerTests
+from unit.drawers.TextMazeDrawerTests import TextMazeDrawerTests
 from unit.file_manager.FileManagerTests import FileManagerTests
+from unit.generators.MazeCacheTests import MazeCacheTests
 from unit.generators.MazeGeneratorTests import MazeGeneratorTests
+from unit.images.ImageFormatTests import ImageFormatTests
+from unit.maze.BitArrayTests import BitArrayTests
+from unit.maze.DisjointSetTests import DisjointSetTests
+from unit.maze.MazeAnalyzerTests import MazeAnalyzerTests
+from unit.maze.MazeArraysTests import MazeArraysTests
 from unit.maze.MazePositionTests import MazePositionTests
 from unit.maze.MazeTests import MazeTests
 from unit.maze.ThickMazeTests import ThickMazeTests
+from unit.solvers.MazePathIndexTests import MazePathIndexTests
 from unit.solvers.MazeSolverTests import MazeSolverTests
+from unit.solvers.SolutionCacheTests import SolutionCacheTests
 
 if __name__ == '__main__':
     loader = unittest.TestLoader()
 
     test_suite = unittest.TestSuite()
 
+    test_suite.addTests(loader.loadTestsFromTestCase(ActionTests))
+    test_suite.addTests(loader.loadTestsFromTestCase(BatchGenerateActionTests))
+
     test_suite.addTests(loader.loadTestsFromTestCase(FileManagerTests))
 
     test_suite.addTests(loader.loadTestsFromTestCase(MazeGeneratorTests))
+    test_suite.addTests(loader.loadTestsFromTestCase(MazeCacheTests))
 
+    test_suite.addTests(loader.loadTestsFromTestCase(BitArrayTests))
+    test_suite.addTests(loader.loadTestsFromTestCase(DisjointSetTests))
+    test_suite.addTests(loader.loadTestsFromTestCase(MazeAnalyzerTests))
+    test_suite.addTests(loader.loadTestsFromTestCase(MazeArraysTests))
     test_suite.addTests(loader.loadTestsFromTestCase(MazePositionTests))
     test_suite.addTests(loader.loadTestsFromTestCase(MazeTests))
     test_suite.addTests(loader.loadTestsFromTestCase(ThickMazeTests))
 
     test_suite.addTests(loader.loadTestsFromTestCase(MazeSolverTests))
+    test_suite.addTests(loader.loadTestsFromTestCase(MazePathIndexTests))
+    test_suite.addTests(loader.loadTestsFromTestCase(SolutionCacheTests))
+
+    test_suite.addTests(loader.loadTestsFromTestCase(TextMazeDrawerTests))
+    test_suite.addTests(loader.loadTestsFromTestCase(RasterMazeDrawerTests))
+
+    test_suite.addTests(loader.loadTestsFromTestCase(ImageFormatTests))
+
+    test_suite.addTests(loader.loadTestsFromTestCase(BenchmarkTests))
+    test_suite.addTests(loader.loadTestsFromTestCase(ProfilerTests))
 
     testRunner = unittest.runner.TextTestRunner()
     testRunner.run(test_suite)
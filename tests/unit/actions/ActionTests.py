@@ -0,0 +1,41 @@
+import tempfile
+import unittest
+from argparse import ArgumentParser, ArgumentTypeError
+from contextlib import redirect_stderr
+from io import StringIO
+
+from parameterized import parameterized
+
+from src.Maze import MazeConfig
+from src.MazeFileManager import MazeFileManager
+from src.actions.Action import seed
+from src.actions.ExportAction import ExportAction
+from src.formats.MazeFormat import MazeMetadata
+from src.generators.DFSGenerator import DFSGenerator
+
+
+class ActionTests(unittest.TestCase):
+    @parameterized.expand([("binary",), ("tiled",)])
+    def test_seed_boundaries_are_stored_in_maze_file(self, file_format: str):
+        maze = DFSGenerator().generate(MazeConfig(3, 3), 1)
+
+        for value in ["-9223372036854775808", "9223372036854775807"]:
+            filename = tempfile.NamedTemporaryFile().name
+            MazeFileManager.write_into_file(filename, maze, file_format, MazeMetadata("dfs", seed(value)))
+
+            self.assertEqual(MazeFileManager.read_metadata(filename).seed, int(value))
+
+    def test_it_rejects_seed_that_does_not_fit_into_file(self):
+        for value in ["-9223372036854775809", "9223372036854775808", "18446744073709551615"]:
+            with self.assertRaises(ArgumentTypeError):
+                seed(value)
+
+    def test_export_rejects_non_positive_scale(self):
+        parser = ArgumentParser()
+        ExportAction.add_subparser(parser.add_subparsers(dest="action"))
+
+        self.assertEqual(parser.parse_args(["export", "-f", "maze", "-o", "maze.png", "--scale", "1"]).scale, 1)
+
+        for scale in ["0", "-2"]:
+            with self.assertRaises(SystemExit), redirect_stderr(StringIO()):
+                parser.parse_args(["export", "-f", "maze", "-o", "maze.png", "--scale", scale])
@@ -0,0 +1,83 @@
+import os
+import tempfile
+import unittest
+import zipfile
+from argparse import ArgumentParser, Namespace
+from contextlib import redirect_stderr, redirect_stdout
+from io import StringIO
+
+from src.MazeFileManager import MazeFileManager
+from src.actions.BatchGenerateAction import BatchGenerateAction
+from src.actions.GenerateAction import GenerateAction
+
+
+class BatchGenerateActionTests(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    @staticmethod
+    def get_args(output: str, **kwargs) -> Namespace:
+        args = Namespace(count=5, output=output, min_size=2, max_size=6, generators=list(GenerateAction.generators),
+                         format="binary", seed=3, workers=1, max_in_flight=None)
+        vars(args).update(kwargs)
+
+        return args
+
+    @staticmethod
+    def run_action(args: Namespace) -> str:
+        """Runs action and returns what it printed into stdout, progress in stderr is hidden."""
+        output = StringIO()
+
+        with redirect_stdout(output), redirect_stderr(StringIO()):
+            BatchGenerateAction.handle(args)
+
+        return output.getvalue()
+
+    def assert_valid_mazes(self, directory: str, count: int):
+        filenames = sorted(os.listdir(directory))
+        self.assertEqual(len(filenames), count)
+
+        for filename in filenames:
+            maze = MazeFileManager.read_from_file(os.path.join(directory, filename))
+
+            self.assertTrue(maze.is_correct())
+            self.assertTrue(2 <= maze.config.width <= 6 and 2 <= maze.config.height <= 6)
+
+    def test_it_writes_mazes_into_directory(self):
+        output = os.path.join(self.directory.name, "mazes")
+
+        self.run_action(self.get_args(output, max_in_flight=2))
+
+        self.assert_valid_mazes(output, 5)
+
+    def test_it_writes_mazes_into_archive(self):
+        output = os.path.join(self.directory.name, "mazes.zip")
+
+        self.run_action(self.get_args(output, format="json"))
+
+        extracted = os.path.join(self.directory.name, "extracted")
+        with zipfile.ZipFile(output) as archive:
+            archive.extractall(extracted)
+
+        self.assert_valid_mazes(extracted, 5)
+
+    def test_it_rejects_invalid_arguments(self):
+        output = os.path.join(self.directory.name, "mazes")
+
+        self.assertNotEqual(self.run_action(self.get_args(output, min_size=10, max_size=5)), "")
+        self.assertFalse(os.path.exists(output))
+
+        parser = ArgumentParser()
+        BatchGenerateAction.add_subparser(parser.add_subparsers(dest="action"))
+
+        self.assertEqual(parser.parse_args(["batch-generate", "-n", "1", "-o", output]).count, 1)
+
+        for arguments in [["-n", "0"], ["-n", "-1"], ["--min-size", "0"], ["--max-size", "0"], ["--workers", "0"],
+                          ["--max-in-flight", "0"]]:
+            arguments = ["batch-generate", "-o", output] + (["-n", "1"] if "-n" not in arguments else []) + arguments
+
+            with self.assertRaises(SystemExit), redirect_stderr(StringIO()):
+                parser.parse_args(arguments)
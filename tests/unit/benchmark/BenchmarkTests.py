@@ -0,0 +1,38 @@
+import unittest
+from contextlib import redirect_stderr
+from io import StringIO
+
+from src.Benchmark import Benchmark, BenchmarkCase
+from src.Maze import Maze
+
+
+class BenchmarkTests(unittest.TestCase):
+    def test_it_measures_cases_on_all_sizes(self):
+        prepared = []
+        case = BenchmarkCase("create", lambda config: prepared.append(config) or config, Maze)
+
+        with redirect_stderr(StringIO()):
+            results = Benchmark([case], [10, 100], repeat=2).run()
+
+        self.assertEqual([(config.width, config.height) for config in prepared], [(3, 3), (10, 10)])
+        self.assertEqual([(result["case"], result["cells"]) for result in results], [("create", 9), ("create", 100)])
+
+        for result in results:
+            self.assertGreaterEqual(result["seconds"], 0)
+            self.assertGreater(result["peak_memory"], 0)
+
+    def test_it_finds_regressions(self):
+        baseline = [
+            {"case": "a", "cells": 100, "seconds": 1.0},
+            {"case": "b", "cells": 100, "seconds": 1.0},
+        ]
+        results = [
+            {"case": "a", "cells": 100, "seconds": 1.1},
+            {"case": "b", "cells": 100, "seconds": 2.0},
+            {"case": "c", "cells": 100, "seconds": 5.0},
+        ]
+
+        regressions = Benchmark.compare(results, baseline, tolerance=0.25)
+
+        self.assertEqual([regression["case"] for regression in regressions], ["b"])
+        self.assertAlmostEqual(regressions[0]["ratio"], 2.0)
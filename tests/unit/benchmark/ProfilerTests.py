@@ -0,0 +1,32 @@
+import unittest
+
+from src.Profiler import Profiler
+
+
+class ProfilerTests(unittest.TestCase):
+    def test_disabled_profiler_does_not_record_phases(self):
+        profiler = Profiler()
+
+        with profiler.phase("solve"):
+            pass
+
+        self.assertEqual(profiler.phases, dict())
+
+    def test_it_sums_phases_with_the_same_name(self):
+        profiler = Profiler()
+        profiler.start(trace_memory=True)
+
+        with profiler.phase("load"):
+            pass
+        with profiler.phase("solve"):
+            data = bytearray(1 << 20)
+        with profiler.phase("load"):
+            pass
+
+        profiler.stop()
+
+        self.assertEqual(list(profiler.phases), ["load", "solve", "total"])
+        self.assertGreaterEqual(profiler.phases["total"], profiler.phases["load"] + profiler.phases["solve"])
+        self.assertGreaterEqual(profiler.peak_memory, len(data))
+        self.assertFalse(profiler.enabled)
+        self.assertEqual(len(profiler.get_summary()), 5)
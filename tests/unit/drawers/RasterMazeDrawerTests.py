@@ -0,0 +1,40 @@
+import unittest
+
+import numpy as np
+
+from src.Maze import MazeConfig, ThickMaze, ThickMazeCellType
+from src.drawers.RasterMazeDrawer import RasterMazeDrawer
+from src.generators.DFSGenerator import DFSGenerator
+from src.solvers.BFSMazeSolver import BFSMazeSolver
+
+
+class RasterMazeDrawerTests(unittest.TestCase):
+    def setUp(self):
+        self.maze = DFSGenerator().generate(MazeConfig(7, 5), 1)
+
+    def test_it_draws_thick_maze(self):
+        thick_maze = ThickMaze.from_thin_maze(self.maze)
+        rows = list(RasterMazeDrawer().draw_rows(self.maze))
+
+        self.assertEqual(len(rows), thick_maze.config.height)
+
+        for y, row in enumerate(rows):
+            self.assertEqual(list(row), list(thick_maze.get_row(y)))
+
+    def test_it_draws_solution(self):
+        solution = BFSMazeSolver.solve(self.maze)
+        rows = np.array(list(RasterMazeDrawer().draw_rows(self.maze, solution)))
+
+        # path goes through solution cells and passages between them
+        self.assertEqual(np.count_nonzero(rows == ThickMazeCellType.PATH.value), 2 * len(solution) - 1)
+
+        for cell in solution:
+            self.assertEqual(rows[2 * cell.y + 1, 2 * cell.x + 1], ThickMazeCellType.PATH.value)
+
+    def test_it_scales_image(self):
+        drawer = RasterMazeDrawer(3)
+        rows = np.array(list(drawer.draw_rows(self.maze)))
+        original = np.array(list(RasterMazeDrawer().draw_rows(self.maze)))
+
+        self.assertEqual((rows.shape[1], rows.shape[0]), drawer.get_size(self.maze))
+        self.assertTrue(np.array_equal(rows, np.repeat(np.repeat(original, 3, axis=0), 3, axis=1)))
@@ -0,0 +1,58 @@
+import unittest
+
+from colorama import Fore, Style
+
+from src.Maze import MazeConfig
+from src.drawers.TextMazeDrawer import TextMazeDrawer
+from src.generators.DFSGenerator import DFSGenerator
+from src.solvers.BFSMazeSolver import BFSMazeSolver
+
+
+class TextMazeDrawerTests(unittest.TestCase):
+    def setUp(self):
+        self.maze = DFSGenerator().generate(MazeConfig(4, 3), 5)
+
+    def test_it_draws_maze(self):
+        self.assertEqual(TextMazeDrawer().draw(self.maze), [
+            "┌─┬─┐",
+            "├┐╵╷│",
+            "│└─┘│",
+            "└───┘",
+        ])
+
+    def test_it_draws_maze_with_solution(self):
+        rows = TextMazeDrawer().draw(self.maze, BFSMazeSolver.solve(self.maze))
+
+        self.assertEqual([row.replace(Fore.CYAN, "").replace(Style.RESET_ALL, "") for row in rows], [
+            "┌───┬───┐",
+            "│⚑─┐│┌─┐│",
+            "├─┐│╵│╷││",
+            "│ │└─┘│││",
+            "│ └───┘││",
+            "│      ⚑│",
+            "└───────┘",
+        ])
+
+        self.assertTrue(rows[1].startswith("│" + Fore.CYAN + "⚑" + Style.RESET_ALL))
+
+    def test_it_draws_region_of_maze(self):
+        maze = DFSGenerator().generate(MazeConfig(13, 11), 3)
+        solution = BFSMazeSolver.solve(maze)
+
+        drawer = TextMazeDrawer()
+        drawer.band_height = 2
+
+        whole = drawer.draw(maze)
+        whole_with_solution = [row.replace(Fore.CYAN, "").replace(Style.RESET_ALL, "")
+                               for row in drawer.draw(maze, solution)]
+
+        for x0, y0, x1, y1 in [(0, 0, 13, 11), (2, 3, 7, 10), (12, 10, 13, 11), (0, 5, 13, 6)]:
+            region = list(drawer.draw_rows(maze, region=(x0, y0, x1, y1)))
+            self.assertEqual(region, [row[x0:x1 + 1] for row in whole[y0:y1 + 1]])
+
+            region = [row.replace(Fore.CYAN, "").replace(Style.RESET_ALL, "")
+                      for row in drawer.draw_rows(maze, solution, (x0, y0, x1, y1))]
+            self.assertEqual(region, [row[2 * x0:2 * x1 + 1] for row in whole_with_solution[2 * y0:2 * y1 + 1]])
+
+        with self.assertRaises(ValueError):
+            list(drawer.draw_rows(maze, region=(3, 3, 3, 5)))
@@ -1,7 +1,17 @@
+import os
 import tempfile
 import unittest
 
+from parameterized import parameterized
+
+from src.Maze import MazeConfig
 from src.MazeFileManager import MazeFileManager, MazeFileInvalidException
+from src.formats.BinaryMazeFormat import BinaryMazeFormat
+from src.formats.JsonMazeFormat import JsonMazeReader
+from src.formats.TiledMazeFormat import TiledMazeFormat
+from src.formats.MazeFormat import MazeMetadata
+from src.generators.DFSGenerator import DFSGenerator
+from src.solvers.BFSMazeSolver import BFSMazeSolver
 
 
 class FileManagerTests(unittest.TestCase):
@@ -33,3 +43,177 @@ class FileManagerTests(unittest.TestCase):
         second_maze = MazeFileManager.read_from_file(filename)
 
         self.assertEqual(maze, second_maze)
+
+    def test_it_writes_binary_maze(self):
+        maze = MazeFileManager.read_from_file(self.valid_filename)
+
+        filename = tempfile.NamedTemporaryFile(suffix=".mazeb").name
+
+        MazeFileManager.write_into_file(filename, maze, metadata=MazeMetadata("dfs", 42))
+
+        # format is detected by file content
+        self.assertIsInstance(MazeFileManager.get_format_for_reading(filename), BinaryMazeFormat)
+        self.assertEqual(maze, MazeFileManager.read_from_file(filename))
+
+        metadata = MazeFileManager.read_metadata(filename)
+        self.assertEqual(metadata.generator, "dfs")
+        self.assertEqual(metadata.seed, 42)
+
+    def test_it_fails_to_load_truncated_binary_maze(self):
+        maze = MazeFileManager.read_from_file(self.valid_filename)
+
+        filename = tempfile.NamedTemporaryFile().name
+        MazeFileManager.write_into_file(filename, maze, "binary")
+
+        with open(filename, "r+b") as file:
+            file.truncate(30)
+
+        with self.assertRaises(MazeFileInvalidException):
+            MazeFileManager.read_from_file(filename)
+
+    @unittest.skipUnless(os.path.exists("/proc/self/maps"), "mapped files are listed only by Linux")
+    def test_it_closes_invalid_binary_maze_loaded_lazily(self):
+        # maze 3x3 has 12 walls, so 4 bits of the last byte are unused
+        maze = DFSGenerator().generate(MazeConfig(3, 3), 1)
+
+        filename = tempfile.NamedTemporaryFile().name
+        MazeFileManager.write_into_file(filename, maze, "binary")
+
+        with open(filename, "r+b") as file:
+            file.seek(-1, os.SEEK_END)
+            last_byte = file.read(1)[0]
+            file.seek(-1, os.SEEK_END)
+            file.write(bytes([last_byte | 0xF0]))
+
+        try:
+            MazeFileManager.read_from_file(filename, lazy=True)
+            self.fail("Truncated maze was loaded.")
+        except MazeFileInvalidException as error:
+            # exception with its context and traceback is kept, like caller that reports it later does
+            exception = error
+
+        with open("/proc/self/maps") as maps:
+            self.assertNotIn(filename, maps.read())
+
+        self.assertIsInstance(exception, MazeFileInvalidException)
+
+    def test_it_loads_binary_maze_lazily(self):
+        maze = MazeFileManager.read_from_file(self.valid_filename)
+
+        filename = tempfile.NamedTemporaryFile().name
+        MazeFileManager.write_into_file(filename, maze, "binary")
+
+        lazy_maze = MazeFileManager.read_from_file(filename, lazy=True)
+
+        self.assertIsInstance(lazy_maze.walls.data, memoryview)
+        self.assertEqual(maze, lazy_maze)
+        self.assertEqual(BFSMazeSolver.solve(maze), BFSMazeSolver.solve(lazy_maze))
+
+        with self.assertRaises(TypeError):
+            lazy_maze.walls[0] = True
+
+    def test_it_loads_json_maze_when_lazy_loading_is_requested(self):
+        maze = MazeFileManager.read_from_file(self.valid_filename, lazy=True)
+
+        self.assertEqual(maze, MazeFileManager.read_from_file(self.valid_filename))
+
+    def test_it_reads_json_maze_by_small_chunks(self):
+        maze = MazeFileManager.read_from_file(self.valid_filename)
+
+        default_chunk_size = JsonMazeReader.chunk_size
+        JsonMazeReader.chunk_size = 3
+
+        try:
+            self.assertEqual(maze, MazeFileManager.read_from_file(self.valid_filename))
+
+            with self.assertRaises(MazeFileInvalidException):
+                MazeFileManager.read_from_file(self.invalid_filename)
+        finally:
+            JsonMazeReader.chunk_size = default_chunk_size
+
+    @parameterized.expand([(3,), (1 << 16,)])
+    def test_it_fails_to_load_malformed_json_maze(self, chunk_size: int):
+        contents = [
+            '{"width": 2, "height": 1, "walls": [tr ue]}',
+            '{"width": 2, "height": 1, "walls": [fal se]}',
+            '{"width": 2, "height": 1, "walls": [1]}',
+            '{"width": 2, "height": 1, "walls": [true,]}',
+            '{"width": 2, "height": 1, "walls": [true true]}',
+            '{"width": 2, "height": 1, "walls": [true,,]}',
+            '{"width": 2, "height": 1, "walls": [true]} garbage',
+            '{"width": 2, "height": 1, "walls": [true]}}',
+        ]
+
+        default_chunk_size = JsonMazeReader.chunk_size
+        JsonMazeReader.chunk_size = chunk_size
+
+        try:
+            for content in contents:
+                filename = tempfile.NamedTemporaryFile().name
+                with open(filename, "w") as file:
+                    file.write(content)
+
+                with self.assertRaises(MazeFileInvalidException):
+                    MazeFileManager.read_from_file(filename, "json")
+
+            # whitespaces after object are allowed
+            with open(filename, "w") as file:
+                file.write('{"width": 2, "height": 1, "walls": [ true ]}\n ')
+
+            self.assertTrue(MazeFileManager.read_from_file(filename, "json").walls[0])
+        finally:
+            JsonMazeReader.chunk_size = default_chunk_size
+
+    def test_it_writes_json_compatible_with_original_format(self):
+        maze = MazeFileManager.read_from_file(self.valid_filename)
+
+        filename = tempfile.NamedTemporaryFile().name
+        MazeFileManager.write_into_file(filename, maze)
+
+        with open(filename) as written, open(self.valid_filename) as original:
+            self.assertEqual(written.read().strip(), original.read().strip())
+
+    def test_it_raises_when_maze_can_not_be_written(self):
+        maze = MazeFileManager.read_from_file(self.valid_filename)
+
+        with self.assertRaises(OSError):
+            MazeFileManager.write_into_file("files/missing_directory/maze.maze", maze)
+
+    @parameterized.expand(["zlib", "lzma"])
+    def test_it_writes_tiled_maze(self, codec: str):
+        maze = DFSGenerator().generate(MazeConfig(23, 17))
+
+        filename = tempfile.NamedTemporaryFile(suffix=".mazet").name
+        TiledMazeFormat(codec, tile_size=5).write(filename, maze, MazeMetadata("dfs", 7))
+
+        self.assertIsInstance(MazeFileManager.get_format_for_reading(filename), TiledMazeFormat)
+        self.assertEqual(maze, MazeFileManager.read_from_file(filename))
+        self.assertEqual(MazeFileManager.read_metadata(filename).seed, 7)
+
+    def test_it_reads_region_of_tiled_maze(self):
+        maze = DFSGenerator().generate(MazeConfig(23, 17))
+
+        filename = tempfile.NamedTemporaryFile().name
+        TiledMazeFormat(tile_size=4).write(filename, maze, MazeMetadata())
+
+        for region in [(0, 0, 23, 17), (3, 2, 9, 14), (22, 16, 23, 17), (4, 0, 8, 4), (5, 5, 6, 17)]:
+            self.assertEqual(MazeFileManager.read_region(filename, *region), maze.crop(*region))
+
+    @parameterized.expand(list(MazeFileManager.formats.keys()))
+    def test_it_writes_maze_row_by_row(self, file_format: str):
+        maze = DFSGenerator().generate(MazeConfig(19, 11))
+        rows = (maze.get_row_walls(y) for y in range(maze.config.height))
+
+        filename = tempfile.NamedTemporaryFile().name
+        MazeFileManager.write_rows(filename, maze.config, rows, file_format)
+
+        self.assertEqual(maze, MazeFileManager.read_from_file(filename))
+
+        config = MazeFileManager.read_config(filename)
+        self.assertEqual((config.width, config.height), (19, 11))
+
+    def test_it_fails_to_write_incomplete_maze(self):
+        filename = tempfile.NamedTemporaryFile().name
+
+        with self.assertRaises(ValueError):
+            MazeFileManager.write_rows(filename, MazeConfig(5, 5), [0, 0])
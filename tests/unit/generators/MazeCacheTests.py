@@ -0,0 +1,69 @@
+import os
+import tempfile
+import unittest
+
+from src.DiskCache import DiskCache
+from src.Maze import MazeConfig
+from src.MazeCache import MazeCache
+from src.generators.DFSGenerator import DFSGenerator
+from src.generators.MazeGenerator import MazeGenerator
+
+
+class CountingGenerator(MazeGenerator):
+    """Generator that counts how many times it was called."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def generate(self, config, seed=None):
+        self.calls += 1
+        return DFSGenerator().generate(config, seed)
+
+
+class MazeCacheTests(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.config = MazeConfig(10, 15)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_it_generates_maze_only_once(self):
+        generator = CountingGenerator()
+        cache = MazeCache(self.directory.name)
+
+        first = cache.get_or_generate("dfs", generator, self.config, 42)
+        second = cache.get_or_generate("dfs", generator, self.config, 42)
+
+        self.assertEqual(generator.calls, 1)
+        self.assertEqual(first, DFSGenerator().generate(self.config, 42))
+        self.assertEqual(first, second)
+
+    def test_it_reads_maze_stored_by_another_instance(self):
+        generator = CountingGenerator()
+
+        maze = MazeCache(self.directory.name).get_or_generate("dfs", generator, self.config, 1)
+
+        self.assertEqual(MazeCache(self.directory.name).get("dfs", self.config, 1), maze)
+        self.assertIsNone(MazeCache(self.directory.name).get("dfs", self.config, 2))
+        self.assertIsNone(MazeCache(self.directory.name).get("tree", self.config, 1))
+
+    def test_disk_cache_evicts_least_recently_used_files(self):
+        cache = DiskCache(self.directory.name, max_size=25)
+
+        def write(content: bytes):
+            def writer(path: str):
+                with open(path, "wb") as file:
+                    file.write(content)
+
+            return writer
+
+        first = cache.store("first", write(b"1" * 10))
+        os.utime(first, (0, 0))
+
+        cache.store("second", write(b"2" * 10))
+        cache.store("third", write(b"3" * 10))
+
+        self.assertIsNone(cache.get("first"))
+        self.assertIsNotNone(cache.get("second"))
+        self.assertIsNotNone(cache.get("third"))
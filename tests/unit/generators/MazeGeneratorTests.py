@@ -3,12 +3,17 @@ import unittest
 from parameterized import parameterized
 
 from src.Maze import MazeConfig
+from src.MazeMetrics import MazeMetrics
 from src.generators.DFSGenerator import DFSGenerator
+from src.generators.EllerGenerator import EllerGenerator
+from src.generators.KruskalGenerator import KruskalGenerator
 from src.generators.MazeGenerator import MazeGenerator
+from src.generators.ParallelGenerator import ParallelGenerator
 from src.generators.SpanningTreeGenerator import SpanningTreeGenerator
 from src.solvers.BFSMazeSolver import BFSMazeSolver, UnsolvableMazeException
 
-generators_for_testing = [DFSGenerator(), SpanningTreeGenerator()]
+generators_for_testing = [DFSGenerator(), SpanningTreeGenerator(), KruskalGenerator(), EllerGenerator()]
+tiled_generators_for_testing = [ParallelGenerator(generator, workers=2, tile_size=4) for generator in generators_for_testing]
 
 
 class MazeGeneratorTests(unittest.TestCase):
@@ -32,3 +37,53 @@ class MazeGeneratorTests(unittest.TestCase):
                 BFSMazeSolver.solve(maze)
             except UnsolvableMazeException:
                 self.fail("Maze generated by generator doesn't have any solution.")
+
+    @parameterized.expand(generators_for_testing)
+    def test_generated_maze_is_perfect(self, generator: MazeGenerator):
+        maze = generator.generate(self.config)
+
+        # connected maze without loops is a spanning tree, so exactly cells - 1 walls are removed
+        self.assertEqual(maze.walls.count(False), maze.get_cells_count() - 1)
+
+    @parameterized.expand(tiled_generators_for_testing)
+    def test_tiled_generation_produces_perfect_maze(self, generator: MazeGenerator):
+        maze = generator.generate(self.config)
+
+        self.assertTrue(maze.is_correct())
+        self.assertEqual(maze.walls.count(False), maze.get_cells_count() - 1)
+
+        try:
+            BFSMazeSolver.solve(maze)
+        except UnsolvableMazeException:
+            self.fail("Maze generated by tiled generator doesn't have any solution.")
+
+    def test_tiled_generator_rejects_invalid_parameters(self):
+        with self.assertRaises(ValueError):
+            ParallelGenerator(DFSGenerator(), workers=0)
+
+        with self.assertRaises(ValueError):
+            ParallelGenerator(DFSGenerator(), workers=2, tile_size=0)
+
+    @parameterized.expand(generators_for_testing + tiled_generators_for_testing)
+    def test_generation_with_seed_is_reproducible(self, generator: MazeGenerator):
+        self.assertEqual(generator.generate(self.config, 7), generator.generate(self.config, 7))
+        self.assertNotEqual(generator.generate(self.config, 7), generator.generate(self.config, 8))
+
+    @parameterized.expand(generators_for_testing + tiled_generators_for_testing)
+    def test_it_reports_metrics(self, generator: MazeGenerator):
+        metrics = MazeMetrics()
+
+        maze = generator.generate(self.config, 7, metrics)
+
+        # metrics don't change generated maze
+        self.assertEqual(maze, generator.generate(self.config, 7))
+        self.assertEqual(metrics.counters["generate.cells"], maze.get_cells_count())
+        self.assertEqual(metrics.counters["generate.walls_removed"], maze.get_cells_count() - 1)
+
+    def test_dfs_reports_peak_stack(self):
+        metrics = MazeMetrics()
+
+        DFSGenerator().generate(MazeConfig(1, 5), 7, metrics)
+
+        self.assertEqual(metrics.counters["generate.cells_visited"], 5)
+        self.assertEqual(metrics.counters["generate.peak_stack"], 5)
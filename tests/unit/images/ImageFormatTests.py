@@ -0,0 +1,74 @@
+import struct
+import tempfile
+import unittest
+import zlib
+
+import numpy as np
+
+from src.images.PbmImageFormat import PbmImageFormat
+from src.images.PngImageFormat import PngImageFormat
+
+palette = [(255, 255, 255), (0, 0, 0), (0, 170, 255)]
+
+
+class ImageFormatTests(unittest.TestCase):
+    def setUp(self):
+        self.pixels = np.random.default_rng(0).integers(0, 3, (13, 21), dtype=np.uint8)
+
+    @staticmethod
+    def read_png(filename: str) -> tuple[dict[bytes, bytes], bytes]:
+        """Returns data of all chunks except IDAT and decompressed image data."""
+        with open(filename, "rb") as file:
+            content = file.read()
+
+        chunks = dict()
+        image_data = b""
+        position = len(PngImageFormat.signature)
+
+        while position < len(content):
+            length, = struct.unpack(">I", content[position:position + 4])
+            chunk_type = content[position + 4:position + 8]
+            data = content[position + 8:position + 8 + length]
+
+            crc, = struct.unpack(">I", content[position + 8 + length:position + 12 + length])
+            assert crc == zlib.crc32(chunk_type + data)
+
+            if chunk_type == b"IDAT":
+                image_data += data
+            else:
+                chunks[chunk_type] = data
+
+            position += 12 + length
+
+        return chunks, zlib.decompress(image_data)
+
+    def test_it_writes_png(self):
+        filename = tempfile.NamedTemporaryFile(suffix=".png").name
+
+        image_format = PngImageFormat()
+        image_format.chunk_size = 16
+        image_format.write(filename, 21, 13, iter(self.pixels), palette)
+
+        chunks, data = self.read_png(filename)
+        width, height, bit_depth, color_type, _, _, _ = struct.unpack(">IIBBBBB", chunks[b"IHDR"])
+
+        self.assertEqual((width, height, bit_depth, color_type), (21, 13, 2, 3))
+        self.assertEqual(chunks[b"PLTE"], bytes([255, 255, 255, 0, 0, 0, 0, 170, 255]))
+
+        # each row is filter type and 21 pixels packed by 4 into 6 bytes
+        rows = np.frombuffer(data, dtype=np.uint8).reshape(13, 7)
+        self.assertTrue(np.all(rows[:, 0] == 0))
+
+        pixels = np.stack([(rows[:, 1:] >> shift) & 3 for shift in [6, 4, 2, 0]], axis=2).reshape(13, 24)
+        self.assertTrue(np.array_equal(pixels[:, :21], self.pixels))
+
+    def test_it_writes_pbm(self):
+        filename = tempfile.NamedTemporaryFile(suffix=".pbm").name
+        PbmImageFormat().write(filename, 21, 13, iter(self.pixels), palette)
+
+        with open(filename, "rb") as file:
+            self.assertEqual(file.readline(), b"P4\n")
+            self.assertEqual(file.readline(), b"21 13\n")
+            data = np.frombuffer(file.read(), dtype=np.uint8).reshape(13, 3)
+
+        self.assertTrue(np.array_equal(np.unpackbits(data, axis=1)[:, :21], self.pixels == 1))
@@ -0,0 +1,58 @@
+import copy
+import unittest
+
+from src.BitArray import BitArray
+
+
+class BitArrayTests(unittest.TestCase):
+    def test_it_initializes_with_value(self):
+        self.assertEqual(list(BitArray(10, True)), [True] * 10)
+        self.assertEqual(list(BitArray(10, False)), [False] * 10)
+
+        # padding bits must be zero, so arrays are comparable byte by byte
+        self.assertEqual(BitArray(10, True).to_bytes(), b"\xff\x03")
+
+    def test_it_reads_and_writes_single_bits(self):
+        bits = BitArray(20)
+
+        bits[3] = True
+        bits[-1] = True
+
+        self.assertTrue(bits[3])
+        self.assertTrue(bits[19])
+        self.assertFalse(bits[4])
+
+        bits[3] = False
+        self.assertFalse(bits[3])
+
+        with self.assertRaises(IndexError):
+            bits[20] = True
+
+    def test_it_converts_from_bools(self):
+        values = [True, False, False, True, True, False, True, False, True, True]
+        bits = BitArray.from_bools(values)
+
+        self.assertEqual(len(bits), len(values))
+        self.assertEqual(list(bits), values)
+        self.assertEqual(bits, values)
+
+    def test_it_reads_and_writes_bit_ranges(self):
+        bits = BitArray(40)
+
+        bits.set_bits(5, 12, 0b101100111011)
+
+        self.assertEqual(bits.get_bits(5, 12), 0b101100111011)
+        self.assertEqual(bits.get_bits(0, 5), 0)
+        self.assertEqual(bits.get_bits(17, 23), 0)
+        self.assertEqual(bits.count(), 8)
+
+    def test_it_compares_and_copies(self):
+        bits = BitArray(13, True)
+        bits_copy = copy.deepcopy(bits)
+
+        self.assertEqual(bits, bits_copy)
+
+        bits_copy[12] = False
+
+        self.assertNotEqual(bits, bits_copy)
+        self.assertNotEqual(BitArray(13), BitArray(14))
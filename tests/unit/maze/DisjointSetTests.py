@@ -0,0 +1,26 @@
+import unittest
+
+from src.DisjointSet import DisjointSet
+
+
+class DisjointSetTests(unittest.TestCase):
+    def test_it_merges_sets(self):
+        sets = DisjointSet(6)
+
+        self.assertFalse(sets.is_same_set(0, 1))
+
+        self.assertTrue(sets.union(0, 1))
+        self.assertTrue(sets.union(2, 3))
+        self.assertTrue(sets.union(1, 3))
+
+        self.assertTrue(sets.is_same_set(0, 2))
+        self.assertFalse(sets.is_same_set(0, 4))
+
+    def test_it_does_not_merge_same_set_twice(self):
+        sets = DisjointSet(3)
+
+        sets.union(0, 1)
+        sets.union(1, 2)
+
+        self.assertFalse(sets.union(0, 2))
+        self.assertEqual(sets.sizes[sets.find(0)], 3)
@@ -0,0 +1,55 @@
+import unittest
+
+from parameterized import parameterized
+
+from src.Maze import MazeConfig, MazePosition
+from src.MazeAnalyzer import MazeAnalyzer
+from src.generators.DFSGenerator import DFSGenerator
+from src.generators.KruskalGenerator import KruskalGenerator
+from src.solvers.BFSMazeSolver import BFSMazeSolver
+
+
+class MazeAnalyzerTests(unittest.TestCase):
+    def setUp(self):
+        self.config = MazeConfig(9, 7)
+
+    @parameterized.expand([(DFSGenerator(),), (KruskalGenerator(),)])
+    def test_it_computes_metrics_of_perfect_maze(self, generator):
+        for seed in range(5):
+            maze = generator.generate(self.config, seed)
+            analyzer = MazeAnalyzer(maze)
+            metrics = analyzer.analyze()
+
+            cells = [MazePosition(x, y) for y in range(self.config.height) for x in range(self.config.width)]
+            diameter = max(int(analyzer.get_distances(cell).max()) for cell in cells)
+
+            self.assertTrue(metrics["is_perfect"])
+            self.assertEqual(metrics["diameter"], diameter)
+            self.assertEqual(metrics["solution_length"], len(BFSMazeSolver.solve(maze)) - 1)
+
+            first, second = metrics["diameter_endpoints"]
+            self.assertEqual(len(BFSMazeSolver.solve(maze, MazePosition(*first), MazePosition(*second))) - 1, diameter)
+
+            corridor_cells = sum(int(length) * count for length, count in metrics["corridor_lengths"].items())
+            self.assertEqual(corridor_cells, metrics["degree_histogram"]["2"])
+            self.assertEqual(sum(metrics["degree_histogram"].values()), metrics["cells"])
+
+    def test_it_computes_distances(self):
+        maze = DFSGenerator().generate(self.config, 1)
+        distances = MazeAnalyzer(maze).get_distances(MazePosition(3, 4))
+
+        for y in range(self.config.height):
+            for x in range(self.config.width):
+                path = BFSMazeSolver.solve(maze, MazePosition(3, 4), MazePosition(x, y))
+                self.assertEqual(distances[y, x], len(path) - 1)
+
+    def test_it_detects_unreachable_cells(self):
+        maze = DFSGenerator().generate(self.config, 2)
+        maze.walls.fill(True)
+
+        metrics = MazeAnalyzer(maze).analyze()
+
+        self.assertFalse(metrics["is_perfect"])
+        self.assertEqual(metrics["reachable_cells"], 1)
+        self.assertIsNone(metrics["solution_length"])
+        self.assertEqual(metrics["dead_ends"], 0)
@@ -0,0 +1,42 @@
+import unittest
+
+from src.Maze import MazeConfig, MazePosition, Direction
+from src.MazeArrays import MazeArrays
+from src.generators.DFSGenerator import DFSGenerator
+
+
+class MazeArraysTests(unittest.TestCase):
+    def setUp(self):
+        self.config = MazeConfig(10, 15)
+        self.maze = DFSGenerator().generate(self.config)
+        self.arrays = MazeArrays.from_maze(self.maze)
+
+    def test_it_copies_walls_layout(self):
+        for x in range(self.config.width):
+            for y in range(self.config.height):
+                position = MazePosition(x, y)
+
+                self.assertEqual(self.arrays.right[y, x], self.maze.has_wall(position, Direction.RIGHT))
+                self.assertEqual(self.arrays.down[y, x], self.maze.has_wall(position, Direction.DOWN))
+
+    def test_it_converts_back_to_maze(self):
+        self.assertEqual(self.arrays.to_maze(), self.maze)
+
+    def test_it_calculates_passage_mask_and_degree(self):
+        mask = self.arrays.passage_mask()
+        degree = self.arrays.degree()
+
+        for x in range(self.config.width):
+            for y in range(self.config.height):
+                expected_mask = 0
+
+                for direction in Direction:
+                    if not self.maze.has_wall(MazePosition(x, y), direction):
+                        expected_mask |= 1 << Direction.index_by_value(direction.value)
+
+                self.assertEqual(mask[y, x], expected_mask)
+                self.assertEqual(degree[y, x], expected_mask.bit_count())
+
+    def test_perfect_maze_has_tree_degree_sum(self):
+        # spanning tree with n vertices has n - 1 edges
+        self.assertEqual(int(self.arrays.degree().sum()), 2 * (self.maze.get_cells_count() - 1))
@@ -69,4 +69,29 @@ class MazeTests(unittest.TestCase):
 
         maze_copy.walls[0] = not maze_copy.walls[0]
 
-        self.assertNotEqual(maze_copy, self.maze)
\ No newline at end of file
+        self.assertNotEqual(maze_copy, self.maze)
+
+    def test_it_crops_maze(self):
+        for index in range(0, self.maze.get_walls_count(), 3):
+            self.maze.walls[index] = False
+
+        region = self.maze.crop(2, 3, 7, 12)
+
+        self.assertEqual(region.config.width, 5)
+        self.assertEqual(region.config.height, 9)
+
+        for x in range(region.config.width):
+            for y in range(region.config.height):
+                position = MazePosition(x, y)
+                maze_position = MazePosition(x + 2, y + 3)
+
+                if x != region.config.width - 1:
+                    self.assertEqual(region.has_wall(position, Direction.RIGHT),
+                                     self.maze.has_wall(maze_position, Direction.RIGHT))
+
+                if y != region.config.height - 1:
+                    self.assertEqual(region.has_wall(position, Direction.DOWN),
+                                     self.maze.has_wall(maze_position, Direction.DOWN))
+
+        with self.assertRaises(ValueError):
+            self.maze.crop(5, 5, 5, 6)
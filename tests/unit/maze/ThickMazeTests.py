@@ -15,11 +15,31 @@ class ThickMazeTests(unittest.TestCase):
         self.assertEqual(self.thick_maze.config.height, self.maze.config.height * 2 + 1)
 
     def test_it_copy_walls_layout(self):
-        self.assertEqual(self.thick_maze.maze[1][2], ThickMazeCellType.WALL)
+        self.assertEqual(self.thick_maze.get_cell(1, 2), ThickMazeCellType.WALL)
 
         maze = Maze(self.maze_config)
         maze.walls[maze.get_wall_index(MazePosition(0, 0), Direction.DOWN)] = False
 
         thick_maze = ThickMaze.from_thin_maze(maze)
 
-        self.assertEqual(thick_maze.maze[1][2], ThickMazeCellType.EMPTY)
+        self.assertEqual(thick_maze.get_cell(1, 2), ThickMazeCellType.EMPTY)
+
+    def test_it_builds_rows_from_walls(self):
+        maze = Maze(MazeConfig(3, 2))
+        maze.walls[maze.get_wall_index(MazePosition(0, 0), Direction.RIGHT)] = False
+        maze.walls[maze.get_wall_index(MazePosition(2, 0), Direction.DOWN)] = False
+
+        thick_maze = ThickMaze.from_thin_maze(maze)
+        rows = [[thick_maze.get_cell(x, y) == ThickMazeCellType.WALL for x in range(7)] for y in range(5)]
+
+        self.assertEqual(rows, [
+            [True, True, True, True, True, True, True],
+            [True, False, False, False, True, False, True],
+            [True, True, True, True, True, False, True],
+            [True, False, True, False, True, False, True],
+            [True, True, True, True, True, True, True],
+        ])
+
+        thick_maze.set_cell(1, 1, ThickMazeCellType.PATH)
+        self.assertEqual(thick_maze.get_cell(1, 1), ThickMazeCellType.PATH)
+        self.assertEqual(thick_maze.get_row(1)[:3], bytes([1, 2, 0]))
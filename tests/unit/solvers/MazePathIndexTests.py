@@ -0,0 +1,78 @@
+import random
+import unittest
+
+import numpy as np
+
+from src.Maze import MazeConfig, MazePosition
+from src.generators.DFSGenerator import DFSGenerator
+from src.generators.KruskalGenerator import KruskalGenerator
+from src.solvers.BFSMazeSolver import BFSMazeSolver
+from src.solvers.MazePathIndex import MazePathIndex, NotPerfectMazeException
+
+
+class MazePathIndexTests(unittest.TestCase):
+    def setUp(self):
+        self.config = MazeConfig(10, 15)
+        self.random = random.Random(0)
+
+    def get_random_cell(self) -> MazePosition:
+        return MazePosition(self.random.randrange(self.config.width), self.random.randrange(self.config.height))
+
+    def test_paths_are_equal_to_bfs_solutions(self):
+        for seed in range(10):
+            maze = KruskalGenerator().generate(self.config, seed)
+            index = MazePathIndex(maze)
+
+            for _ in range(20):
+                begin, end = self.get_random_cell(), self.get_random_cell()
+                solution = BFSMazeSolver.solve(maze, begin, end)
+
+                self.assertEqual(index.get_path(begin, end), solution)
+                self.assertEqual(index.get_distance(begin, end), len(solution) - 1)
+
+    def test_it_answers_bulk_queries(self):
+        maze = DFSGenerator().generate(self.config, 1)
+        index = MazePathIndex(maze)
+
+        pairs = [(self.get_random_cell(), self.get_random_cell()) for _ in range(100)]
+        width = self.config.width
+
+        distances = index.get_distances(
+            [begin.x + begin.y * width for begin, _ in pairs],
+            [end.x + end.y * width for _, end in pairs]
+        )
+
+        self.assertEqual(list(distances), [index.get_distance(begin, end) for begin, end in pairs])
+
+    def test_it_rejects_cells_outside_maze(self):
+        index = MazePathIndex(DFSGenerator().generate(MazeConfig(10, 15), 1))
+
+        for position in [MazePosition(-1, 0), MazePosition(0, -1), MazePosition(10, 0), MazePosition(0, 15)]:
+            with self.assertRaises(ValueError):
+                index.get_distance(MazePosition(0, 0), position)
+
+            with self.assertRaises(ValueError):
+                index.get_path(position, MazePosition(0, 0))
+
+        for cells in [[-1], [150], [0, 149, 150]]:
+            with self.assertRaises(ValueError):
+                index.get_distances(np.zeros(len(cells), dtype=np.int64), np.array(cells))
+
+        self.assertEqual(index.get_distances(np.array([], dtype=np.int64), np.array([], dtype=np.int64)).size, 0)
+
+    def test_it_raise_exception_when_maze_is_not_perfect(self):
+        maze = DFSGenerator().generate(self.config, 2)
+        walls = [index for index, wall in enumerate(maze.walls) if wall]
+        passages = [index for index, wall in enumerate(maze.walls) if not wall]
+
+        # maze with a loop
+        maze.walls[walls[0]] = False
+
+        with self.assertRaises(NotPerfectMazeException):
+            MazePathIndex(maze)
+
+        # maze with a loop and unreachable cells has the same count of passages as perfect maze
+        maze.walls[passages[0]] = True
+
+        with self.assertRaises(NotPerfectMazeException):
+            MazePathIndex(maze)
@@ -1,20 +1,32 @@
+import random
 import unittest
 
-from src.Maze import MazeConfig, MazePosition, Direction
+from parameterized import parameterized
+
+from src.Maze import MazeConfig, MazePosition, Direction, Maze
+from src.MazeMetrics import MazeMetrics
 from src.generators.DFSGenerator import DFSGenerator
+from src.generators.KruskalGenerator import KruskalGenerator
+from src.solvers.AStarMazeSolver import AStarMazeSolver
 from src.solvers.BFSMazeSolver import BFSMazeSolver, UnsolvableMazeException
+from src.solvers.BidirectionalBFSMazeSolver import BidirectionalBFSMazeSolver
+from src.solvers.DeadEndFillingMazeSolver import DeadEndFillingMazeSolver
+from src.solvers.MazeSolver import MazeSolver
+
+solvers_for_testing = [BFSMazeSolver(), AStarMazeSolver(), BidirectionalBFSMazeSolver(), DeadEndFillingMazeSolver()]
 
 
 class MazeSolverTests(unittest.TestCase):
     def setUp(self):
         self.config = MazeConfig(10, 15)
 
-    def test_solution_is_correct(self):
+    @parameterized.expand(solvers_for_testing)
+    def test_solution_is_correct(self, solver: MazeSolver):
         # we generate and solve many mazes
 
         for i in range(100):
             maze = DFSGenerator().generate(self.config)
-            solution = BFSMazeSolver.solve(maze)[::-1]
+            solution = solver.solve(maze)[::-1]
 
             self.assertEqual(solution[0], MazePosition(0, 0))
             self.assertEqual(solution[-1], MazePosition(self.config.width - 1, self.config.height - 1))
@@ -38,7 +50,8 @@ class MazeSolverTests(unittest.TestCase):
 
                 visited.add(cell)
 
-    def test_it_raise_exception_when_maze_is_unsolvable(self):
+    @parameterized.expand(solvers_for_testing)
+    def test_it_raise_exception_when_maze_is_unsolvable(self, solver: MazeSolver):
         unsolvable = DFSGenerator().generate(self.config)
         corner = MazePosition(self.config.width - 1, self.config.height - 1)
 
@@ -46,4 +59,65 @@ class MazeSolverTests(unittest.TestCase):
         unsolvable.walls[unsolvable.get_wall_index(corner, Direction.UP)] = True
 
         with self.assertRaises(UnsolvableMazeException):
-            BFSMazeSolver.solve(unsolvable)
+            solver.solve(unsolvable)
+
+    @parameterized.expand(solvers_for_testing)
+    def test_it_solves_maze_between_given_cells(self, solver: MazeSolver):
+        maze = DFSGenerator().generate(self.config, 1)
+        begin, end = MazePosition(3, 7), MazePosition(8, 2)
+
+        solution = solver.solve(maze, begin, end)
+
+        self.assertEqual(solution, BFSMazeSolver.solve(maze, begin, end))
+        self.assertEqual(solution[0], end)
+        self.assertEqual(solution[-1], begin)
+        self.assertEqual(solver.solve(maze, end, begin), solution[::-1])
+
+        self.assertEqual(solver.solve(DFSGenerator().generate(MazeConfig(1, 1))), [MazePosition(0, 0)])
+
+        with self.assertRaises(ValueError):
+            solver.solve(maze, MazePosition(0, 0), MazePosition(10, 0))
+
+    @parameterized.expand(solvers_for_testing)
+    def test_it_finds_shortest_path_in_maze_with_loops(self, solver: MazeSolver):
+        random_generator = random.Random(0)
+
+        for seed in range(20):
+            maze = KruskalGenerator().generate(self.config, seed)
+
+            for index in range(maze.get_walls_count()):
+                if random_generator.random() < 0.3:
+                    maze.walls[index] = False
+
+            solution = solver.solve(maze)
+
+            self.assertEqual(len(solution), len(BFSMazeSolver.solve(maze)))
+
+            for cell, next_cell in zip(solution, solution[1:]):
+                self.assertFalse(maze.has_wall(cell, Direction(next_cell - cell)))
+
+    def test_bfs_reports_metrics(self):
+        # maze without walls: cells at distance d form layer of d + 1 cells
+        maze = Maze(MazeConfig(4, 4))
+        maze.walls.fill(False)
+        metrics = MazeMetrics()
+
+        solution = BFSMazeSolver.solve(maze, metrics=metrics)
+
+        self.assertEqual(len(solution), 7)
+        self.assertEqual(metrics.to_dict(), {
+            "solve.cells_visited": 16,
+            "solve.layers": 6,
+            "solve.peak_frontier": 4,
+        })
+
+    def test_bfs_reports_peak_size_of_queue(self):
+        # from the center of open maze 5x5: while layer of 8 cells at distance 2 is taken from queue,
+        # queue holds its rest and the next layer, so its peak size is greater than size of any layer
+        maze = Maze(MazeConfig(5, 5))
+        maze.walls.fill(False)
+        metrics = MazeMetrics()
+
+        BFSMazeSolver.solve(maze, MazePosition(2, 2), MazePosition(0, 0), metrics)
+
+        self.assertEqual(metrics.counters["solve.peak_frontier"], 9)
@@ -0,0 +1,85 @@
+import os
+import tempfile
+import unittest
+
+from src.Maze import MazeConfig, MazePosition
+from src.MazeFileManager import MazeFileManager
+from src.SolutionCache import SolutionCache
+from src.generators.DFSGenerator import DFSGenerator
+from src.solvers.BFSMazeSolver import BFSMazeSolver
+
+
+class SolutionCacheTests(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.config = MazeConfig(10, 15)
+        self.begin = MazePosition(0, 0)
+        self.end = MazePosition(9, 14)
+        self.calls = 0
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def solve(self, maze):
+        self.calls += 1
+        return BFSMazeSolver.solve(maze, self.begin, self.end)
+
+    def test_it_solves_maze_only_once(self):
+        maze = DFSGenerator().generate(self.config, 1)
+        cache = SolutionCache(os.path.join(self.directory.name, "solutions"))
+
+        first = cache.get_or_solve(maze, "bfs", self.begin, self.end, lambda: self.solve(maze))
+        second = cache.get_or_solve(maze, "bfs", self.begin, self.end, lambda: self.solve(maze))
+
+        self.assertEqual(self.calls, 1)
+        self.assertEqual(first, BFSMazeSolver.solve(maze))
+        self.assertEqual(first, second)
+
+    def test_it_uses_maze_content_as_key(self):
+        maze = DFSGenerator().generate(self.config, 2)
+        cache = SolutionCache(os.path.join(self.directory.name, "solutions"))
+        cache.get_or_solve(maze, "bfs", self.begin, self.end, lambda: self.solve(maze))
+
+        # the same maze read from file has the same solution
+        filename = os.path.join(self.directory.name, "maze.mazeb")
+        MazeFileManager.write_into_file(filename, maze)
+        stored = MazeFileManager.read_from_file(filename, lazy=True)
+
+        self.assertEqual(stored.get_content_hash(), maze.get_content_hash())
+        self.assertEqual(cache.get(stored, "bfs", self.begin, self.end), BFSMazeSolver.solve(maze))
+
+        self.assertIsNone(cache.get(maze, "astar", self.begin, self.end))
+        self.assertIsNone(cache.get(maze, "bfs", self.end, self.begin))
+
+        changed = DFSGenerator().generate(self.config, 2)
+        changed.walls[0] = not changed.walls[0]
+        self.assertIsNone(cache.get(changed, "bfs", self.begin, self.end))
+
+    def test_it_solves_maze_again_when_cached_solution_is_corrupted(self):
+        maze = DFSGenerator().generate(self.config, 3)
+        cache = SolutionCache(os.path.join(self.directory.name, "solutions"))
+        key = SolutionCache.get_key(maze, "bfs", self.begin, self.end)
+        expected = BFSMazeSolver.solve(maze)
+
+        corruptions = [
+            lambda content: content[:-3],  # truncated file
+            lambda content: b"",
+            lambda content: (1 << 40).to_bytes(8, "little") + content[8:],  # cell outside maze
+            lambda content: content[8:],  # path doesn't end in requested cell
+        ]
+
+        for corrupt in corruptions:
+            cache.get_or_solve(maze, "bfs", self.begin, self.end, lambda: self.solve(maze))
+            path = cache.disk.get_path(key)
+
+            with open(path, "rb") as file:
+                content = file.read()
+            with open(path, "wb") as file:
+                file.write(corrupt(content))
+
+            self.assertIsNone(cache.get(maze, "bfs", self.begin, self.end))
+            self.assertFalse(os.path.exists(path))
+
+            calls = self.calls
+            self.assertEqual(cache.get_or_solve(maze, "bfs", self.begin, self.end, lambda: self.solve(maze)), expected)
+            self.assertEqual(self.calls, calls + 1)